@@ -0,0 +1,335 @@
+import json
+import os
+import platform
+import shlex
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+if __package__:
+    from Backend.FuzzyIndex import FuzzyIndex, normalize
+else:
+    from FuzzyIndex import FuzzyIndex, normalize  # running this file directly from Backend/
+
+# ============ CONFIG ============
+INDEX_FILE = os.path.join("Data", "AppIndex.json")
+WEB_CACHE_FILE = os.path.join("Data", "AppWebCache.json")
+CHECK_INTERVAL = 30.0   # seconds between mtime checks of the install directories
+MIN_SCORE = 0.65
+INDEX_VERSION = 1
+
+# Never launched or killed by voice, whatever the match: a near miss must not
+# shut the machine down. Checked against entry names and executable names.
+PROTECTED = {
+    "shutdown", "shut down", "poweroff", "power off", "reboot", "restart", "halt", "suspend", "hibernate",
+    "logoff", "logout", "log out", "init", "telinit", "systemctl", "loginctl",
+    "kill", "pkill", "killall", "taskkill", "rm", "dd", "mkfs", "shred", "format", "sudo", "su", "doas",
+}
+
+SYSTEM = platform.system()
+
+def _desktop_dirs() -> List[str]:
+    home = os.path.expanduser("~")
+    data_home = os.environ.get("XDG_DATA_HOME", os.path.join(home, ".local", "share"))
+    data_dirs = os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share").split(":")
+    dirs = [data_home, *data_dirs,
+            "/var/lib/flatpak/exports/share", os.path.join(data_home, "flatpak", "exports", "share")]
+    return [os.path.join(d, "applications") for d in dirs] + ["/var/lib/snapd/desktop/applications"]
+
+def _start_menu_dirs() -> List[str]:
+    return [
+        os.path.join(os.environ.get("ProgramData", r"C:\ProgramData"), r"Microsoft\Windows\Start Menu\Programs"),
+        os.path.join(os.environ.get("APPDATA", ""), r"Microsoft\Windows\Start Menu\Programs"),
+    ]
+
+def _path_dirs() -> List[str]:
+    return [d for d in os.environ.get("PATH", "").split(os.pathsep) if d]
+
+# ============ ENTRIES ============
+@dataclass
+class AppEntry:
+    name: str
+    command: List[str]   # argv to launch; for shortcuts/bundles the file to open
+    kind: str            # desktop / path / shortcut / bundle
+    executable: str      # process name used by close()
+
+def _protected(entry: "AppEntry") -> bool:
+    return normalize(entry.name) in PROTECTED or os.path.splitext(entry.executable)[0].lower() in PROTECTED
+
+# Desktop Entry field codes (%f, %U, ...) are placeholders for files/URLs
+_FIELD_CODES = {"%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%i", "%c", "%k", "%v", "%m"}
+
+def parse_desktop_file(path: str) -> Optional[AppEntry]:
+    fields, in_entry = {}, False
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    if in_entry:
+                        break  # only the main group; skip [Desktop Action ...]
+                    in_entry = line == "[Desktop Entry]"
+                elif in_entry and "=" in line:
+                    key, value = line.split("=", 1)
+                    fields.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
+    if fields.get("Type", "Application") != "Application" or fields.get("NoDisplay") == "true" \
+            or fields.get("Hidden") == "true" or not fields.get("Name") or not fields.get("Exec"):
+        return None
+    try:
+        argv = [a for a in shlex.split(fields["Exec"]) if a not in _FIELD_CODES]
+    except ValueError:
+        return None
+    if not argv:
+        return None
+    return AppEntry(fields["Name"], argv, "desktop", _process_name(argv))
+
+def _process_name(argv: List[str]) -> str:
+    """Process name for an Exec line, looking past an `env VAR=value ...` wrapper."""
+    if os.path.basename(argv[0]) == "env":
+        rest = [a for a in argv[1:] if "=" not in a and not a.startswith("-")]
+        if rest:
+            return os.path.basename(rest[0])
+    return os.path.basename(argv[0])
+
+def _flatpak_app_id(argv: List[str]) -> Optional[str]:
+    """App id from `flatpak run [--opt=...] <app-id> ...`, or None for other commands."""
+    if os.path.basename(argv[0]) != "flatpak" or "run" not in argv:
+        return None
+    for arg in argv[argv.index("run") + 1:]:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+def _scan_dir(directory: str, kind: str) -> List[AppEntry]:
+    entries = []
+    if kind == "path":
+        pathext = {".exe", ".bat", ".cmd"} if SYSTEM == "Windows" else None
+        try:
+            with os.scandir(directory) as it:
+                for e in it:
+                    stem, ext = os.path.splitext(e.name)
+                    if pathext is not None:
+                        if ext.lower() in pathext:
+                            entries.append(AppEntry(stem, [e.path], "path", e.name))
+                    elif e.is_file() and os.access(e.path, os.X_OK):
+                        entries.append(AppEntry(e.name, [e.path], "path", e.name))
+        except OSError:
+            pass
+        return entries
+
+    for root, dirs, files in os.walk(directory):
+        if kind == "bundle":
+            for d in [d for d in dirs if d.endswith(".app")]:
+                entries.append(AppEntry(d[:-4], [os.path.join(root, d)], "bundle", d[:-4]))
+            dirs[:] = [d for d in dirs if not d.endswith(".app")]
+            continue
+        for name in files:
+            path = os.path.join(root, name)
+            if kind == "desktop" and name.endswith(".desktop"):
+                entry = parse_desktop_file(path)
+                if entry:
+                    entries.append(entry)
+            elif kind == "shortcut" and name.lower().endswith((".lnk", ".url")):
+                stem = os.path.splitext(name)[0]
+                entries.append(AppEntry(stem, [path], "shortcut", stem + ".exe"))
+    return entries
+
+def _tree_mtime(directory: str, recursive: bool) -> Optional[float]:
+    """Newest mtime of directory (and its subdirectories): changes when entries are added/removed."""
+    try:
+        newest = os.stat(directory).st_mtime
+    except OSError:
+        return None
+    if recursive:
+        for root, dirs, _ in os.walk(directory):
+            # A bundle's own contents never change what we index; adding or
+            # removing one already bumps its parent's mtime.
+            dirs[:] = [d for d in dirs if not d.endswith(".app")]
+            for d in dirs:
+                try:
+                    newest = max(newest, os.stat(os.path.join(root, d)).st_mtime)
+                except OSError:
+                    pass
+    return newest
+
+# ============ INDEX ============
+class AppIndex:
+    """Installed applications, fuzzy-searchable by name.
+
+    Sources are scanned per directory and persisted with the directory's
+    mtime. refresh() only rescans directories whose mtime changed, so
+    lookups stay local and fast after the first build.
+
+    Only launcher entries (desktop files, shortcuts, bundles) are fuzzy
+    matched. PATH binaries and executable aliases need an exact name, and
+    PROTECTED entries are never indexed.
+    """
+
+    def __init__(self, index_file: str = INDEX_FILE, web_cache_file: str = WEB_CACHE_FILE):
+        self.index_file = index_file
+        self.web_cache_file = web_cache_file
+        self.dirs: Dict[str, dict] = {}    # directory -> {"kind", "mtime", "entries"}
+        self.fuzzy = FuzzyIndex()
+        self.exact: Dict[str, AppEntry] = {}   # PATH binaries and executable aliases
+        self.web_cache: Dict[str, str] = {}
+        self._checked = 0.0
+        self._lock = threading.RLock()
+        self._load()
+        self.refresh(force=True)
+
+    def sources(self) -> Dict[str, str]:
+        """directory -> kind, in priority order (first wins for duplicate names)."""
+        if SYSTEM == "Windows":
+            src = {d: "shortcut" for d in _start_menu_dirs()}
+        elif SYSTEM == "Darwin":
+            src = {d: "bundle" for d in ("/Applications", "/System/Applications", os.path.expanduser("~/Applications"))}
+        else:
+            src = {d: "desktop" for d in _desktop_dirs()}
+        for d in _path_dirs():
+            src.setdefault(d, "path")
+        return src
+
+    # ---------------- Persistence ----------------
+    def _load(self):
+        for attr, path in (("dirs", self.index_file), ("web_cache", self.web_cache_file)):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if attr == "dirs":
+                if data.get("version") != INDEX_VERSION:
+                    continue
+                self.dirs = {d: {**v, "entries": [AppEntry(**e) for e in v["entries"]]}
+                             for d, v in data["dirs"].items()}
+            else:
+                self.web_cache = data
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+        data = {"version": INDEX_VERSION,
+                "dirs": {d: {**v, "entries": [asdict(e) for e in v["entries"]]} for d, v in self.dirs.items()}}
+        tmp = self.index_file + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.index_file)
+
+    # ---------------- Refresh ----------------
+    def refresh(self, force: bool = False) -> int:
+        """Rescan changed directories (at most every CHECK_INTERVAL). Returns dirs rescanned."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._checked < CHECK_INTERVAL:
+                return 0
+            self._checked = now
+            sources = self.sources()
+            changed = 0
+            for directory in [d for d in self.dirs if d not in sources]:
+                del self.dirs[directory]
+                changed += 1
+            for directory, kind in sources.items():
+                mtime = _tree_mtime(directory, recursive=kind != "path")
+                cached = self.dirs.get(directory)
+                if mtime is None:
+                    if cached:
+                        del self.dirs[directory]
+                        changed += 1
+                    continue
+                if cached and cached["mtime"] == mtime and cached["kind"] == kind:
+                    continue
+                self.dirs[directory] = {"kind": kind, "mtime": mtime, "entries": _scan_dir(directory, kind)}
+                changed += 1
+            if changed or not (len(self.fuzzy) or self.exact):
+                self._rebuild(sources)
+            if changed:
+                self._save()
+            return changed
+
+    def _rebuild(self, sources: Dict[str, str]):
+        self.fuzzy.clear()
+        self.exact.clear()
+        # Lowest priority first so GUI entries overwrite same-named PATH binaries
+        for directory in reversed(list(sources)):
+            for entry in self.dirs.get(directory, {}).get("entries", ()):
+                if _protected(entry):
+                    continue
+                if entry.kind == "path":
+                    self.exact[normalize(entry.name)] = entry
+                    continue
+                self.fuzzy.add(entry.name, entry)
+                if entry.kind == "desktop":
+                    self.exact[normalize(entry.executable)] = entry
+
+    # ---------------- Lookup ----------------
+    def find(self, name: str, min_score: float = MIN_SCORE) -> Optional[AppEntry]:
+        """Exact launcher name, then exact binary/alias, then the best fuzzy launcher match."""
+        self.refresh()
+        key = normalize(name)
+        with self._lock:
+            if key in self.fuzzy:
+                return self.fuzzy.get(key)
+            if key in self.exact:
+                return self.exact[key]
+            matches = self.fuzzy.search(key, limit=1, min_score=min_score)
+        return matches[0][2] if matches else None
+
+    def open(self, name: str) -> bool:
+        entry = self.find(name)
+        if entry is None:
+            return False
+        launch(entry)
+        return True
+
+    def close(self, name: str) -> bool:
+        entry = self.find(name)
+        if entry is None:
+            return False
+        app_id = _flatpak_app_id(entry.command) if entry.kind == "desktop" else None
+        if SYSTEM == "Windows":
+            cmd = ["taskkill", "/IM", entry.executable, "/F"]
+        elif app_id:
+            cmd = ["flatpak", "kill", app_id]  # the sandboxed process is not named "flatpak"
+        else:
+            cmd = ["pkill", "-x", entry.executable[:15]]  # comm names are truncated to 15 chars
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+    # ---------------- Web fallback ----------------
+    def web_url(self, name: str, resolve) -> Optional[str]:
+        """Cached URL for name, resolving (and caching) it with resolve(name) on a miss."""
+        key = normalize(name)
+        with self._lock:
+            if key in self.web_cache:
+                return self.web_cache[key]
+        url = resolve(name)
+        if url:
+            with self._lock:
+                self.web_cache[key] = url
+                os.makedirs(os.path.dirname(self.web_cache_file) or ".", exist_ok=True)
+                with open(self.web_cache_file, "w", encoding="utf-8") as f:
+                    json.dump(self.web_cache, f, indent=2)
+        return url
+
+def launch(entry: AppEntry):
+    """Start an indexed app detached from our process."""
+    if entry.kind == "shortcut":
+        os.startfile(entry.command[0])
+    elif entry.kind == "bundle":
+        subprocess.Popen(["open", entry.command[0]])
+    else:
+        subprocess.Popen(entry.command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+
+_index: AppIndex | None = None
+_index_lock = threading.Lock()
+
+def GetAppIndex() -> AppIndex:
+    """Process-wide application index, built (or loaded) on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = AppIndex()
+        return _index
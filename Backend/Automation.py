@@ -1,20 +1,6 @@
-from GithubAuto import (
-    create_repo,
-    delete_repo,
-    list_repos,
-    find_repo_by_name,
-    open_repo_in_browser,
-    clone_repo,
-    git_commit,
-    git_push,
-    git_pull,
-    git_create_branch,
-    git_checkout_branch,
-    search_repos,
-    search_users,
-)
 import asyncio
 import os
+import platform
 import re
 import subprocess
 import webbrowser
@@ -23,6 +9,16 @@ from rich import print
 from datetime import datetime, timedelta
 import json
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+if __package__:
+    from Backend.Dispatcher import command, dispatcher, no_args, split_args
+else:
+    from Dispatcher import command, dispatcher, no_args, split_args  # running this file directly from Backend/
 
 # ---------------- CONFIG ---------------- #
 env_vars = dotenv_values(".env")
@@ -34,9 +30,13 @@ useragent = (
     "Chrome/100.0.4896.75 Safari/537.36"
 )
 
-messages = []
+messages = []           # content-writer history, trimmed to CONTENT_CONTEXT_TOKENS
+messages_lock = threading.Lock()
 client = None
 
+CONTENT_CONTEXT_TOKENS = 3000  # history sent with each content request
+STOP_TOKEN = "</s>"
+
 SystemChatBot = [
     {
         "role": "system",
@@ -48,6 +48,18 @@ SystemChatBot = [
     }
 ]
 
+# Execution plan: every handler runs under a timeout on a named pool, and
+# handlers sharing a resource (browser tabs, git working copies) run
+# one at a time.
+HANDLER_TIMEOUT = 30.0  # seconds, unless the handler registers its own
+GITHUB_TIMEOUT = 120.0  # GitHub API calls: above GithubAsync.CALL_TIMEOUT (rate-limit waits + retries)
+POOL_SIZES = {
+    "io": 8,                                # browser launches, HTTP, subprocesses
+    "cpu": max(1, (os.cpu_count() or 2) - 1),
+    "wait": 8,                              # threads blocked on a resource slot
+}
+RESOURCE_LIMITS = {"browser": 2, "git": 2}
+
 # Precompiled regex for performance
 num_pattern = re.compile(r"\b(\d{1,3})\b")
 
@@ -60,56 +72,81 @@ def get_client():
         client = Groq(api_key=GroqAPIKey)
     return client
 
+def _github():
+    """Lazy load GithubAuto (PyGithub) only when a github command runs."""
+    if __package__:
+        from Backend import GithubAuto
+    else:
+        import GithubAuto  # running this file directly from Backend/
+    return GithubAuto
+
 # ---------------- FEATURES ---------------- #
+@command("google search ", resource="browser", timeout=20)
 def GoogleSearch(topic: str):
     from pywhatkit import search
     search(topic)
     return True
 
+@command("youtube search ", resource="browser", timeout=20)
 def YouTubeSearch(topic: str):
     url = f"https://www.youtube.com/results?search_query={topic}"
     webbrowser.open(url)
     return True
 
+@command("play ", resource="browser", timeout=20)
 def PlayYoutube(query: str):
     from pywhatkit import playonyt
     playonyt(query)
     return True
 
+def _app_index():
+    if __package__:
+        from Backend.AppIndex import GetAppIndex
+    else:
+        from AppIndex import GetAppIndex  # running this file directly from Backend/
+    return GetAppIndex()
+
+def _search_app_url(app: str):
+    """First DuckDuckGo result for app, or None."""
+    import requests
+    from bs4 import BeautifulSoup
+    import urllib.parse
+
+    url = f"https://duckduckgo.com/html/?q={urllib.parse.quote_plus(app)}"
+    headers = {"User-Agent": useragent}
+    resp = requests.get(url, headers=headers, timeout=10)
+    if resp.status_code != 200:
+        return None
+    soup = BeautifulSoup(resp.text, "html.parser")
+    result = soup.find("a", {"class": "result__a"})
+    if not (result and result.get("href")):
+        return None
+    href = result["href"]
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
+    return urllib.parse.unquote(query["uddg"][0]) if "uddg" in query else href
+
+@command("open ", timeout=20)
 def OpenApp(app: str):
+    # Installed apps come from the local index; AppOpener and the web are fallbacks
+    index = _app_index()
+    if index.open(app):
+        return True
     try:
         from AppOpener import open as appopen
         appopen(app, match_closest=True, output=True, throw_error=True)
         return True
     except Exception:
-        import requests
-        from bs4 import BeautifulSoup
-        import urllib.parse
-
-        url = f"https://duckduckgo.com/html/?q={app}"
-        headers = {"User-Agent": useragent}
-        resp = requests.get(url, headers=headers)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, "html.parser")
-            result = soup.find("a", {"class": "result__a"})
-            if result and result.get("href"):
-                href = result["href"]
-                parsed = urllib.parse.urlparse(href)
-                query = urllib.parse.parse_qs(parsed.query)
-                direct_url = (
-                    urllib.parse.unquote(query["uddg"][0])
-                    if "uddg" in query
-                    else href
-                )
-                chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-                webbrowser.register(
-                    "chrome", None, webbrowser.BackgroundBrowser(chrome_path)
-                )
-                webbrowser.get("chrome").open(direct_url)
-                return True
-        return False
+        pass
+    url = index.web_url(app, _search_app_url)  # resolved once, then cached
+    if url:
+        webbrowser.open(url)
+        return True
+    return False
 
+@command("close ", timeout=10)
 def CloseApp(app: str):
+    if _app_index().close(app):
+        return True
     try:
         from AppOpener import close
         close(app, match_closest=False, output=True, throw_error=False)
@@ -117,41 +154,79 @@ def CloseApp(app: str):
     except Exception:
         return False
 
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1  # ~4 characters per token for English text
+
+def _trim_messages():
+    """Drop the oldest content-writer turns until the history fits the budget."""
+    total = sum(_estimate_tokens(m["content"]) for m in messages)
+    while messages and total > CONTENT_CONTEXT_TOKENS:
+        total -= _estimate_tokens(messages.pop(0)["content"])
+
+def _split_stop_token(text: str):
+    """(text safe to write, tail that may be the start of a split STOP_TOKEN)."""
+    text = text.replace(STOP_TOKEN, "")
+    for k in range(len(STOP_TOKEN) - 1, 0, -1):
+        if text.endswith(STOP_TOKEN[:k]):
+            return text[:-k], text[-k:]
+    return text, ""
+
+def open_editor(path: str):
+    if platform.system() == "Windows":
+        subprocess.Popen(["notepad.exe", path])
+    elif platform.system() == "Darwin":
+        subprocess.Popen(["open", "-t", path])
+    else:
+        subprocess.Popen(["xdg-open", path])
+
+@command("content ", timeout=180)
 def Content(topic: str):
-    def open_notepad(file):
-        subprocess.Popen(["notepad.exe", file])
-
-    def content_writer_ai(prompt):
-        client = get_client()
-        messages.append({"role": "user", "content": prompt})
-        completion = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=SystemChatBot + messages,
-            max_tokens=2048,
-            temperature=0.7,
-            top_p=1,
-            stream=True,
-        )
-        answer = ""
-        for chunk in completion:
-            if chunk.choices[0].delta.content:
-                answer += chunk.choices[0].delta.content
-        answer = answer.replace("</s>", "")
-        messages.append({"role": "assistant", "content": answer})
-        return answer
+    """Stream the completion straight into Data/<topic>.txt, then open it.
 
+    Editors like Notepad do not reload a file, so it is opened once the
+    stream is complete. Only a bounded head of the answer is kept in memory
+    for the next request's context.
+    """
     topic = topic.replace("Content", "").strip()
-    content_by_ai = content_writer_ai(topic)
-
     os.makedirs("Data", exist_ok=True)
-    filename = rf"Data\{topic.lower().replace(' ', '')}.txt"
+    filename = os.path.join("Data", f"{topic.lower().replace(' ', '')}.txt")
+
+    with messages_lock:
+        history = list(messages)
+    completion = get_client().chat.completions.create(
+        model="llama-3.3-70b-versatile",
+        messages=SystemChatBot + history + [{"role": "user", "content": topic}],
+        max_tokens=2048,
+        temperature=0.7,
+        top_p=1,
+        stream=True,
+    )
+
+    head, head_len, pending = [], 0, ""
+    head_limit = CONTENT_CONTEXT_TOKENS * 2  # characters, about half the budget
     with open(filename, "w", encoding="utf-8") as file:
-        file.write(content_by_ai)
-
-    open_notepad(filename)
+        for chunk in completion:
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            text, pending = _split_stop_token(pending + delta)
+            if not text:
+                continue
+            file.write(text)
+            if head_len < head_limit:
+                head.append(text[:head_limit - head_len])
+                head_len += len(head[-1])
+        file.write(pending.replace(STOP_TOKEN, ""))
+
+    open_editor(filename)
+    with messages_lock:
+        messages.append({"role": "user", "content": topic})
+        messages.append({"role": "assistant", "content": "".join(head)})
+        _trim_messages()
     return True
 
 # ---------------- SYSTEM CONTROLS ---------------- #
+@command("system ", timeout=10)
 async def System(command: str):
     command = command.lower()
 
@@ -230,6 +305,7 @@ def save_reminders(data):
     with open(REMINDER_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
 
+@command("reminder ")
 async def Reminder(command: str):
     command_lower = command.lower()
 
@@ -289,7 +365,8 @@ async def Reminder(command: str):
     return False
 
 # ---------------- TIRED FUNCTION ---------------- #
-async def Tired(_):
+@command("tired", resource="browser", timeout=20)
+def Tired(_):
     favorite_songs = [
         "GUZAARISHEIN",
         "Main Rahoon",
@@ -304,90 +381,170 @@ async def Tired(_):
     ]
     song = random.choice(favorite_songs)
     print(f"[bold green]You are tired. Playing your favorite song:[/bold green] {song}")
-    await asyncio.to_thread(PlayYoutube, song)
+    PlayYoutube(song)
     return True
 
 # ---------------- WHATSAPP AUTOMATION ---------------- #
-
-CONTACTS = {
-    # Example
-    "ChatGPT": "+1 (800) 242-8478"
-}
-
+def _whatsapp():
+    if __package__:
+        from Backend.WhatsAppQueue import GetWhatsAppOutbox
+    else:
+        from WhatsAppQueue import GetWhatsAppOutbox  # running this file directly from Backend/
+    return GetWhatsAppOutbox()
+
+@command("whatsapp", timeout=10)
 def WhatsAppMsg(command: str):
-    try:
-        import pywhatkit as kit
-
-        parts = command.strip().split(" ", 1)
-        if len(parts) < 2:
-            print("[red]Invalid format. Use: whatsapp <contact/number> <message>[/red]")
-            return False
+    """Queue a message; the outbox's single browser session sends it in the background."""
+    parts = command.strip().split(" ", 1)
+    if len(parts) < 2:
+        print("[red]Invalid format. Use: whatsapp <contact/number> <message>[/red]")
+        return False
 
-        target, message = parts
-        target = target.lower().strip()
+    target, message = parts
+    outbox = _whatsapp()
+    contact = outbox.contacts.resolve(target)
+    if contact is None:
+        print(f"[red]Unknown contact: {target}. Add it to Data/Contacts.json[/red]")
+        return False
 
-        # If target is a saved contact name, use its number
-        phone = CONTACTS.get(target, target)
+    name, phone = contact
+    outbox.enqueue(phone, message, name)
+    print(f"[green]WhatsApp message queued for {name} ({phone}):[/green] {message}")
+    return True
 
-        # If it’s not a full international format, prepend country code
-        if not phone.startswith("+"):
-            phone = "+92" + phone  # change default country code if needed
+# ---------------- GITHUB COMMANDS ---------------- #
+def _report_git(results):
+    for r in results:
+        detail = r.error or (f"{r.branch} +{r.ahead}/-{r.behind}, {r.changed} changed" if hasattr(r, "branch") else "up to date")
+        print(f"[{'green' if r.ok else 'red'}]{r.path}[/]: {detail}")
+    return all(r.ok for r in results)
+
+def _report_rate_limit(status: dict):
+    for resource, b in status.pop("budgets").items():
+        print(f"[cyan]{resource}[/cyan]: {b['remaining']}/{b['limit']} left, resets in {b['reset_in']}s")
+    print(", ".join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in status.items()))
+    return True
 
-        kit.sendwhatmsg_instantly(phone, message, wait_time=10, tab_close=False)
-        print(f"[green]WhatsApp message sent to {target} ({phone}):[/green] {message}")
-        return True
+# The longest registered prefix wins, so "github create private x" reaches
+# the private handler instead of creating a public repo named "private x".
+dispatcher.register("github create ", lambda name: _github().create_repo(name, private=False), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github create private ", lambda name: _github().create_repo(name, private=True), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github delete ", lambda name: _github().delete_repo(name, confirm=True), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github list", lambda: _github().list_repos(), parser=no_args, timeout=GITHUB_TIMEOUT)
+dispatcher.register("github find ", lambda name: _github().find_repo_by_name(name), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github open ", lambda name: _github().open_repo_in_browser(name), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github clone ", lambda name, dest: _github().clone_repo(name, dest),
+                    parser=split_args(2), resource="git", timeout=1800)
+dispatcher.register("github commit ", lambda path, msg: _github().git_commit(path, msg), parser=split_args(2))
+dispatcher.register("github push ", lambda path: _github().git_push(path), resource="git", timeout=120)
+dispatcher.register("github pull ", lambda path: _github().git_pull(path), resource="git", timeout=120)
+dispatcher.register("github pull all", lambda: _report_git(_github().git_pull_all()), parser=no_args, timeout=300)
+dispatcher.register("github status all", lambda: _report_git(_github().git_status_all()), parser=no_args, timeout=120)
+dispatcher.register("github refresh mirrors", lambda: _report_git(_github().refresh_all_mirrors()), parser=no_args, timeout=600)
+dispatcher.register("github branch create ", lambda path, branch: _github().git_create_branch(path, branch), parser=split_args(2))
+dispatcher.register("github branch checkout ", lambda path, branch: _github().git_checkout_branch(path, branch), parser=split_args(2))
+dispatcher.register("github search repo ", lambda query: _github().search_repos(query), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github search user ", lambda query: _github().search_users(query), timeout=GITHUB_TIMEOUT)
+dispatcher.register("github rate limit", lambda: _report_rate_limit(_github().rate_limit_status()), parser=no_args)
+
+# ---------------- EXECUTION PLAN ---------------- #
+@dataclass
+class CommandResult:
+    command: str
+    status: str            # ok / failed / timeout / invalid / unknown
+    value: Any = None
+    error: Optional[str] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+_pools: dict = {}
+_resources: dict = {}
+_plan_lock = threading.Lock()
+
+def _pool(name: str) -> ThreadPoolExecutor:
+    with _plan_lock:
+        if name not in _pools:
+            _pools[name] = ThreadPoolExecutor(max_workers=POOL_SIZES[name], thread_name_prefix=f"automation-{name}")
+        return _pools[name]
+
+def _resource(name: str) -> threading.BoundedSemaphore:
+    # Thread semaphores, not asyncio ones: each Automation() call runs on a
+    # fresh event loop, and a timed-out handler keeps its slot until its
+    # thread actually returns.
+    with _plan_lock:
+        if name not in _resources:
+            _resources[name] = threading.BoundedSemaphore(RESOURCE_LIMITS.get(name, 1))
+        return _resources[name]
+
+async def _acquire(sem: threading.BoundedSemaphore, timeout: float):
+    """Block for a slot on a waiter thread, so the event loop never polls."""
+    future = _pool("wait").submit(sem.acquire, True, timeout)
+    try:
+        acquired = await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # The command timed out while queued: hand back a slot granted afterwards
+        future.add_done_callback(lambda f: not f.cancelled() and f.result() and sem.release())
+        raise
+    if not acquired:
+        raise asyncio.TimeoutError
+
+async def _call(handler, args, kwargs):
+    resource = handler.options.get("resource")
+    sem = _resource(resource) if resource else None
+    if sem:
+        await _acquire(sem, handler.options.get("timeout", HANDLER_TIMEOUT))
+    if asyncio.iscoroutinefunction(handler.func):
+        try:
+            return await handler.func(*args, **kwargs)
+        finally:
+            if sem:
+                sem.release()
+    try:
+        future = _pool(handler.options.get("pool", "io")).submit(handler.func, *args, **kwargs)
+    except BaseException:
+        if sem:
+            sem.release()
+        raise
+    if sem:
+        future.add_done_callback(lambda f: sem.release())
+    return await asyncio.wrap_future(future)
+
+async def _execute(cmd: str) -> CommandResult:
+    start = time.perf_counter()
+    match = dispatcher.match(cmd)
+    if match is None:
+        return CommandResult(cmd, "unknown", error="no matching command")
+    handler, arg = match
+    try:
+        args, kwargs = handler.parse(arg)
+    except ValueError as e:
+        return CommandResult(cmd, "invalid", error=str(e))
 
+    timeout = handler.options.get("timeout", HANDLER_TIMEOUT)
+    try:
+        value = await asyncio.wait_for(_call(handler, args, kwargs), timeout)
+    except asyncio.TimeoutError:
+        return CommandResult(cmd, "timeout", error=f"no result after {timeout:g}s",
+                             latency=time.perf_counter() - start)
     except Exception as e:
-        print(f"[red]WhatsApp sending failed: {e}[/red]")
-        return False
+        return CommandResult(cmd, "failed", error=str(e), latency=time.perf_counter() - start)
+    status = "failed" if value is False else "ok"
+    return CommandResult(cmd, status, value=value, latency=time.perf_counter() - start)
 
 # ---------------- COMMAND HANDLER ---------------- #
-COMMANDS = {
-    "open ": OpenApp,
-    "close ": CloseApp,
-    "play ": PlayYoutube,
-    "content ": Content,
-    "google search ": GoogleSearch,
-    "youtube search ": YouTubeSearch,
-    "system ": System,
-    "reminder ": Reminder,
-    "tired": Tired,
-    "whatsapp": WhatsAppMsg,
-    "github create ": lambda arg: create_repo(arg, private=False),
-    "github create private ": lambda arg: create_repo(arg, private=True),
-    "github delete ": lambda arg: delete_repo(arg, confirm=True),
-    "github list": lambda _: list_repos(),
-    "github find ": find_repo_by_name,
-    "github open ": open_repo_in_browser,
-    "github clone ": lambda arg: clone_repo(arg.split()[0], arg.split()[1]),
-    "github commit ": lambda arg: git_commit(*arg.split(" ", 1)),
-    "github push ": git_push,
-    "github pull ": git_pull,
-    "github branch create ": lambda arg: git_create_branch(*arg.split()),
-    "github branch checkout ": lambda arg: git_checkout_branch(*arg.split()),
-    "github search repo ": search_repos,
-    "github search user ": search_users,
-}
-
-async def TranslateAndExecute(commands: list[str]):
-    tasks = []
-    for command in commands:
-        for prefix, func in COMMANDS.items():
-            if command.startswith(prefix):
-                arg = command.removeprefix(prefix).strip()
-                if asyncio.iscoroutinefunction(func):
-                    tasks.append(func(arg))
-                else:
-                    tasks.append(asyncio.to_thread(func, arg))
-                break
-        else:
-            print(f"[red]No Functions Found. For: {command}[/red]")
-
-    return await asyncio.gather(*tasks)
-
-async def Automation(commands: list[str]):
-    await TranslateAndExecute(commands)
-    return True
+async def TranslateAndExecute(commands: list[str]) -> list[CommandResult]:
+    results = await asyncio.gather(*(_execute(cmd) for cmd in commands))
+    for r in results:
+        colour = "green" if r.ok else "red"
+        detail = f" ({r.error})" if r.error else ""
+        print(f"[{colour}]{r.status:>7}[/{colour}] {r.latency * 1000:7.0f} ms  {r.command}{detail}")
+    return results
+
+async def Automation(commands: list[str]) -> list[CommandResult]:
+    return await TranslateAndExecute(commands)
 
 # ---------------- ASYNC INPUT ---------------- #
 async def async_input(prompt: str = ""):
@@ -0,0 +1,41 @@
+import os
+import threading
+from json import dump, load
+
+# ============ CONFIG ============
+CHAT_LOG_PATH = r"Data\ChatLog.json"
+
+# One history shared by ChatBot and RealtimeSearchEngine. Intents of a turn
+# run concurrently: each reads a snapshot for its context, and finished
+# exchanges are recorded as whole user/assistant pairs under the lock.
+lock = threading.RLock()
+
+os.makedirs(os.path.dirname(CHAT_LOG_PATH) or "Data", exist_ok=True)
+try:
+    with open(CHAT_LOG_PATH, "r") as f:
+        messages = load(f)
+except Exception:
+    messages = []
+    with open(CHAT_LOG_PATH, "w") as f:
+        dump(messages, f)
+
+def append(role: str, content: str) -> None:
+    with lock:
+        messages.append({"role": role, "content": content})
+
+def append_pair(user: str, assistant: str) -> None:
+    """Record one exchange: both messages land next to each other and are saved together."""
+    with lock:
+        messages.append({"role": "user", "content": user})
+        messages.append({"role": "assistant", "content": assistant})
+        save()
+
+def recent(n: int | None = None) -> list:
+    """Copy of the last n messages (all if n is None), safe to hand to an API call."""
+    with lock:
+        return list(messages[-n:] if n else messages)
+
+def save() -> None:
+    with lock:
+        with open(CHAT_LOG_PATH, "w") as f:
+            dump(messages, f, indent=4)
@@ -1,6 +1,5 @@
 import datetime
 from groq import Groq
-from json import load, dump
 from dotenv import dotenv_values
 
 # Config
@@ -33,14 +32,12 @@ Your user's name is {USERNAME}. You have real-time information from the internet
 
 SystemChatBot = [{"role": "system", "content": System}]
 
-# Load chat history once
-try:
-    with open(r"Data\ChatLog.json","r") as f:
-        messages = load(f)
-except FileNotFoundError:
-    messages = []
-    with open(r"Data\ChatLog.json","w") as f:
-        dump(messages, f)
+# Chat history is shared (and locked) with the realtime engine
+if __package__:
+    from Backend import ChatLog
+else:
+    import ChatLog  # running this file directly from Backend/
+messages = ChatLog.messages
 
 def RealtimeInformation():
     now = datetime.datetime.now()
@@ -53,14 +50,18 @@ def AnswerModifier(answer):
 def get_recent_history(messages):
     return messages[-MAX_HISTORY:]
 
-def ChatBot(query, retries=2):
-    global messages
+def ChatBot(query, retries=2, record=True):
+    """Answer query from a snapshot of the chat log.
+
+    record=False leaves logging the exchange to the caller, which can then
+    keep several concurrent answers in order (see ChatLog.append_pair).
+    """
     try:
-        messages.append({"role": "user", "content": query})
+        history = get_recent_history(ChatLog.recent() + [{"role": "user", "content": query}])
 
         completion = client.chat.completions.create(
             model=MODEL_NAME,
-            messages=SystemChatBot + [{"role": "system", "content": RealtimeInformation()}] + get_recent_history(messages),
+            messages=SystemChatBot + [{"role": "system", "content": RealtimeInformation()}] + history,
             max_tokens=1024,
             temperature=0.7,
             top_p=1,
@@ -73,16 +74,14 @@ def ChatBot(query, retries=2):
                 chunks.append(chunk.choices[0].delta.content)
 
         Answer = ''.join(chunks).replace("</s>", "")
-        messages.append({"role": "assistant", "content": Answer})
-
-        with open(r"Data\ChatLog.json","w") as f:
-            dump(messages, f, indent=4)
+        if record:
+            ChatLog.append_pair(query, Answer)
 
         return AnswerModifier(Answer)
 
     except Exception as e:
         if retries > 0:
-            return ChatBot(query, retries-1)
+            return ChatBot(query, retries-1, record)
         raise e
 
 if __name__ == "__main__":
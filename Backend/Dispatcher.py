@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ============ ARGUMENT PARSERS ============
+# A parser turns the text after the matched prefix into (args, kwargs).
+
+def raw(arg: str) -> Tuple[list, dict]:
+    """Pass the whole argument string through (default)."""
+    return [arg], {}
+
+def no_args(arg: str) -> Tuple[list, dict]:
+    """Reject leftover text instead of silently dropping it."""
+    if arg:
+        raise ValueError(f"unexpected arguments: {arg!r}")
+    return [], {}
+
+def split_args(n: int) -> Callable[[str], Tuple[list, dict]]:
+    """Split into exactly n whitespace separated arguments; the last one keeps any spaces."""
+    def parser(arg: str) -> Tuple[list, dict]:
+        parts = arg.split(maxsplit=n - 1)
+        if len(parts) != n:
+            raise ValueError(f"expected {n} arguments, got {len(parts)}: {arg!r}")
+        return parts, {}
+    return parser
+
+# ============ TRIE ============
+class CommandTrie:
+    """Character trie over command prefixes with longest-prefix lookup.
+
+    Lookup walks the command once, so dispatch cost depends on the command's
+    length, not on how many prefixes are registered, and a longer prefix
+    ("github create private ") always wins over a shorter one ("github create ").
+    A prefix only matches at a word boundary: "github list" matches
+    "github list" but not "github listing stuff".
+    """
+
+    _END = object()
+
+    def __init__(self):
+        self.root: dict = {}
+
+    def insert(self, prefix: str, value) -> None:
+        node = self.root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        if self._END in node:
+            raise ValueError(f"duplicate command prefix: {prefix!r}")
+        node[self._END] = value
+
+    def longest_prefix(self, text: str) -> Optional[Tuple[str, object]]:
+        node, best = self.root, None
+        for i, ch in enumerate(text):
+            node = node.get(ch)
+            if node is None:
+                break
+            at_boundary = ch.isspace() or i + 1 == len(text) or text[i + 1].isspace()
+            if self._END in node and at_boundary:
+                best = (text[:i + 1], node[self._END])
+        return best
+
+# ============ DISPATCHER ============
+@dataclass
+class Handler:
+    prefix: str
+    func: Callable
+    parser: Callable[[str], Tuple[list, dict]] = raw
+    options: dict = field(default_factory=dict)
+
+    def parse(self, arg: str) -> Tuple[list, dict]:
+        return self.parser(arg)
+
+class CommandDispatcher:
+    """Registry of command handlers, compiled into a prefix trie."""
+
+    def __init__(self):
+        self.trie = CommandTrie()
+        self.handlers: Dict[str, Handler] = {}
+
+    def register(self, prefix: str, func: Callable, parser=raw, **options) -> Handler:
+        handler = Handler(prefix, func, parser, options)
+        self.trie.insert(prefix, handler)
+        self.handlers[prefix] = handler
+        return handler
+
+    def command(self, prefix: str, parser=raw, **options):
+        """Decorator: @command("open ") registers the function for that prefix."""
+        def decorator(func):
+            self.register(prefix, func, parser, **options)
+            return func
+        return decorator
+
+    def match(self, command: str) -> Optional[Tuple[Handler, str]]:
+        """(handler, argument string) for the longest registered prefix, or None."""
+        found = self.trie.longest_prefix(command)
+        if found is None:
+            return None
+        prefix, handler = found
+        return handler, command[len(prefix):].strip()
+
+    def prefixes(self) -> List[str]:
+        return list(self.handlers)
+
+# Shared instance: Automation registers its handlers here, Main dispatches through it
+dispatcher = CommandDispatcher()
+command = dispatcher.command
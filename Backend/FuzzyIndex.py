@@ -0,0 +1,109 @@
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_non_word = re.compile(r"[^a-z0-9]+")
+
+def normalize(text: str) -> str:
+    """Lowercase, punctuation to spaces, collapse whitespace."""
+    return " ".join(_non_word.sub(" ", text.lower()).split())
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# ============ INDEX ============
+class FuzzyIndex:
+    """Trigram index for fuzzy name lookup (apps, contacts, repositories).
+
+    Each key is split into padded trigrams. A query only scores the keys that
+    share at least one trigram with it, using the Dice coefficient. Exact,
+    whole-word and prefix matches are boosted, so "code" finds "code" before
+    "vscode" and "chrome" (or "power point") finds "google chrome" ("microsoft
+    powerpoint"). A key whose words are only part of the query is penalised.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()):
+        self.values: Dict[str, Any] = {}
+        self.grams: Dict[str, Set[str]] = defaultdict(set)
+        self._key_grams: Dict[str, Set[str]] = {}
+        for key, value in items:
+            self.add(key, value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, key: str) -> bool:
+        return normalize(key) in self.values
+
+    def add(self, key: str, value: Any) -> None:
+        key = normalize(key)
+        if not key:
+            return
+        if key in self.values:
+            self.remove(key)
+        grams = trigrams(key)
+        self.values[key] = value
+        self._key_grams[key] = grams
+        for g in grams:
+            self.grams[g].add(key)
+
+    def remove(self, key: str) -> None:
+        key = normalize(key)
+        if self.values.pop(key, None) is None and key not in self._key_grams:
+            return
+        for g in self._key_grams.pop(key, ()):
+            keys = self.grams.get(g)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.grams[g]
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.grams.clear()
+        self._key_grams.clear()
+
+    def get(self, key: str, default=None):
+        return self.values.get(normalize(key), default)
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.3) -> List[Tuple[float, str, Any]]:
+        """(score, key, value) for the best matches, best first. Scores are 0..1."""
+        query = normalize(query)
+        if not query:
+            return []
+        if query in self.values:
+            exact = [(1.0, query, self.values[query])]
+            if limit == 1:
+                return exact
+        else:
+            exact = []
+
+        qgrams = trigrams(query)
+        shared: Dict[str, int] = defaultdict(int)
+        for g in qgrams:
+            for key in self.grams.get(g, ()):
+                shared[key] += 1
+
+        qwords = set(query.split())
+        scored = []
+        for key, common in shared.items():
+            if key == query:
+                continue
+            score = 2.0 * common / (len(qgrams) + len(self._key_grams[key]))
+            words = f" {key} "
+            if f" {query} " in words or f" {query.replace(' ', '')} " in words:
+                score = min(0.99, score + 0.3)
+            elif key.startswith(query):
+                score = min(0.99, score + 0.2)
+            elif qwords > set(key.split()):
+                # the query names more than this key: "notepad plus plus" is not "notepad"
+                score *= len(key) / len(query)
+            if score >= min_score:
+                scored.append((score, key, self.values[key]))
+        scored.sort(key=lambda item: (-item[0], len(item[1])))
+        return (exact + scored)[:limit]
+
+    def best(self, query: str, min_score: float = 0.5) -> Optional[Any]:
+        matches = self.search(query, limit=1, min_score=min_score)
+        return matches[0][2] if matches else None
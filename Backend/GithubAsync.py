@@ -0,0 +1,185 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+if __package__:
+    from Backend.GithubRateLimit import MAX_RETRIES, MAX_WAIT, GetRateLimiter, TTLCache
+else:
+    from GithubRateLimit import MAX_RETRIES, MAX_WAIT, GetRateLimiter, TTLCache  # running from Backend/
+
+if __package__:
+    from Backend.GithubAuto import GITHUB_API_URL, GITHUB_TOKEN, GITHUB_USERNAME, RepoInfo, _env
+else:
+    from GithubAuto import GITHUB_API_URL, GITHUB_TOKEN, GITHUB_USERNAME, RepoInfo, _env  # running from Backend/
+
+# ============ CONFIG ============
+def _default_graphql_url() -> str:
+    # github.com: api.github.com/graphql; Enterprise: <host>/api/v3 -> <host>/api/graphql
+    if GITHUB_API_URL.endswith("/v3"):
+        return GITHUB_API_URL[:-3] + "/graphql"
+    return GITHUB_API_URL + "/graphql"
+
+GRAPHQL_URL = _env.get("GitHubGraphqlUrl") or os.environ.get("GitHubGraphqlUrl") or _default_graphql_url()
+REQUEST_TIMEOUT = 15
+# Longest a query can take: all its throttling plus every attempt timing out.
+# Callers waiting on a query (run_sync, command handlers) must allow this much.
+CALL_TIMEOUT = MAX_WAIT + (MAX_RETRIES + 1) * REQUEST_TIMEOUT + 5
+
+# Exactly the fields RepoInfo needs
+REPO_FIELDS = "name nameWithOwner isPrivate url"
+USER_FIELDS = "login url"
+
+class GraphQLError(RuntimeError):
+    pass
+
+def _repo(node: dict) -> RepoInfo:
+    return RepoInfo(name=node["name"], full_name=node["nameWithOwner"], private=node["isPrivate"], html_url=node["url"])
+
+# ============ CLIENT ============
+class GithubGraphQL:
+    """Async GitHub client over GraphQL on one pooled httpx.AsyncClient.
+
+    batch() folds several searches and repository lookups into a single
+    aliased query, so a voice command costs one round-trip.
+    """
+
+    def __init__(self, token: Optional[str] = GITHUB_TOKEN, url: str = GRAPHQL_URL,
+                 client: Optional[httpx.AsyncClient] = None):
+        if not token:
+            raise RuntimeError("GitHubToken not found in .env or environment variables.")
+        self.url = url
+        self.limiter = GetRateLimiter()
+        self.search_cache = TTLCache(metrics=self.limiter.metrics)
+        self.client = client or httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {token}"},
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            timeout=REQUEST_TIMEOUT,
+        )
+
+    async def query(self, query: str, variables: Optional[dict] = None, partial: bool = False) -> dict:
+        """POST a query; with partial=True, field-level errors (e.g. a missing repo) leave nulls instead of raising.
+
+        Pacing and retry waits share one MAX_WAIT budget, so a query finishes within CALL_TIMEOUT.
+        """
+        body = {"query": query, "variables": variables or {}}
+        waited = 0.0
+        for attempt in range(MAX_RETRIES + 1):
+            waited += await self.limiter.acquire("graphql", MAX_WAIT - waited)
+            resp = await self.client.post(self.url, json=body)
+            self.limiter.observe(resp.headers, default_resource="graphql")
+            delay = self.limiter.retry_delay(resp.status_code, resp.headers)
+            if delay is None or attempt == MAX_RETRIES or waited + delay > MAX_WAIT:
+                break
+            self.limiter.note_retry(delay)
+            await asyncio.sleep(delay)
+            waited += delay
+        resp.raise_for_status()
+        payload = resp.json()
+        errors = payload.get("errors")
+        if errors and (not partial or not payload.get("data")):
+            raise GraphQLError("; ".join(e.get("message", str(e)) for e in errors))
+        return payload["data"]
+
+    async def batch(self, repo_searches: Sequence[Tuple[str, int]] = (), user_searches: Sequence[Tuple[str, int]] = (),
+                    repos: Sequence[Tuple[str, str]] = ()) -> dict:
+        """One request for many lookups.
+
+        repo_searches / user_searches: (query, limit) pairs
+        repos: (owner, name) pairs
+        Returns {"repo_searches": [[RepoInfo]], "user_searches": [[(login, url)]], "repos": [RepoInfo | None]}
+        """
+        params, fields, variables = [], [], {}
+        for i, (q, n) in enumerate(repo_searches):
+            params += [f"$rq{i}: String!", f"$rn{i}: Int!"]
+            fields.append(f"rs{i}: search(query: $rq{i}, type: REPOSITORY, first: $rn{i}) "
+                          f"{{ nodes {{ ... on Repository {{ {REPO_FIELDS} }} }} }}")
+            variables.update({f"rq{i}": q, f"rn{i}": n})
+        for i, (q, n) in enumerate(user_searches):
+            params += [f"$uq{i}: String!", f"$un{i}: Int!"]
+            fields.append(f"us{i}: search(query: $uq{i}, type: USER, first: $un{i}) "
+                          f"{{ nodes {{ ... on User {{ {USER_FIELDS} }} }} }}")
+            variables.update({f"uq{i}": q, f"un{i}": n})
+        for i, (owner, name) in enumerate(repos):
+            params += [f"$ro{i}: String!", f"$rr{i}: String!"]
+            fields.append(f"r{i}: repository(owner: $ro{i}, name: $rr{i}) {{ {REPO_FIELDS} }}")
+            variables.update({f"ro{i}": owner, f"rr{i}": name})
+        if not fields:
+            return {"repo_searches": [], "user_searches": [], "repos": []}
+
+        data = await self.query(f"query({', '.join(params)}) {{ {' '.join(fields)} }}", variables, partial=True)
+        return {
+            "repo_searches": [[_repo(n) for n in data[f"rs{i}"]["nodes"] if n]
+                              for i in range(len(repo_searches))],
+            "user_searches": [[(n["login"], n["url"]) for n in data[f"us{i}"]["nodes"] if n]
+                              for i in range(len(user_searches))],
+            "repos": [_repo(data[f"r{i}"]) if data.get(f"r{i}") else None for i in range(len(repos))],
+        }
+
+    async def search_repos(self, query: str, limit: int = 10) -> List[RepoInfo]:
+        key = ("repo", query.strip().lower(), limit)
+        result = self.search_cache.get(key)
+        if result is None:
+            result = (await self.batch(repo_searches=[(query, limit)]))["repo_searches"][0]
+            self.search_cache.put(key, result)
+        return list(result)
+
+    async def search_users(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
+        key = ("user", query.strip().lower(), limit)
+        result = self.search_cache.get(key)
+        if result is None:
+            result = (await self.batch(user_searches=[(query, limit)]))["user_searches"][0]
+            self.search_cache.put(key, result)
+        return list(result)
+
+    async def find_repos(self, names: Sequence[str], owner: Optional[str] = GITHUB_USERNAME) -> Dict[str, Optional[RepoInfo]]:
+        """Look up several of owner's repositories in one request."""
+        if not owner:
+            raise RuntimeError("GitHubUsername not found in .env or environment variables.")
+        found = (await self.batch(repos=[(owner, n) for n in names]))["repos"]
+        return dict(zip(names, found))
+
+    async def aclose(self):
+        await self.client.aclose()
+
+# ============ SYNC BRIDGE ============
+# Voice commands run on worker threads; they share one loop (and so one
+# connection pool) instead of spinning up an event loop per call.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_client: Optional[GithubGraphQL] = None
+_lock = threading.Lock()
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="GithubGraphQL", daemon=True).start()
+            _loop = loop
+        return _loop
+
+def GetGithubGraphQL() -> GithubGraphQL:
+    """Process-wide client, bound to the bridge loop."""
+    global _client
+    loop = _ensure_loop()
+    with _lock:
+        if _client is None:
+            async def create():
+                return GithubGraphQL()
+            _client = asyncio.run_coroutine_threadsafe(create(), loop).result()
+        return _client
+
+def run_sync(coro, timeout: Optional[float] = CALL_TIMEOUT):
+    """Run a coroutine on the bridge loop from any thread and wait for it.
+
+    On timeout the coroutine is cancelled, so it stops spending rate-limit budget.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _ensure_loop())
+    try:
+        return future.result(timeout)
+    except FutureTimeout:
+        future.cancel()
+        raise
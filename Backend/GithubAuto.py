@@ -1,21 +1,46 @@
 from __future__ import annotations
+import base64
+import json
 import os
 import subprocess
+import threading
+import time
 import webbrowser
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Optional, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 from functools import lru_cache
 from dotenv import dotenv_values
 from github import Github, GithubException
+import httpx
+
+if __package__:
+    from Backend.FuzzyIndex import FuzzyIndex
+    from Backend.GithubRateLimit import MAX_WAIT, GetRateLimiter
+else:
+    from FuzzyIndex import FuzzyIndex  # running this file directly from Backend/
+    from GithubRateLimit import MAX_WAIT, GetRateLimiter
 
 # Load env
 _env = dotenv_values(".env")
 GITHUB_TOKEN = _env.get("GitHubToken") or os.environ.get("GitHubToken")
 GITHUB_USERNAME = _env.get("GitHubUsername") or os.environ.get("GitHubUsername")
+GITHUB_API_URL = (_env.get("GitHubApiUrl") or os.environ.get("GitHubApiUrl") or "https://api.github.com").rstrip("/")
+
+REPO_CACHE_FILE = os.path.join("Data", "GithubRepos.json")
+REPO_CACHE_TTL = 300            # seconds before a lookup triggers a conditional refresh
+REPO_FULL_REFRESH = 24 * 3600   # full re-listing (catches repos deleted elsewhere)
+
+CLONES_FILE = os.path.join("Data", "GitClones.json")   # local working copies for bulk operations
+GIT_WORKERS = min(8, (os.cpu_count() or 2) * 2)        # concurrent git processes
+GIT_TIMEOUT = 120
 
-if not GITHUB_TOKEN:
-    raise RuntimeError("GitHubToken not found in .env or environment variables.")
+MIRROR_ROOT = os.path.join("Data", "GitMirrors")   # bare mirrors that new clones borrow objects from
+MIRROR_MAX_AGE = 3600          # refresh a mirror in the background when older than this
+CLONE_TIMEOUT = 1800
+CLONE_MODES = ("full", "shallow", "blobless")
+DEFAULT_CLONE_MODE = _env.get("GitCloneMode") or os.environ.get("GitCloneMode") or "full"
 
 # --------------------- Helpers & Types ---------------------
 
@@ -29,16 +54,234 @@ class RepoInfo:
 @lru_cache(maxsize=1)
 def _get_client() -> Github:
     """Return a cached Github client."""
+    # Checked here rather than at import so a missing token doesn't break startup
+    if not GITHUB_TOKEN:
+        raise RuntimeError("GitHubToken not found in .env or environment variables.")
     return Github(GITHUB_TOKEN)
 
-def _run_git(cmd: List[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
-    """Run a git command and return (returncode, stdout, stderr)."""
+def _git_auth_env() -> Optional[Dict[str, str]]:
+    """Environment that sends the token as an HTTP header to github.com for one git command.
+
+    Passed through GIT_CONFIG_* so it is neither written to any .git/config
+    nor visible in the process list, unlike a token in the remote URL.
+    """
+    if not GITHUB_TOKEN:
+        return None
+    basic = base64.b64encode(f"x-access-token:{GITHUB_TOKEN}".encode()).decode()
+    env = dict(os.environ)
+    count = int(env.get("GIT_CONFIG_COUNT", "0") or 0)
+    env.update({"GIT_CONFIG_COUNT": str(count + 1),
+                f"GIT_CONFIG_KEY_{count}": "http.https://github.com/.extraheader",
+                f"GIT_CONFIG_VALUE_{count}": f"Authorization: Basic {basic}"})
+    return env
+
+def _run_git(cmd: List[str], cwd: Optional[str] = None, timeout: Optional[float] = None,
+             auth: bool = False) -> Tuple[int, str, str]:
+    """Run a git command and return (returncode, stdout, stderr). auth sends the token to github.com."""
     try:
-        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False, timeout=timeout,
+                              env=_git_auth_env() if auth else None)
         return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
     except Exception as e:
         return 1, "", str(e)
 
+# --------------------- Repo Metadata Cache ---------------------
+
+def _api_headers() -> dict:
+    if not GITHUB_TOKEN:
+        raise RuntimeError("GitHubToken not found in .env or environment variables.")
+    return {
+        "Authorization": f"Bearer {GITHUB_TOKEN}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+def _repo_record(d: dict) -> dict:
+    return {"id": d["id"], "name": d["name"], "full_name": d["full_name"], "private": d["private"],
+            "html_url": d["html_url"], "updated_at": d.get("updated_at") or ""}
+
+def _to_info(rec: dict) -> RepoInfo:
+    return RepoInfo(name=rec["name"], full_name=rec["full_name"], private=rec["private"], html_url=rec["html_url"])
+
+class RepoCache:
+    """Your repositories' metadata in Data/GithubRepos.json.
+
+    Refreshes are conditional (If-None-Match on the first page of
+    /user/repos sorted by last update), so an unchanged account costs one
+    304 response. A changed account is re-read only down to the first repo
+    whose updated_at matches the cache. Lookups answer from the cache and
+    revalidate in the background once it is older than REPO_CACHE_TTL.
+    """
+
+    def __init__(self, path: str = REPO_CACHE_FILE):
+        self.path = path
+        self.repos: Dict[str, dict] = {}   # repo id -> record
+        self.etag: Optional[str] = None
+        self.checked = 0.0
+        self.full_synced = 0.0
+        self.index = FuzzyIndex()
+        self._lock = threading.RLock()          # guards the data; never held across network calls
+        self._refresh_lock = threading.Lock()   # one refresh at a time
+        self._version = 0                       # bumped by local create/delete
+        self._refreshing = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.repos = data.get("repos", {})
+        self.etag = data.get("etag")
+        self.checked = data.get("checked", 0.0)
+        self.full_synced = data.get("full_synced", 0.0)
+        self._reindex()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"etag": self.etag, "checked": self.checked, "full_synced": self.full_synced,
+                       "repos": self.repos}, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def _reindex(self):
+        self.index.clear()
+        for repo_id, rec in self.repos.items():
+            self.index.add(rec["name"], repo_id)
+
+    # ---------- refresh ----------
+    def refresh(self, full: bool = False) -> bool:
+        """Sync with the API. Returns True if anything changed.
+
+        The network round-trips (and any rate-limit wait) run without the
+        cache lock, so lookups keep answering from the old data meanwhile;
+        the result is swapped in under the lock at the end.
+        """
+        with self._refresh_lock:
+            now = time.time()
+            with self._lock:
+                full = full or not self.repos or now - self.full_synced > REPO_FULL_REFRESH
+                headers = {"If-None-Match": self.etag} if self.etag and not full else {}
+                known = {i: (r["updated_at"], r["name"]) for i, r in self.repos.items()}
+                version = self._version
+            params = {"per_page": 100, "sort": "updated", "direction": "desc", "affiliation": "owner"}
+            fetched: Dict[str, dict] = {}
+            limiter = GetRateLimiter()
+            waited = 0.0
+
+            def get(url, **kwargs):
+                nonlocal waited
+                # All pages share one MAX_WAIT throttling budget
+                waited += limiter.acquire_sync("core", MAX_WAIT - waited)
+                r = client.get(url, **kwargs)
+                limiter.observe(r.headers)
+                return r
+
+            with httpx.Client(base_url=GITHUB_API_URL, headers=_api_headers(), timeout=15) as client:
+                resp = get("/user/repos", params=params, headers=headers)
+                if resp.status_code == 304:
+                    with self._lock:
+                        if self._version == version:
+                            self.checked = now
+                            self._save()
+                    return False
+                resp.raise_for_status()
+                etag = resp.headers.get("ETag")
+                while True:
+                    done = False
+                    for d in resp.json():
+                        rec = _repo_record(d)
+                        if not full and known.get(str(rec["id"])) == (rec["updated_at"], rec["name"]):
+                            done = True  # sorted by update time: everything older is unchanged
+                            break
+                        fetched[str(rec["id"])] = rec
+                    next_page = resp.links.get("next")
+                    if done or not next_page:
+                        break
+                    resp = get(next_page["url"])
+                    resp.raise_for_status()
+
+            with self._lock:
+                if self._version != version:
+                    # A create/delete landed mid-fetch and may be missing from this
+                    # listing: keep the local change and revalidate on the next lookup
+                    return False
+                if full:
+                    self.repos = fetched
+                    self.full_synced = now
+                else:
+                    self.repos.update(fetched)
+                self.etag, self.checked = etag, now
+                self._reindex()
+                self._save()
+            return bool(fetched) or full
+
+    def ensure_fresh(self, background: bool = True):
+        """Revalidate if older than REPO_CACHE_TTL; in the background when we have data."""
+        if time.time() - self.checked < REPO_CACHE_TTL:
+            return
+        if not (background and self.repos):
+            self.refresh()
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Repo cache refresh failed: {e}")
+            finally:
+                self._refreshing = False
+        threading.Thread(target=run, name="RepoCacheRefresh", daemon=True).start()
+
+    # ---------- lookups ----------
+    def all(self) -> List[RepoInfo]:
+        with self._lock:
+            recs = sorted(self.repos.values(), key=lambda r: r["updated_at"], reverse=True)
+        return [_to_info(r) for r in recs]
+
+    def find(self, name: str, min_score: float = 0.6) -> Optional[RepoInfo]:
+        """Exact (case-insensitive) or fuzzy name match."""
+        with self._lock:
+            repo_id = self.index.best(name, min_score=min_score)
+            return _to_info(self.repos[repo_id]) if repo_id else None
+
+    # ---------- invalidation ----------
+    def upsert(self, repo) -> None:
+        """Record a repo we just created (PyGithub object) and force the next revalidation."""
+        updated = repo.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ") if repo.updated_at else ""
+        with self._lock:
+            self.repos[str(repo.id)] = {"id": repo.id, "name": repo.name, "full_name": repo.full_name,
+                                        "private": repo.private, "html_url": repo.html_url, "updated_at": updated}
+            self._version += 1
+            self.etag, self.checked = None, 0.0
+            self._reindex()
+            self._save()
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            for repo_id in [i for i, r in self.repos.items() if r["name"].lower() == name.lower()]:
+                del self.repos[repo_id]
+            self._version += 1
+            self.etag, self.checked = None, 0.0
+            self._reindex()
+            self._save()
+
+_repo_cache: Optional[RepoCache] = None
+_repo_cache_lock = threading.Lock()
+
+def get_repo_cache() -> RepoCache:
+    global _repo_cache
+    with _repo_cache_lock:
+        if _repo_cache is None:
+            _repo_cache = RepoCache()
+        return _repo_cache
+
 # --------------------- Repo Management ---------------------
 def create_repo(name: str, private: bool = False) -> RepoInfo:
     """Create a repo on your GitHub account.
@@ -53,6 +296,7 @@ def create_repo(name: str, private: bool = False) -> RepoInfo:
     user = gh.get_user()
     try:
         repo = user.create_repo(name=name, private=private)
+        get_repo_cache().upsert(repo)
         return RepoInfo(name=repo.name, full_name=repo.full_name, private=repo.private, html_url=repo.html_url)
     except GithubException as e:
         raise RuntimeError(f"Failed to create repo: {e.data if hasattr(e, 'data') else str(e)}")
@@ -69,34 +313,37 @@ def delete_repo(name: str, confirm: bool = True) -> bool:
     try:
         repo = user.get_repo(name)
         repo.delete()
+        get_repo_cache().remove(name)
         return True
     except GithubException as e:
         raise RuntimeError(f"Failed to delete repo: {e.data if hasattr(e, 'data') else str(e)}")
 
 def list_repos(visibility: Optional[str] = None) -> List[RepoInfo]:
-    """List repos from your account.
+    """List repos from your account (served from the repo cache).
 
     visibility: None|"public"|"private"
     """
-    gh = _get_client()
-    user = gh.get_user()
+    cache = get_repo_cache()
+    cache.ensure_fresh(background=False)
     repos = []
-    for r in user.get_repos():
+    for r in cache.all():
         if visibility == "public" and r.private:
             continue
         if visibility == "private" and not r.private:
             continue
-        repos.append(RepoInfo(name=r.name, full_name=r.full_name, private=r.private, html_url=r.html_url))
+        repos.append(r)
     return repos
 
 def find_repo_by_name(name: str) -> Optional[RepoInfo]:
-    gh = _get_client()
-    user = gh.get_user()
-    try:
-        r = user.get_repo(name)
-        return RepoInfo(name=r.name, full_name=r.full_name, private=r.private, html_url=r.html_url)
-    except GithubException:
-        return None
+    """Exact or fuzzy match among your repos, without an API call when cached."""
+    cache = get_repo_cache()
+    cache.ensure_fresh()
+    info = cache.find(name)
+    if info is None:
+        # Maybe created since the last sync: one conditional request
+        cache.refresh()
+        info = cache.find(name)
+    return info
 
 def open_repo_in_browser(name: str) -> bool:
     """Open repo page in browser if it exists on your account."""
@@ -106,31 +353,122 @@ def open_repo_in_browser(name: str) -> bool:
     webbrowser.open(info.html_url)
     return True
 
+# --------------------- Mirror Cache ---------------------
+
+_mirror_locks: Dict[str, threading.Lock] = {}
+_mirror_refreshing: set = set()
+_mirror_guard = threading.Lock()
+
+def _mirror_lock(path: str) -> threading.Lock:
+    with _mirror_guard:
+        return _mirror_locks.setdefault(path, threading.Lock())
+
+def _clone_url(info: RepoInfo) -> str:
+    # Never embed the token: git stores the URL in the clone's config.
+    # Private repos authenticate through _run_git(..., auth=True) instead.
+    return info.html_url
+
+def _scrub_remote(path: str) -> None:
+    """Drop credentials from origin's URL, left there by older versions that embedded the token."""
+    code, url, _ = _run_git(["git", "-C", path, "config", "--get", "remote.origin.url"])
+    if code == 0 and "@" in url and url.startswith("https://"):
+        _run_git(["git", "-C", path, "remote", "set-url", "origin", "https://" + url.split("@", 1)[1]])
+
+def mirror_path(info: RepoInfo) -> str:
+    return os.path.abspath(os.path.join(MIRROR_ROOT, info.full_name.replace("/", "__") + ".git"))
+
+def _mirror_age(path: str) -> float:
+    stamp = os.path.join(path, "FETCH_HEAD") if os.path.exists(os.path.join(path, "FETCH_HEAD")) else path
+    return time.time() - os.path.getmtime(stamp)
+
+def refresh_mirror(path: str) -> GitResult:
+    """Fetch new objects into a mirror (remote update --prune)."""
+    start = time.perf_counter()
+    with _mirror_lock(path):
+        _scrub_remote(path)
+        code, out, err = _run_git(["git", "-C", path, "remote", "update", "--prune"], timeout=CLONE_TIMEOUT,
+                                  auth=True)
+    return GitResult(path, code == 0, out, err if code else "", time.perf_counter() - start)
+
+def refresh_mirror_async(path: str) -> None:
+    """Refresh in a background thread unless a refresh of path is already running."""
+    with _mirror_guard:
+        if path in _mirror_refreshing:
+            return
+        _mirror_refreshing.add(path)
+
+    def run():
+        try:
+            result = refresh_mirror(path)
+            if not result.ok:
+                print(f"Mirror refresh failed for {path}: {result.error}")
+        finally:
+            with _mirror_guard:
+                _mirror_refreshing.discard(path)
+    threading.Thread(target=run, name="GitMirrorRefresh", daemon=True).start()
+
+def ensure_mirror(info: RepoInfo) -> str:
+    """Path of the bare mirror for info, created (one network clone) if missing."""
+    path = mirror_path(info)
+    with _mirror_lock(path):
+        if not os.path.exists(path):
+            os.makedirs(MIRROR_ROOT, exist_ok=True)
+            code, out, err = _run_git(["git", "clone", "--mirror", "--quiet", _clone_url(info), path],
+                                      timeout=CLONE_TIMEOUT, auth=True)
+            if code != 0:
+                raise RuntimeError(f"Git mirror failed: {err or out}")
+            return path
+    if _mirror_age(path) > MIRROR_MAX_AGE:
+        refresh_mirror_async(path)
+    return path
+
+def list_mirrors() -> List[str]:
+    if not os.path.isdir(MIRROR_ROOT):
+        return []
+    return [os.path.join(os.path.abspath(MIRROR_ROOT), d) for d in sorted(os.listdir(MIRROR_ROOT)) if d.endswith(".git")]
+
+def refresh_all_mirrors(progress=None, workers: int = GIT_WORKERS) -> List[GitResult]:
+    return _run_all(refresh_mirror, list_mirrors(), progress, workers)
+
 # --------------------- Clone (only from your account) ---------------------
-def clone_repo(name: str, dest_path: str) -> str:
+def clone_repo(name: str, dest_path: str, mode: Optional[str] = None, use_mirror: bool = True) -> str:
     """Clone a repository from your account to dest_path.
 
+    mode: "full" (default) borrows objects from a local bare mirror with
+    --reference/--dissociate, so only objects newer than the mirror come over
+    the network and the clone stays independent of it. "shallow" (--depth 1)
+    and "blobless" (--filter=blob:none) skip the mirror.
+
     Returns the path to the cloned repo on success.
     """
+    mode = mode or DEFAULT_CLONE_MODE
+    if mode not in CLONE_MODES:
+        raise RuntimeError(f"Unknown clone mode {mode!r}; use one of {', '.join(CLONE_MODES)}.")
     info = find_repo_by_name(name)
     if not info:
         raise RuntimeError("Repository not found on your account.")
 
     dest = Path(dest_path).expanduser()
     dest.mkdir(parents=True, exist_ok=True)
-    target = dest / name
+    target = dest / info.name
     if target.exists():
         raise RuntimeError(f"Target path already exists: {target}")
 
-    # Use HTTPS clone with token in URL for private repos (safer to use local ssh keys if available)
-    repo_url = info.html_url
-    if info.private:
-        # insert token into https url: https://{token}@github.com/owner/repo.git
-        repo_url = repo_url.replace("https://", f"https://{GITHUB_TOKEN}@")
+    cmd = ["git", "clone"]
+    if mode == "shallow":
+        cmd += ["--depth", "1"]
+    elif mode == "blobless":
+        cmd += ["--filter=blob:none"]
+    elif use_mirror:
+        try:
+            cmd += ["--reference", ensure_mirror(info), "--dissociate"]
+        except RuntimeError as e:
+            print(f"Mirror unavailable, cloning directly: {e}")
 
-    code, out, err = _run_git(["git", "clone", repo_url, str(target)])
+    code, out, err = _run_git(cmd + [_clone_url(info), str(target)], timeout=CLONE_TIMEOUT, auth=True)
     if code != 0:
         raise RuntimeError(f"Git clone failed: {err or out}")
+    register_clone(str(target), info.name)
     return str(target)
 
 # --------------------- Local Git Operations ---------------------
@@ -141,63 +479,180 @@ def _assert_cloned_repo(path: str) -> Path:
         raise RuntimeError("Local path does not exist.")
     if not (p / ".git").exists():
         raise RuntimeError("Not a git repository (missing .git).")
+    register_clone(str(p))
     return p
 
 def git_commit(path: str, message: str) -> None:
     p = _assert_cloned_repo(path)
-    code, out, err = _run_git(["git", "add", "-A"], cwd=str(p))
+    code, out, err = _run_git(["git", "-C", str(p), "add", "-A"])
     if code != 0:
         raise RuntimeError(f"git add failed: {err or out}")
-    code, out, err = _run_git(["git", "commit", "-m", message], cwd=str(p))
+    code, out, err = _run_git(["git", "-C", str(p), "commit", "-m", message])
     if code != 0:
         # if nothing to commit, Git returns specific messages; surfacing that
         raise RuntimeError(f"git commit failed: {err or out}")
 
 def git_push(path: str, remote: str = "origin", branch: str = "main") -> None:
     p = _assert_cloned_repo(path)
-    code, out, err = _run_git(["git", "push", remote, branch], cwd=str(p))
+    code, out, err = _run_git(["git", "-C", str(p), "push", remote, branch], auth=True)
     if code != 0:
         raise RuntimeError(f"git push failed: {err or out}")
 
 def git_pull(path: str, remote: str = "origin", branch: str = "main") -> None:
     p = _assert_cloned_repo(path)
-    code, out, err = _run_git(["git", "pull", remote, branch], cwd=str(p))
+    code, out, err = _run_git(["git", "-C", str(p), "pull", remote, branch], auth=True)
     if code != 0:
         raise RuntimeError(f"git pull failed: {err or out}")
 
 def git_create_branch(path: str, branch: str) -> None:
     p = _assert_cloned_repo(path)
-    code, out, err = _run_git(["git", "checkout", "-b", branch], cwd=str(p))
+    code, out, err = _run_git(["git", "-C", str(p), "checkout", "-b", branch])
     if code != 0:
         raise RuntimeError(f"git branch create failed: {err or out}")
 
 def git_checkout_branch(path: str, branch: str) -> None:
     p = _assert_cloned_repo(path)
-    code, out, err = _run_git(["git", "checkout", branch], cwd=str(p))
+    code, out, err = _run_git(["git", "-C", str(p), "checkout", branch])
     if code != 0:
         raise RuntimeError(f"git checkout failed: {err or out}")
 
+# --------------------- Bulk Operations (all local clones) ---------------------
+
+@dataclass
+class GitResult:
+    path: str
+    ok: bool
+    output: str = ""
+    error: str = ""
+    elapsed: float = 0.0
+
+@dataclass
+class RepoStatus:
+    path: str
+    ok: bool
+    branch: str = ""
+    upstream: str = ""
+    ahead: int = 0
+    behind: int = 0
+    changed: int = 0
+    untracked: int = 0
+    error: str = ""
+
+    @property
+    def clean(self) -> bool:
+        return self.ok and not (self.changed or self.untracked or self.ahead or self.behind)
+
+_clones_lock = threading.Lock()
+
+def _load_clones() -> Dict[str, dict]:
+    try:
+        with open(CLONES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_clones(clones: Dict[str, dict]) -> None:
+    os.makedirs(os.path.dirname(CLONES_FILE) or ".", exist_ok=True)
+    with open(CLONES_FILE, "w", encoding="utf-8") as f:
+        json.dump(clones, f, indent=2)
+
+def register_clone(path: str, name: Optional[str] = None) -> None:
+    """Remember a local working copy for the *_all operations."""
+    path = str(Path(path).expanduser().resolve())
+    with _clones_lock:
+        clones = _load_clones()
+        if path not in clones:
+            clones[path] = {"name": name or Path(path).name, "added": time.time()}
+            _save_clones(clones)
+
+def unregister_clone(path: str) -> None:
+    path = str(Path(path).expanduser().resolve())
+    with _clones_lock:
+        clones = _load_clones()
+        if clones.pop(path, None) is not None:
+            _save_clones(clones)
+
+def list_clones() -> List[str]:
+    """Registered clones that still exist on disk."""
+    with _clones_lock:
+        clones = _load_clones()
+    return [p for p in clones if (Path(p) / ".git").exists()]
+
+def _run_all(task: Callable[[str], object], paths: List[str], progress=None, workers: int = GIT_WORKERS) -> list:
+    """Run task(path) over paths with at most `workers` git processes at once.
+
+    progress(done, total, result) is called as each repo finishes; results
+    come back in the order of paths.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths) or 1)), thread_name_prefix="git") as pool:
+        futures = {pool.submit(task, p): p for p in paths}
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results[futures[future]] = result
+            if progress:
+                progress(done, len(paths), result)
+    return [results[p] for p in paths]
+
+def _parse_status_v2(path: str, text: str) -> RepoStatus:
+    st = RepoStatus(path=path, ok=True)
+    for line in text.splitlines():
+        if line.startswith("# branch.head "):
+            st.branch = line.split(" ", 2)[2]
+        elif line.startswith("# branch.upstream "):
+            st.upstream = line.split(" ", 2)[2]
+        elif line.startswith("# branch.ab "):
+            ahead, behind = line.split()[2:4]
+            st.ahead, st.behind = int(ahead), -int(behind)
+        elif line.startswith(("1 ", "2 ", "u ")):
+            st.changed += 1
+        elif line.startswith("? "):
+            st.untracked += 1
+    return st
+
+def _status_one(path: str) -> RepoStatus:
+    # One process per repo: branch, ahead/behind and changes from a single status call
+    code, out, err = _run_git(["git", "-C", path, "status", "--porcelain=v2", "--branch"], timeout=GIT_TIMEOUT)
+    if code != 0:
+        return RepoStatus(path=path, ok=False, error=err or out)
+    return _parse_status_v2(path, out)
+
+def _pull_one(path: str) -> GitResult:
+    start = time.perf_counter()
+    code, out, err = _run_git(["git", "-C", path, "pull", "--ff-only", "--quiet"], timeout=GIT_TIMEOUT, auth=True)
+    return GitResult(path, code == 0, out, err if code else "", time.perf_counter() - start)
+
+def git_status_all(progress=None, workers: int = GIT_WORKERS) -> List[RepoStatus]:
+    """Status of every registered clone, checked in parallel."""
+    return _run_all(_status_one, list_clones(), progress, workers)
+
+def git_pull_all(progress=None, workers: int = GIT_WORKERS) -> List[GitResult]:
+    """Fast-forward every registered clone from its upstream, in parallel."""
+    return _run_all(_pull_one, list_clones(), progress, workers)
+
 # --------------------- Search / Star / Unstar ---------------------
 
+def rate_limit_status() -> dict:
+    """Remaining API budget per resource plus scheduler/cache metrics."""
+    return GetRateLimiter().snapshot()
+
+
+def _graphql():
+    """Async GraphQL backend (imported on first search; it imports this module)."""
+    if __package__:
+        from Backend import GithubAsync
+    else:
+        import GithubAsync  # running this file directly from Backend/
+    return GithubAsync
+
 def search_repos(query: str, limit: int = 10) -> List[RepoInfo]:
-    gh = _get_client()
-    res = gh.search_repositories(query)  # returns PaginatedList
-    out = []
-    for i, r in enumerate(res):
-        if i >= limit:
-            break
-        out.append(RepoInfo(name=r.name, full_name=r.full_name, private=r.private, html_url=r.html_url))
-    return out
+    """One GraphQL request fetching only the RepoInfo fields."""
+    gql = _graphql()
+    return gql.run_sync(gql.GetGithubGraphQL().search_repos(query, limit))
 
 def search_users(query: str, limit: int = 10) -> List[Tuple[str, str]]:
-    gh = _get_client()
-    res = gh.search_users(query)
-    out = []
-    for i, u in enumerate(res):
-        if i >= limit:
-            break
-        out.append((u.login, u.html_url))
-    return out
+    gql = _graphql()
+    return gql.run_sync(gql.GetGithubGraphQL().search_users(query, limit))
 
 if __name__ == "__main__":
     while True:
@@ -215,6 +670,9 @@ if __name__ == "__main__":
         print("11. Checkout Branch")
         print("12. Search Repos")
         print("13. Search Users")
+        print("14. Status of All Clones")
+        print("15. Pull All Clones")
+        print("16. Refresh Mirrors")
         print("0. Exit")
         choice = input("Select option: ").strip()
 
@@ -273,6 +731,14 @@ if __name__ == "__main__":
                 query = input("Search users: ")
                 for u in search_users(query):
                     print(u)
+            elif choice == "14":
+                for st in git_status_all():
+                    print(st)
+            elif choice == "15":
+                git_pull_all(progress=lambda done, total, r: print(f"[{done}/{total}] {r.path}: {'ok' if r.ok else r.error}"))
+            elif choice == "16":
+                for r in refresh_all_mirrors():
+                    print(r)
             elif choice == "0":
                 break
             else:
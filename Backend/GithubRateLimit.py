@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+# ============ CONFIG ============
+LOW_WATER = 0.1       # below this fraction of the budget, spread calls out until the reset
+MAX_WAIT = 20.0       # total throttling per call; longer waits fail fast instead of stalling a voice command
+MAX_RETRIES = 2       # re-sends after a 403/429 rate-limit response
+SEARCH_TTL = 120.0
+SEARCH_CACHE_SIZE = 256
+
+class RateLimitedError(RuntimeError):
+    pass
+
+@dataclass
+class Budget:
+    limit: int
+    remaining: int
+    reset: float      # epoch seconds
+    used: int = 0
+
+# ============ SCHEDULER ============
+class RateLimitScheduler:
+    """Tracks GitHub's X-RateLimit-* headers per resource and paces calls.
+
+    Each call reserves the next free slot for its resource. While the budget
+    is healthy slots are back to back; below LOW_WATER the remaining calls
+    are spread evenly until the window resets; at zero they wait for the
+    reset. Reservations are plain arithmetic under a lock, so sync (RepoCache)
+    and async (GraphQL) callers share one queue.
+    """
+
+    def __init__(self):
+        self.budgets: Dict[str, Budget] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.metrics = {"requests": 0, "throttled": 0, "waited_seconds": 0.0, "retries": 0,
+                        "cache_hits": 0, "cache_misses": 0}
+
+    def _spacing(self, resource: str, now: float) -> float:
+        b = self.budgets.get(resource)
+        if b is None or b.reset <= now or b.remaining >= LOW_WATER * b.limit:
+            return 0.0
+        return (b.reset - now) / max(b.remaining, 1)
+
+    def reserve(self, resource: str, max_wait: float = MAX_WAIT) -> float:
+        """Seconds the caller must wait before sending; raises RateLimitedError beyond max_wait."""
+        now = time.time()
+        with self._lock:
+            b = self.budgets.get(resource)
+            slot = max(now, self._next_slot.get(resource, 0.0))
+            if b is not None and b.remaining <= 0 and b.reset > now:
+                slot = max(slot, b.reset + 1)
+            delay = slot - now
+            if delay > max_wait:
+                raise RateLimitedError(f"GitHub {resource} rate limit exhausted; resets in {b.reset - now if b else delay:.0f}s")
+            self._next_slot[resource] = slot + self._spacing(resource, now)
+            if b is not None and b.reset > now:
+                b.remaining -= 1  # corrected by the next response's headers
+            self.metrics["requests"] += 1
+            if delay > 0:
+                self.metrics["throttled"] += 1
+                self.metrics["waited_seconds"] += delay
+            return delay
+
+    async def acquire(self, resource: str, max_wait: float = MAX_WAIT) -> float:
+        """Wait for a slot; returns the seconds waited."""
+        delay = self.reserve(resource, max_wait)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def acquire_sync(self, resource: str, max_wait: float = MAX_WAIT) -> float:
+        delay = self.reserve(resource, max_wait)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def observe(self, headers, default_resource: str = "core") -> Optional[str]:
+        """Record the budget from a response's headers. Returns the resource name."""
+        if "x-ratelimit-remaining" not in headers:
+            return None
+        resource = headers.get("x-ratelimit-resource", default_resource)
+        try:
+            budget = Budget(int(headers["x-ratelimit-limit"]), int(headers["x-ratelimit-remaining"]),
+                            float(headers["x-ratelimit-reset"]), int(headers.get("x-ratelimit-used", 0)))
+        except (KeyError, ValueError):
+            return resource
+        with self._lock:
+            self.budgets[resource] = budget
+        return resource
+
+    def retry_delay(self, status: int, headers) -> Optional[float]:
+        """Seconds to wait before re-sending a rate-limited response, or None if not rate limited."""
+        if status not in (403, 429):
+            return None
+        if "retry-after" in headers:  # secondary (abuse) limits
+            try:
+                return float(headers["retry-after"])
+            except ValueError:
+                return None
+        if headers.get("x-ratelimit-remaining") == "0":
+            try:
+                return max(0.0, float(headers["x-ratelimit-reset"]) - time.time()) + 1
+            except (KeyError, ValueError):
+                return None
+        return None
+
+    def note_retry(self, delay: float):
+        with self._lock:
+            self.metrics["retries"] += 1
+            self.metrics["waited_seconds"] += delay
+
+    def snapshot(self) -> dict:
+        """Metrics plus the remaining budget per resource."""
+        now = time.time()
+        with self._lock:
+            return {
+                **self.metrics,
+                "budgets": {r: {"remaining": b.remaining, "limit": b.limit, "reset_in": max(0, round(b.reset - now))}
+                            for r, b in self.budgets.items()},
+            }
+
+# ============ RESPONSE CACHE ============
+class TTLCache:
+    """Small LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(self, ttl: float = SEARCH_TTL, maxsize: int = SEARCH_CACHE_SIZE, metrics: Optional[dict] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.metrics = metrics
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            item = self._data.get(key)
+            hit = item is not None and item[0] > time.monotonic()
+            if hit:
+                self._data.move_to_end(key)
+            elif item is not None:
+                del self._data[key]
+            if self.metrics is not None:
+                self.metrics["cache_hits" if hit else "cache_misses"] += 1
+            return item[1] if hit else None
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+_scheduler: Optional[RateLimitScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def GetRateLimiter() -> RateLimitScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RateLimitScheduler()
+        return _scheduler
@@ -1,11 +1,20 @@
 import asyncio
+import hashlib
+import itertools
 import os
 import platform
-from urllib.parse import quote_plus
+import subprocess
+import threading
+from concurrent.futures import Future
+from urllib.parse import quote_plus, urlencode
 import httpx
 import aiofiles
-from functools import partial
-from random import randint, uniform
+from random import randint, sample, uniform
+
+if __package__:
+    from Backend.ImageStore import GetImageStore
+else:
+    from ImageStore import GetImageStore  # running this file directly from Backend/
 
 # ============ CONFIG ============
 POLLINATIONS_BASE = "https://image.pollinations.ai/prompt/"
@@ -15,48 +24,116 @@ TRIGGER_FILE = r"Frontend\Files\ImageGeneration.data"
 AUTO_OPEN_IMAGES = True  # True / False
 REQUEST_TIMEOUT = 60
 RETRY_ATTEMPTS = 3
+MAX_CONCURRENT_JOBS = 2
+DEFAULT_SIZE = (1024, 1024)
+DEFAULT_VARIANTS = 4   # images per prompt, each with its own seed
+SEED_HISTORY = 1000    # stored seeds per prompt that new requests avoid
+HEDGE_AFTER = 30.0     # seconds without a body byte before a duplicate request; Pollinations
+                       # renders before responding, so this sits above a normal render time
+STREAM_CHUNK = 64 * 1024
 
 # Ensure the Data folder exists
 os.makedirs(DATA_FOLDER, exist_ok=True)
 
 # ============ UTILITIES ============
-def build_pollinations_url(prompt: str) -> str:
+def build_pollinations_url(prompt: str, size=None, seed=None) -> str:
     """Return a safe Pollinations URL for the prompt."""
-    return f"{POLLINATIONS_BASE}{quote_plus(prompt)}"
+    params = {}
+    if size:
+        params["width"], params["height"] = size
+    if seed is not None:
+        params["seed"] = seed
+    query = f"?{urlencode(params)}" if params else ""
+    return f"{POLLINATIONS_BASE}{quote_plus(prompt)}{query}"
 
 def open_image_nonblocking(path: str):
-    """Open an image using the system's default viewer (non-blocking)."""
+    """Open an image using the system's default viewer without waiting for it.
+
+    Called from the job queue's event loop, so it must never block.
+    """
     try:
         if platform.system() == "Windows":
             os.startfile(path)
-        elif platform.system() == "Darwin":
-            os.system(f'open "{path}"')  # macOS
         else:
-            os.system(f'xdg-open "{path}"')  # Linux
+            opener = "open" if platform.system() == "Darwin" else "xdg-open"
+            subprocess.Popen([opener, path], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
     except Exception as e:
         print(f"⚠️ Could not auto-open {path}: {e}")
 
-def sync_write_file(path: str, content: bytes):
-    """Blocking file write (used with run_in_executor for speed)."""
-    with open(path, "wb") as f:
-        f.write(content)
+# ============ IMAGE FETCH ============
+async def stream_to_file(url: str, client: httpx.AsyncClient, path: str, first_byte: asyncio.Event | None = None):
+    """Stream the response body straight to path; path is removed if the download fails.
 
-async def save_image(path: str, content: bytes):
-    """Save image asynchronously (threaded write)."""
-    loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, partial(sync_write_file, path, content))
-    print(f"✅ Saved -> {path}")
-    return path
+    Returns (path, sha256 hex digest), hashed while the bytes are written.
+    first_byte is set when the first body chunk arrives.
+    """
+    try:
+        async with client.stream("GET", url, timeout=REQUEST_TIMEOUT) as resp:
+            resp.raise_for_status()
+            size = 0
+            hasher = hashlib.sha256()
+            async with aiofiles.open(path, "wb") as f:
+                async for chunk in resp.aiter_bytes(STREAM_CHUNK):
+                    if first_byte and chunk:
+                        first_byte.set()
+                    await f.write(chunk)
+                    hasher.update(chunk)
+                    size += len(chunk)
+        if not size:
+            raise httpx.RequestError("empty image response")
+        return path, hasher.hexdigest()
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
 
-# ============ IMAGE FETCH ============
-async def fetch_image_bytes(url: str, client: httpx.AsyncClient, retries: int = RETRY_ATTEMPTS):
-    """Fetch image bytes with retry + jitter backoff."""
+async def hedged_fetch(url: str, client: httpx.AsyncClient, path: str):
+    """Fetch url into path; if no body byte arrives within HEDGE_AFTER seconds,
+    fire a duplicate request and keep whichever finishes first.
+
+    Each attempt downloads to its own .part file and only the winner is moved
+    to path, so a late loser can never overwrite it.
+    """
+    first_byte = asyncio.Event()
+    parts = [f"{path}.0.part"]
+    attempts = [asyncio.create_task(stream_to_file(url, client, parts[0], first_byte))]
+    try:
+        waiter = asyncio.create_task(first_byte.wait())
+        try:
+            await asyncio.wait({attempts[0], waiter}, timeout=HEDGE_AFTER, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if not first_byte.is_set() and not attempts[0].done():
+            parts.append(f"{path}.1.part")
+            attempts.append(asyncio.create_task(stream_to_file(url, client, parts[1])))
+
+        pending = set(attempts)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    part, digest = task.result()
+                    os.replace(part, path)
+                    return path, digest
+                error = task.exception()
+        raise error
+    finally:
+        losers = [task for task in attempts if not task.done()]
+        for task in losers:
+            task.cancel()
+        await asyncio.gather(*losers, return_exceptions=True)
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+
+async def fetch_image(url: str, client: httpx.AsyncClient, path: str, retries: int = RETRY_ATTEMPTS):
+    """Hedged, streamed fetch with retry + jitter backoff. Returns (path, digest) or None."""
     delay = 1.0
     for attempt in range(1, retries + 1):
         try:
-            resp = await client.get(url, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            return resp.content
+            return await hedged_fetch(url, client, path)
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             if attempt < retries:
                 jitter = uniform(0.5, 1.5)
@@ -71,27 +148,167 @@ async def fetch_image_bytes(url: str, client: httpx.AsyncClient, retries: int =
             print(f"❌ Unexpected error fetching image: {e}")
             return None
 
-async def generate_image(prompt: str, client: httpx.AsyncClient):
-    """Generate a single image using Pollinations and save it."""
-    url = build_pollinations_url(f"{prompt}, seed={randint(10000, 99999)}")
-    content = await fetch_image_bytes(url, client)
-    if not content:
+async def generate_image(prompt: str, client: httpx.AsyncClient, size=DEFAULT_SIZE, seed=None):
+    """Generate a single image using Pollinations and store it. Returns the path or None.
+
+    Exact repeats of (prompt, seed, size) are served from the image store
+    without touching the network.
+    """
+    store = GetImageStore()
+    seed = randint(10000, 99999) if seed is None else seed
+    cached = await asyncio.to_thread(store.lookup, prompt, seed, size)
+    if cached:
+        print(f"♻️ Cached -> {cached}")
+        return cached
+
+    url = build_pollinations_url(prompt, size=size, seed=seed)
+    fetched = await fetch_image(url, client, store.staging_path())
+    if not fetched:
         print("⚠️ No image was saved (request failed).")
-        return
+        return None
+    path = await asyncio.to_thread(store.add_file, prompt, seed, size, *fetched)
+    print(f"✅ Saved -> {path}")
+    return path
+
+def ShowImage(query: str = "", limit: int = 1) -> bool:
+    """Re-open previously generated images matching query (newest first), no network."""
+    matches = GetImageStore().find(query, limit=limit)
+    for _, path in matches:
+        open_image_nonblocking(path)
+    return bool(matches)
+
+# ============ JOB QUEUE ============
+class ImageJob:
+    """Handle for one submitted prompt. status: queued/running/done/failed/cancelled."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, prompt: str, n: int, size, reuse: bool = False):
+        self.id = next(self._ids)
+        self.prompt = prompt
+        self.n = n
+        self.size = size
+        self.reuse = reuse
+        self.status = "queued"
+        self.paths = []
+        self.completed = 0
+        self.error = None
+        self.future: Future | None = None
+
+    def cancel(self) -> bool:
+        return bool(self.future and self.future.cancel())
+
+    def result(self, timeout=None):
+        """Block until the job finishes and return the saved image paths."""
+        return self.future.result(timeout)
+
+    def __repr__(self):
+        return f"<ImageJob {self.id} {self.status} {self.completed}/{self.n} {self.prompt!r}>"
+
+class ImageJobQueue:
+    """In-process image generation: one event loop thread, one shared HTTP client.
+
+    submit() is thread-safe and returns immediately. At most
+    MAX_CONCURRENT_JOBS jobs fetch at once; listeners are called (from the
+    queue's thread) whenever a job changes state or finishes an image.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_JOBS):
+        self.max_concurrent = max_concurrent
+        self.listeners = []
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name="ImageJobQueue", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        self.client = httpx.AsyncClient(limits=limits, timeout=REQUEST_TIMEOUT)
+        self._ready.set()
+        self.loop.run_forever()
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def _emit(self, job: ImageJob):
+        for callback in list(self.listeners):
+            try:
+                callback(job)
+            except Exception as e:
+                print(f"⚠️ Image job listener failed: {e}")
+
+    def submit(self, prompt: str, n: int = DEFAULT_VARIANTS, size=DEFAULT_SIZE, reuse: bool = False) -> ImageJob:
+        """Queue a prompt. New requests always get new variants; reuse=True (an
+        explicit repeat) serves the most recent stored variants first."""
+        job = ImageJob(prompt, n, size, reuse)
+        job.future = asyncio.run_coroutine_threadsafe(self._run_job(job), self.loop)
+        job.future.add_done_callback(lambda f, job=job: self._finished(job, f))
+        self._emit(job)
+        return job
+
+    def _finished(self, job: ImageJob, future: Future):
+        if future.cancelled():
+            job.status = "cancelled"
+            self._emit(job)
+
+    async def _run_job(self, job: ImageJob):
+        async with self.semaphore:
+            job.status = "running"
+            self._emit(job)
+            try:
+                # Distinct seeds give distinct variants; they are fetched concurrently.
+                # Stored seeds are skipped so a new request never returns an old
+                # variant; only a repeat request reuses them (a cache hit).
+                store = GetImageStore()
+                taken = set(await asyncio.to_thread(store.seeds_for, job.prompt, job.size, SEED_HISTORY))
+                seeds = await asyncio.to_thread(store.seeds_for, job.prompt, job.size, job.n) if job.reuse else []
+                fresh = [x for x in sample(range(10000, 100000), job.n * 2) if x not in taken]
+                seeds += fresh[:job.n - len(seeds)]
+
+                async def one(seed):
+                    path = await generate_image(job.prompt, self.client, size=job.size, seed=seed)
+                    if path:
+                        job.paths.append(path)
+                        # Show the first variant as soon as it lands
+                        if AUTO_OPEN_IMAGES and len(job.paths) == 1:
+                            open_image_nonblocking(path)
+                    job.completed += 1
+                    self._emit(job)
+                    return path
 
-    safe_name = "".join(c if c.isalnum() or c in (" ", "_", "-") else "_" for c in prompt).strip().replace(" ", "_")
-    image_path = os.path.join(DATA_FOLDER, f"{safe_name}_1.png")
+                await asyncio.gather(*(one(seed) for seed in seeds))
+            except Exception as e:
+                job.status, job.error = "failed", e
+                self._emit(job)
+                raise
+            job.status = "done" if job.paths else "failed"
+            print("✨ Done")
+            self._emit(job)
+            return list(job.paths)
 
-    saved_path = await save_image(image_path, content)
+    def close(self):
+        async def _close():
+            await self.client.aclose()
+            self.loop.stop()
+        asyncio.run_coroutine_threadsafe(_close(), self.loop)
 
-    if AUTO_OPEN_IMAGES:
-        open_image_nonblocking(saved_path)
+_queue: ImageJobQueue | None = None
+_queue_lock = threading.Lock()
 
-    print("✨ Done")
+def GetImageQueue() -> ImageJobQueue:
+    """Process-wide image job queue, started on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ImageJobQueue()
+        return _queue
 
-# ============ FILE WATCHER ============
-async def watch_trigger_file(client: httpx.AsyncClient):
-    """Watch the trigger file and run image generation when requested."""
+# ============ FILE TRIGGER (compatibility) ============
+async def watch_trigger_file(queue: ImageJobQueue):
+    """Legacy adapter: turn writes to the trigger file into queue submissions."""
     last_data = None
     while True:
         try:
@@ -107,7 +324,7 @@ async def watch_trigger_file(client: httpx.AsyncClient):
 
                     if status == "true" and prompt:
                         print("🚀 Generating Image (Pollinations)...")
-                        asyncio.create_task(generate_image(prompt, client))
+                        queue.submit(prompt)
 
                         # Reset trigger file
                         async with aiofiles.open(TRIGGER_FILE, "w") as fw:
@@ -123,9 +340,7 @@ async def watch_trigger_file(client: httpx.AsyncClient):
 
 # ============ ENTRY POINT ============
 async def main():
-    limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
-    async with httpx.AsyncClient(limits=limits, timeout=REQUEST_TIMEOUT) as client:
-        await watch_trigger_file(client)
+    await watch_trigger_file(GetImageQueue())
 
 if __name__ == "__main__":
     asyncio.run(main())
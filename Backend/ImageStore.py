@@ -0,0 +1,199 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+# ============ CONFIG ============
+STORE_FOLDER = os.path.join("Data", "Images")
+INDEX_FILE = os.path.join(STORE_FOLDER, "index.sqlite3")
+QUOTA_BYTES = 2 * 1024 ** 3   # evict least recently used images beyond this
+
+# ============ STORE ============
+class ImageStore:
+    """Content-addressed store for generated images.
+
+    Files live at <root>/<hash[:2]>/<hash>.png, so identical images are kept
+    once no matter how many prompts produced them. A SQLite index maps
+    (prompt, seed, width, height) to a content hash, which makes exact repeats
+    a local lookup. Least recently used entries are evicted past the quota.
+    """
+
+    def __init__(self, root: str = STORE_FOLDER, index_file: str = INDEX_FILE, quota_bytes: int = QUOTA_BYTES):
+        self.root = root
+        self.quota_bytes = quota_bytes
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(index_file, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                bytes INTEGER NOT NULL,
+                created REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS images (
+                prompt TEXT NOT NULL,
+                seed INTEGER NOT NULL,
+                width INTEGER NOT NULL,
+                height INTEGER NOT NULL,
+                hash TEXT NOT NULL REFERENCES blobs(hash),
+                created REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (prompt, seed, width, height)
+            );
+            CREATE INDEX IF NOT EXISTS images_access ON images(last_access);
+            CREATE INDEX IF NOT EXISTS images_hash ON images(hash);
+        """)
+        self._db.commit()
+
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        return " ".join(prompt.lower().split())
+
+    def staging_path(self) -> str:
+        """Temporary path for a download before it is hashed into the store."""
+        return os.path.join(self.root, "tmp", f"{uuid.uuid4().hex}.png")
+
+    @staticmethod
+    def escape_like(text: str) -> str:
+        """Escape LIKE wildcards so text matches literally (with ESCAPE '\\')."""
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.png")
+
+    # ---------------- Lookups ----------------
+    def lookup(self, prompt: str, seed: int, size: Tuple[int, int]) -> Optional[str]:
+        """Path of the exact (prompt, seed, size) image if it is stored."""
+        key = (self.normalize(prompt), seed, size[0], size[1])
+        with self._lock:
+            row = self._db.execute(
+                "SELECT b.path FROM images i JOIN blobs b ON b.hash = i.hash "
+                "WHERE i.prompt = ? AND i.seed = ? AND i.width = ? AND i.height = ?", key,
+            ).fetchone()
+            if row and os.path.exists(row[0]):
+                self._db.execute(
+                    "UPDATE images SET last_access = ? WHERE prompt = ? AND seed = ? AND width = ? AND height = ?",
+                    (time.time(), *key),
+                )
+                self._db.commit()
+                return row[0]
+        return None
+
+    def seeds_for(self, prompt: str, size: Tuple[int, int], limit: int) -> List[int]:
+        """Seeds already generated for this prompt/size, most recent first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seed FROM images WHERE prompt = ? AND width = ? AND height = ? "
+                "ORDER BY created DESC LIMIT ?",
+                (self.normalize(prompt), size[0], size[1], limit),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def find(self, text: str = "", limit: int = 4) -> List[Tuple[str, str]]:
+        """(prompt, path) of the most recent images whose prompt contains text."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT i.prompt, b.path FROM images i JOIN blobs b ON b.hash = i.hash "
+                "WHERE i.prompt LIKE ? ESCAPE '\\' ORDER BY i.created DESC LIMIT ?",
+                (f"%{self.escape_like(self.normalize(text))}%", limit),
+            ).fetchall()
+        return [(p, path) for p, path in rows if os.path.exists(path)]
+
+    def all_images(self) -> List[Tuple[str, str, float]]:
+        """(prompt, path, created) for every stored image, newest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT i.prompt, b.path, i.created FROM images i JOIN blobs b ON b.hash = i.hash "
+                "ORDER BY i.created DESC"
+            ).fetchall()
+        return rows
+
+    # ---------------- Writes ----------------
+    def add_file(self, prompt: str, seed: int, size: Tuple[int, int], staged_path: str, digest: Optional[str] = None) -> str:
+        """Move a downloaded file into the store and index it. Returns the stored path."""
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(staged_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+        path = self.blob_path(digest)
+        now = time.time()
+        key = (self.normalize(prompt), seed, size[0], size[1])
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT hash FROM images WHERE prompt = ? AND seed = ? AND width = ? AND height = ?", key,
+            ).fetchone()
+            if os.path.exists(path):
+                os.remove(staged_path)  # duplicate content, keep the existing copy
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                shutil.move(staged_path, path)
+            self._db.execute(
+                "INSERT OR IGNORE INTO blobs (hash, path, bytes, created) VALUES (?, ?, ?, ?)",
+                (digest, path, os.path.getsize(path), now),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO images (prompt, seed, width, height, hash, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, digest, now, now),
+            )
+            if previous and previous[0] != digest:
+                self._drop_blob_if_unused(previous[0])  # the replaced row was its last reference
+            self._db.commit()
+        self.evict()
+        return path
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM blobs").fetchone()[0]
+
+    def evict(self) -> int:
+        """Drop least recently used entries until under quota. Returns bytes freed."""
+        freed = 0
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM blobs").fetchone()[0]
+            while total > self.quota_bytes:
+                row = self._db.execute(
+                    "SELECT rowid, hash FROM images ORDER BY last_access ASC LIMIT 1"
+                ).fetchone()
+                if not row:
+                    break
+                rowid, digest = row
+                self._db.execute("DELETE FROM images WHERE rowid = ?", (rowid,))
+                size = self._drop_blob_if_unused(digest)
+                total -= size
+                freed += size
+            self._db.commit()
+        return freed
+
+    def _drop_blob_if_unused(self, digest: str) -> int:
+        """Delete a blob no image row references any more. Caller holds the lock. Returns bytes freed."""
+        if self._db.execute("SELECT 1 FROM images WHERE hash = ? LIMIT 1", (digest,)).fetchone():
+            return 0
+        row = self._db.execute("SELECT path, bytes FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if not row:
+            return 0
+        path, size = row
+        self._db.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return size
+
+_store: ImageStore | None = None
+_store_lock = threading.Lock()
+
+def GetImageStore() -> ImageStore:
+    """Process-wide image store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ImageStore()
+        return _store
@@ -0,0 +1,150 @@
+import importlib
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# ============ REGISTRY ============
+# name -> (module path, attribute). Modules are imported on first use so the
+# GUI can come up before cohere/groq/selenium/pygame/... have been loaded.
+_registry: Dict[str, tuple] = {}
+_loaded: Dict[str, object] = {}
+_load_times: Dict[str, float] = {}
+_lock = threading.RLock()                       # guards the dicts only, never held across an import
+_name_locks: Dict[str, threading.Lock] = {}     # one per backend: a slow import only blocks its own name
+
+def Register(name: str, module: str, attr: Optional[str] = None) -> None:
+    """Register a lazily imported backend under a short name."""
+    with _lock:
+        _registry[name] = (module, attr)
+
+def Load(name: str):
+    """Import the registered module on first use and return the target."""
+    target = _loaded.get(name)
+    if target is not None:
+        return target
+    with _lock:
+        module_name, attr = _registry[name]
+        name_lock = _name_locks.setdefault(name, threading.Lock())
+    with name_lock:
+        target = _loaded.get(name)
+        if target is not None:
+            return target
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        target = getattr(module, attr) if attr else module
+        _load_times[name] = time.perf_counter() - start
+        _loaded[name] = target
+        return target
+
+def IsLoaded(name: str) -> bool:
+    return name in _loaded
+
+def LoadTimes() -> Dict[str, float]:
+    """Seconds spent importing each backend that has been loaded so far."""
+    return dict(_load_times)
+
+class Lazy:
+    """Callable proxy that resolves a registered backend on first call."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        return Load(self.name)(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<Lazy {self.name} loaded={IsLoaded(self.name)}>"
+
+def Warm(names: Optional[List[str]] = None, on_error: Optional[Callable[[str, Exception], None]] = None) -> threading.Thread:
+    """Import backends in a daemon thread so they are ready by the first query."""
+    names = list(names if names is not None else _registry)
+
+    def _warm():
+        for name in names:
+            try:
+                Load(name)
+            except Exception as e:
+                if on_error:
+                    on_error(name, e)
+                else:
+                    print(f"Warm-up of {name} failed: {e}")
+
+    thread = threading.Thread(target=_warm, name="BackendWarmup", daemon=True)
+    thread.start()
+    return thread
+
+# ============ STARTUP PROFILE ============
+_importtime_line = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def ParseImportTime(stderr: str) -> List[dict]:
+    """Parse `python -X importtime` output into rows of self/cumulative µs."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _importtime_line.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        rows.append({
+            "module": module,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": max(len(indent) - 1, 0) // 2,
+        })
+    return rows
+
+def StartupProfile(modules: Optional[List[str]] = None, top: int = 25) -> List[dict]:
+    """Import the given modules under `-X importtime` and print a timing table."""
+    if modules is None:
+        modules = ["Frontend.GUI"] + [module for module, _ in _registry.values()]
+    code = "; ".join(f"import {m}" for m in dict.fromkeys(modules))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=False,
+    )
+    rows = ParseImportTime(proc.stderr)
+    if proc.returncode != 0:
+        print(f"Startup profile import failed:\n{proc.stderr.splitlines()[-1] if proc.stderr else ''}")
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    requested = [r for r in rows if r["module"] in modules]
+    table = Table(title="Requested modules (cumulative import time)")
+    table.add_column("Module")
+    table.add_column("Cumulative ms", justify="right")
+    for r in sorted(requested, key=lambda r: r["cumulative_us"], reverse=True):
+        table.add_row(r["module"], f"{r['cumulative_us'] / 1000:.1f}")
+    console.print(table)
+
+    table = Table(title=f"Top {top} modules by self time")
+    table.add_column("Module")
+    table.add_column("Self ms", justify="right")
+    table.add_column("Cumulative ms", justify="right")
+    for r in sorted(rows, key=lambda r: r["self_us"], reverse=True)[:top]:
+        table.add_row(r["module"], f"{r['self_us'] / 1000:.1f}", f"{r['cumulative_us'] / 1000:.1f}")
+    console.print(table)
+
+    total = sum(r["self_us"] for r in rows) / 1000
+    console.print(f"Total import time: {total:.1f} ms across {len(rows)} modules")
+    return rows
+
+# ============ DEFAULT BACKENDS ============
+Register("model", "Backend.Model", "FirstLayerDMM")
+Register("fastpath", "Backend.Model", "FastPathDMM")
+Register("realtime", "Backend.RealtimeSearchEngine", "RealtimeSearchEngine")
+Register("automation", "Backend.Automation", "Automation")
+Register("commands", "Backend.Automation", "dispatcher")
+Register("stt", "Backend.SpeechToText", "SpeechRecognition")
+Register("chatbot", "Backend.Chatbot", "ChatBot")
+Register("tts", "Backend.TextToSpeech", "TextToSpeech")
+Register("images", "Backend.ImageGeneration", "GetImageQueue")
+Register("showimage", "Backend.ImageGeneration", "ShowImage")
+Register("sysmon", "Backend.SystemMonitor", "SystemStatusReport")
+Register("whatsapp", "Backend.WhatsAppQueue", "ResumeOutbox")
+
+if __name__ == "__main__":
+    StartupProfile()
@@ -1,3 +1,4 @@
+import re
 import cohere
 from rich import print
 from dotenv import dotenv_values
@@ -10,7 +11,7 @@ funcs = {
     "exit", "general", "realtime", "open", "close", 
     "play", "generate image", "system", "content",
     "google search", "youtube search", "reminder",
-    "tired", "whatsapp",
+    "tired", "whatsapp", "system status", "show image",
 }
 
 preamble = """
@@ -24,8 +25,10 @@ You will decide whether a query is a 'general' query, a 'realtime' query, or is
 -> Respond with 'close (application name)' if a query is asking to close any application.
 -> Respond with 'play (song name)' if a query is asking to play any song.
 -> Respond with 'generate image (image prompt)' if a query is requesting to generate an image.
+-> Respond with 'show image (image prompt)' if a query asks to show an image that was generated before; use just 'show image' for the last one.
 -> Respond with 'reminder (datetime with message)' if a query is requesting to set a reminder.
 -> Respond with 'system (task name)' if a query is asking to mute, unmute, volume up, etc.
+-> Respond with 'system status' if a query is asking how the computer/system is doing or performing.
 -> Respond with 'content (topic)' if a query is asking to write any type of content.
 -> Respond with 'google search (topic)' if a query is asking to search something on Google.
 -> Respond with 'youtube search (topic)' if a query is asking to search something on YouTube.
@@ -53,12 +56,43 @@ def parse_response(raw: str) -> list[str]:
         if any(task.strip().startswith(func) for func in funcs)
     ]
 
+# Local fast path: unambiguous single commands that don't need the LLM.
+# Anything with a conjunction or comma may carry several intents -> Cohere.
+fast_patterns = [
+    (re.compile(r"^(open|close|play) (?!the |a |an )(.+)$"), lambda m: f"{m.group(1)} {m.group(2)}"),
+    (re.compile(r"^(google|youtube) search (?:for )?(.+)$"), lambda m: f"{m.group(1)} search {m.group(2)}"),
+    (re.compile(r"^search (google|youtube) for (.+)$"), lambda m: f"{m.group(1)} search {m.group(2)}"),
+    (re.compile(r"^(?:good ?bye|bye)(?: jarvis)?$"), lambda m: "exit"),
+    (re.compile(r"^show (?:me )?(?:that|the last|my last|the) image(?: again)?$"), lambda m: "show image"),
+    (re.compile(r"^(?:how'?s|how is) my (?:system|computer|pc|laptop)(?: doing| running| performing)?$|^system status$"),
+     lambda m: "system status"),
+]
+multi_intent = re.compile(r"\band\b|,|\bthen\b|\balso\b")
+
+def FastPathDMM(prompt: str) -> list[str] | None:
+    """Classify obvious commands locally. Returns None when the LLM is needed.
+
+    Safe to call with partial transcripts while the user is still speaking.
+    """
+    text = prompt.strip().lower().rstrip(".!?").strip()
+    if not text or multi_intent.search(text):
+        return None
+    for pattern, build in fast_patterns:
+        match = pattern.match(text)
+        if match:
+            return [build(match)]
+    return None
+
 def FirstLayerDMM(prompt: str) -> list[str]:
     """Classify the query into a task type, with special handling for 'tired'"""
     
     # Special keyword check
     if "tired" in prompt.lower():
         return ["tired"]
+
+    fast = FastPathDMM(prompt)
+    if fast:
+        return fast
     
     stream = co.chat_stream(
         model="command-r-plus",
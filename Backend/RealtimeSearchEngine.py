@@ -2,13 +2,11 @@ import asyncio
 import httpx
 from ddgs import DDGS
 from groq import Groq
-from json import load, dump
 import datetime
 from dotenv import dotenv_values
 import wikipedia
 import tzlocal
 import re
-import os
 
 # ==============================
 # Load Environment Variables
@@ -45,15 +43,13 @@ You provide accurate, real-time, up-to-date information from the internet.
 # ==============================
 # Chat Log Setup
 # ==============================
-CHAT_LOG_PATH = r"Data\ChatLog.json"
-os.makedirs(os.path.dirname(CHAT_LOG_PATH), exist_ok=True)
-try:
-    with open(CHAT_LOG_PATH, "r") as f:
-        messages = load(f)
-except Exception:
-    messages = []
-    with open(CHAT_LOG_PATH, "w") as f:
-        dump(messages, f)
+# Shared with ChatBot; intents run concurrently, so history goes through its lock
+if __package__:
+    from Backend import ChatLog
+else:
+    import ChatLog  # running this file directly from Backend/
+CHAT_LOG_PATH = ChatLog.CHAT_LOG_PATH
+messages = ChatLog.messages
 
 # ==============================
 # Async API Functions
@@ -134,10 +130,8 @@ SystemChatBot = [
 # ==============================
 # Main Realtime Search Engine
 # ==============================
-async def RealtimeSearchEngine(prompt):
-    global SystemChatBot, messages
-
-    messages.append({"role": "user", "content": prompt})
+async def RealtimeSearchEngine(prompt, record=True):
+    """Answer prompt from live search results; record=False leaves logging the exchange to the caller."""
     query_lower = prompt.lower()
     date_keywords = ["time", "hour", "current time", "date", "day", "month", "year"]
 
@@ -145,7 +139,10 @@ async def RealtimeSearchEngine(prompt):
         show_time = "time" in query_lower or "hour" in query_lower
         show_date = any(word in query_lower for word in ["date", "day", "month", "year"])
         now_info = Information("time" if show_time and not show_date else "date" if show_date and not show_time else None)
-        return f"Sir, the current {'date and time' if show_time and show_date else 'time' if show_time else 'date'} is: {now_info} ({tzlocal.get_localzone()})"
+        answer = f"Sir, the current {'date and time' if show_time and show_date else 'time' if show_time else 'date'} is: {now_info} ({tzlocal.get_localzone()})"
+        if record:
+            ChatLog.append_pair(prompt, answer)
+        return answer
 
     async with httpx.AsyncClient() as client_session:
         results = await asyncio.gather(
@@ -155,17 +152,18 @@ async def RealtimeSearchEngine(prompt):
             DuckDuckGoSearch(prompt)
         )
 
+    # Per-call context instead of appending to (and later trimming) the shared SystemChatBot
     api_data = "\n".join(results)
+    context = list(SystemChatBot)
     if api_data.strip():
-        SystemChatBot.append({"role": "assistant", "content": f"Here is the information I found related to the query:\n{api_data}"})
-    
-    SystemChatBot.append({"role": "system", "content": Information()})
+        context.append({"role": "assistant", "content": f"Here is the information I found related to the query:\n{api_data}"})
+    context.append({"role": "system", "content": Information()})
     answer = ""
 
     try:
         completion = client.chat.completions.create(
             model="llama3-70b-8192",
-            messages=SystemChatBot + messages,
+            messages=context + ChatLog.recent() + [{"role": "user", "content": prompt}],
             max_tokens=1024,
             temperature=0.7,
             top_p=1,
@@ -181,18 +179,12 @@ async def RealtimeSearchEngine(prompt):
         return "Sorry Sir, I could not fetch realtime data."
 
     answer = AnswerModifier(answer.strip().replace("</s>", ""))
-    messages.append({"role": "assistant", "content": answer})
-
-    # Write messages once
-    try:
-        with open(CHAT_LOG_PATH, "w") as f:
-            dump(messages, f, indent=4)
-    except Exception as e:
-        print(f"[File Write Error] {e}")
-
-    # Prevent system chat growth
-    SystemChatBot = SystemChatBot[:3]
 
+    if record:
+        try:
+            ChatLog.append_pair(prompt, answer)
+        except Exception as e:
+            print(f"[File Write Error] {e}")
     return answer
 
 # ==============================
@@ -1,5 +1,9 @@
 import os
+import re
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from dotenv import dotenv_values
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -36,14 +40,27 @@ html_template = f'''<!DOCTYPE html>
         const output = document.getElementById('output');
         let recognition;
 
+        let finalText = "";
+
         function startRecognition() {{
             recognition = new (window.SpeechRecognition || window.webkitSpeechRecognition)();
             recognition.lang = '{InputLanguage}';
             recognition.continuous = true;
+            recognition.interimResults = true;
 
             recognition.onresult = function(event) {{
-                const transcript = event.results[event.results.length - 1][0].transcript;
-                output.textContent += transcript;
+                let interim = "";
+                for (let i = event.resultIndex; i < event.results.length; i++) {{
+                    const transcript = event.results[i][0].transcript;
+                    if (event.results[i].isFinal) {{
+                        finalText += transcript;
+                    }} else {{
+                        interim += transcript;
+                    }}
+                }}
+                output.dataset.final = finalText;
+                output.dataset.interim = interim;
+                output.textContent = finalText + interim;
             }};
 
             recognition.onend = function() {{
@@ -54,14 +71,22 @@ html_template = f'''<!DOCTYPE html>
 
         function stopRecognition() {{
             recognition.stop();
+            finalText = "";
+            output.dataset.final = "";
+            output.dataset.interim = "";
             output.innerHTML = "";
         }}
     </script>
 </body>
 </html>'''
 
-# ------------------- Write HTML Once -------------------
-if not os.path.exists(html_path):
+# ------------------- Write HTML (only when the template changed) -------------------
+try:
+    with open(html_path, "r", encoding="utf-8") as f:
+        _html_current = f.read()
+except FileNotFoundError:
+    _html_current = None
+if _html_current != html_template:
     with open(html_path, "w", encoding="utf-8") as f:
         f.write(html_template)
 
@@ -98,32 +123,187 @@ def QueryModifier(Query: str) -> str:
         new_query = new_query.rstrip(".!?") + "."
     return new_query.capitalize()
 
-def UniversalTranslate(Text: str) -> str:
-    translated = mt.translate(Text, "en", "auto")
-    return translated.capitalize()
+# ------------------- Translation -------------------
+TRANSLATION_CACHE_SIZE = 256
+TRANSLATION_TTL = 24 * 3600  # seconds
+TRANSLATE_WAIT = 1.5         # at end of utterance; the classifier is English-only, so wait this long before giving up
+PRETRANSLATE_AFTER = 0.3     # start translating a partial once it has been stable this long
+
+# Common English function words and assistant command verbs. If enough of an
+# utterance is made of these, the user already spoke English. Short words that
+# are also common in other languages (no, me, a, so, was, hi, ...) are left out.
+english_words = {
+    "the","and","or","but","if","then","to","of","on","at","for","from","with",
+    "by","about","into","is","are","were","be","been","does","did","have","has","had",
+    "i","my","you","your","he","she","it","its","we","our","they","their","this","that","these",
+    "those","what","who","where","when","why","how","which","can","could","will","would","should",
+    "please","tell","show","give","make","set","turn","not","yes","all","some","any","up","down",
+    "now","today","tomorrow","date","weather","news","open","close","play","search","write",
+    "send","message","generate","image","reminder","remind","song","music","volume","mute",
+    "content","system","hello","hey","thanks","thank","bye",
+    "what's","how's","where's","it's","i'm","don't","new","repo","list","find","create","delete",
+}
+# Neither evidence for nor against English: names, loanwords used in every
+# language, and short words shared with other languages.
+neutral_words = {
+    "jarvis","youtube","whatsapp","github","google","chrome","time","ok","okay",
+    "a","no","me","so","hi","was","in","am","an","do","de","la","per","die","se","te",
+}
+ENGLISH_WORD_SHARE = 0.4
+
+_word_pattern = re.compile(r"[a-z']+")
+
+_translation_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_translation_lock = threading.Lock()
+_translator = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Translate")
+_inflight: "dict[str, Future]" = {}
+
+def IsLikelyEnglish(Text: str) -> bool:
+    """Cheap local language-ID: ASCII script plus a share of common English words."""
+    letters = [c for c in Text if c.isalpha()]
+    if not letters:
+        return True
+    if sum(c.isascii() for c in letters) / len(letters) < 0.9:
+        return False
+    words = [w for w in _word_pattern.findall(Text.lower()) if w not in neutral_words]
+    if not words:
+        return True
+    hits = sum(w in english_words for w in words)
+    return hits / len(words) >= ENGLISH_WORD_SHARE
+
+def _cache_get(key: str):
+    with _translation_lock:
+        entry = _translation_cache.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del _translation_cache[key]
+            return None
+        _translation_cache.move_to_end(key)
+        return value
+
+def _cache_put(key: str, value: str) -> None:
+    with _translation_lock:
+        _translation_cache[key] = (time.monotonic() + TRANSLATION_TTL, value)
+        _translation_cache.move_to_end(key)
+        while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+
+def _translate_uncached(Text: str) -> str:
+    key = Text.strip().lower()
+    try:
+        translated = mt.translate(Text, "en", "auto").capitalize()
+        _cache_put(key, translated)
+        return translated
+    finally:
+        with _translation_lock:
+            _inflight.pop(key, None)
+
+def UniversalTranslateAsync(Text: str) -> Future:
+    """Translate to English off the calling thread, using the LRU+TTL cache.
+
+    Requests for text already being translated share the in-flight future.
+    """
+    key = Text.strip().lower()
+    cached = _cache_get(key)
+    if cached is not None:
+        future = Future()
+        future.set_result(cached)
+        return future
+    with _translation_lock:
+        future = _inflight.get(key)
+        if future is None:
+            future = _inflight[key] = _translator.submit(_translate_uncached, Text)
+        return future
+
+def UniversalTranslate(Text: str, timeout: float = TRANSLATE_WAIT) -> str:
+    """English text if the translation is ready within timeout, else the original.
+
+    Pretranslated partials are usually cached by now; a translation slower
+    than timeout still lands in the cache, so repeating the phrase is instant.
+    """
+    if IsLikelyEnglish(Text):
+        return Text.capitalize()
+    try:
+        return UniversalTranslateAsync(Text).result(timeout=timeout)
+    except FutureTimeout:
+        print("Translation still pending, using original text")
+    except Exception as e:
+        print(f"Translation failed, using original text: {e}")
+    return Text.capitalize()
 
 # ------------------- Speech Recognition -------------------
-def SpeechRecognition():
+# End-of-utterance: stop once the recognizer has a final result and nothing
+# changed for SILENCE_TIMEOUT, or the transcript stalled for STALL_TIMEOUT
+# (some engines never finalize). MAX_UTTERANCE caps very long dictation.
+SILENCE_TIMEOUT = 0.8
+STALL_TIMEOUT = 2.0
+MAX_UTTERANCE = 30.0
+
+_read_transcript_js = (
+    "const o = document.getElementById('output');"
+    "return [o.dataset.final || '', o.dataset.interim || ''];"
+)
+
+def SpeechRecognition(on_partial=None):
+    """Listen until end of utterance and return the (translated) query.
+
+    on_partial: optional callback receiving the raw interim transcript each
+    time it changes, so callers can start preparing before the user finishes.
+    """
     driver.get(link)
 
     # Cache element references for speed
     try:
         start_btn = driver.find_element(By.ID, "start")
         end_btn = driver.find_element(By.ID, "end")
-        output_elem = driver.find_element(By.ID, "output")
     except Exception as e:
         print("Error initializing elements:", e)
         return None
 
     start_btn.click()
 
+    last_text = ""
+    last_change = time.monotonic()
+    started = None
+    translate = not InputLanguage.lower().startswith("en")
+    pretranslated = ""
+
     while True:
         try:
-            text = output_elem.text
-            if text:
+            final, interim = driver.execute_script(_read_transcript_js)
+            text = (final + interim).strip()
+            now = time.monotonic()
+
+            if text != last_text:
+                last_text = text
+                last_change = now
+                if started is None:
+                    started = now
+                if on_partial and text:
+                    try:
+                        on_partial(text)
+                    except Exception as e:
+                        print(f"Partial transcript handler failed: {e}")
+
+            quiet = now - last_change
+            # Translate during the pause that ends the utterance, so the
+            # result is usually cached by the time the pause is long enough
+            if translate and text and text != pretranslated and quiet >= PRETRANSLATE_AFTER \
+                    and not IsLikelyEnglish(text):
+                pretranslated = text
+                UniversalTranslateAsync(text)
+
+            done = text and (
+                (final.strip() and not interim.strip() and quiet >= SILENCE_TIMEOUT)
+                or quiet >= STALL_TIMEOUT
+                or now - started >= MAX_UTTERANCE
+            )
+            if done:
                 end_btn.click()
 
-                if InputLanguage.lower().startswith("en"):
+                if not translate or IsLikelyEnglish(text):
                     return QueryModifier(text)
                 else:
                     SetAssistantStatus("Translating")
@@ -0,0 +1,167 @@
+import threading
+import time
+import numpy as np
+import psutil
+
+# ============ CONFIG ============
+SAMPLE_INTERVAL = 1.0    # seconds between samples
+HISTORY_SAMPLES = 900    # 15 minutes at the default interval
+
+# ============ SAMPLER ============
+class SystemSampler:
+    """Background thread sampling system metrics into a fixed-size ring buffer.
+
+    Each row holds: time, overall CPU %, RAM %, disk usage %, disk read/write
+    and network sent/received in bytes per second, then one CPU % per core.
+    """
+
+    BASE_COLUMNS = ["time", "cpu", "ram", "disk", "disk_read", "disk_write", "net_sent", "net_recv"]
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, capacity: int = HISTORY_SAMPLES, disk_path: str = "/"):
+        self.interval = interval
+        self.capacity = capacity
+        self.disk_path = disk_path
+        self.cores = psutil.cpu_count() or 1
+        self.columns = self.BASE_COLUMNS + [f"core{i}" for i in range(self.cores)]
+        self.index = {name: i for i, name in enumerate(self.columns)}
+        self.buffer = np.zeros((capacity, len(self.columns)), dtype=np.float64)
+        self.count = 0
+        self.head = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_io = None
+
+    # ---------------- Lifecycle ----------------
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        psutil.cpu_percent(percpu=True)  # prime the counters; first call returns 0
+        self._thread = threading.Thread(target=self._run, name="SystemSampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"System sampler error: {e}")
+            self._stop.wait(self.interval)
+
+    # ---------------- Sampling ----------------
+    def sample(self):
+        now = time.time()
+        per_core = psutil.cpu_percent(percpu=True)
+        ram = psutil.virtual_memory().percent
+        disk = psutil.disk_usage(self.disk_path).percent
+
+        io = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        counters = (
+            io.read_bytes if io else 0, io.write_bytes if io else 0,
+            net.bytes_sent if net else 0, net.bytes_recv if net else 0,
+        )
+        rates = (0.0, 0.0, 0.0, 0.0)
+        if self._last_io:
+            last_time, last_counters = self._last_io
+            elapsed = max(now - last_time, 1e-6)
+            rates = tuple(max(0.0, (c - l) / elapsed) for c, l in zip(counters, last_counters))
+        self._last_io = (now, counters)
+
+        row = [now, sum(per_core) / max(len(per_core), 1), ram, disk, *rates]
+        row += list(per_core[:self.cores]) + [0.0] * (self.cores - len(per_core))
+        with self._lock:
+            self.buffer[self.head] = row
+            self.head = (self.head + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    # ---------------- Queries ----------------
+    def _ordered(self) -> np.ndarray:
+        """Rows in chronological order (copy, safe to use outside the lock)."""
+        with self._lock:
+            if self.count < self.capacity:
+                return self.buffer[:self.count].copy()
+            return np.roll(self.buffer, -self.head, axis=0)
+
+    def latest(self) -> dict:
+        with self._lock:
+            if not self.count:
+                return {}
+            row = self.buffer[(self.head - 1) % self.capacity].copy()
+        return {name: float(row[i]) for name, i in self.index.items()}
+
+    def history(self, column: str, seconds: float | None = None) -> np.ndarray:
+        """Values of one column, oldest first, optionally limited to the last N seconds."""
+        rows = self._ordered()
+        if seconds is not None and len(rows):
+            rows = rows[rows[:, 0] >= rows[-1, 0] - seconds]
+        return rows[:, self.index[column]]
+
+    def summary(self, seconds: float = 60) -> dict:
+        """Average / peak per column over the window."""
+        rows = self._ordered()
+        if not len(rows):
+            return {}
+        rows = rows[rows[:, 0] >= rows[-1, 0] - seconds]
+        out = {}
+        for name, i in self.index.items():
+            if name == "time":
+                continue
+            out[name] = {"avg": float(rows[:, i].mean()), "peak": float(rows[:, i].max()), "now": float(rows[-1, i])}
+        out["window"] = float(rows[-1, 0] - rows[0, 0])
+        return out
+
+_sampler: SystemSampler | None = None
+_sampler_lock = threading.Lock()
+
+def GetSampler() -> SystemSampler:
+    """Process-wide sampler, started on first use."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = SystemSampler().start()
+        return _sampler
+
+# ============ ASSISTANT API ============
+def _rate(value: float) -> str:
+    for unit in ("B/s", "KB/s", "MB/s", "GB/s"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB/s"
+
+def SystemStatusReport(seconds: float = 60) -> str:
+    """Spoken answer to "how's my system doing", built from the sampler history."""
+    stats = GetSampler().summary(seconds)
+    if not stats:
+        return "Sir, I am still collecting system statistics. Please ask again in a moment."
+
+    cpu, ram, disk = stats["cpu"], stats["ram"], stats["disk"]
+    busiest = max(range(GetSampler().cores), key=lambda i: stats[f"core{i}"]["avg"])
+    window = max(1, int(round(stats["window"])))
+
+    if cpu["avg"] > 85 or ram["now"] > 90:
+        verdict = "Your system is under heavy load"
+    elif cpu["avg"] > 50 or ram["now"] > 75:
+        verdict = "Your system is moderately busy"
+    else:
+        verdict = "Your system is running smoothly"
+
+    return (
+        f"{verdict}, Sir. Over the last {window} seconds CPU averaged {cpu['avg']:.0f}% "
+        f"with a peak of {cpu['peak']:.0f}%, busiest on core {busiest}. "
+        f"Memory is at {ram['now']:.0f}% and the disk is {disk['now']:.0f}% full. "
+        f"Disk I/O is {_rate(stats['disk_read']['now'])} read and {_rate(stats['disk_write']['now'])} write, "
+        f"network is {_rate(stats['net_recv']['now'])} down and {_rate(stats['net_sent']['now'])} up."
+    )
+
+if __name__ == "__main__":
+    GetSampler()
+    while True:
+        time.sleep(5)
+        print(SystemStatusReport())
@@ -41,11 +41,13 @@ async def generate_tts(text: str) -> None:
         await communicate.save(SPEECH_FILE)
         _last_text_hash = current_hash
 
-# Play audio file
-def play_audio(stop_func=lambda r=None: True):
+# Play audio file; on_start() runs once playback has actually begun
+def play_audio(stop_func=lambda r=None: True, on_start=None):
     try:
         pygame.mixer.music.load(SPEECH_FILE)
         pygame.mixer.music.play()
+        if on_start:
+            on_start()
         while pygame.mixer.music.get_busy():
             if stop_func() is False:
                 pygame.mixer.music.stop()
@@ -54,16 +56,16 @@ def play_audio(stop_func=lambda r=None: True):
     except Exception as e:
         print(f"Audio playback error: {e}")
 
-# Main TTS function
-def TTS(text: str, stop_func=lambda r=None: True):
+# Main TTS function; on_start(text) runs when the audio starts playing
+def TTS(text: str, stop_func=lambda r=None: True, on_start=None):
     try:
         asyncio.run(generate_tts(text))
-        play_audio(stop_func)
+        play_audio(stop_func, (lambda: on_start(text)) if on_start else None)
     except Exception as e:
         print(f"TTS Error: {e}")
 
-# Smart text-to-speech for long texts
-def TextToSpeech(text: str, stop_func=lambda r=None: True):
+# Smart text-to-speech for long texts; returns the text actually spoken
+def TextToSpeech(text: str, stop_func=lambda r=None: True, on_start=None) -> str:
     sentences = text.split(".")
     responses = [
         "The rest of the answer is chilling on the chat screen, waiting for you, sir.",
@@ -78,9 +80,10 @@ def TextToSpeech(text: str, stop_func=lambda r=None: True):
 
     if len(sentences) > 4 and len(text) > 250:
         first_part = ". ".join(sentences[:2]) + ". " + random.choice(responses)
-        TTS(first_part, stop_func)
-    else:
-        TTS(text, stop_func)
+        TTS(first_part, stop_func, on_start)
+        return first_part
+    TTS(text, stop_func, on_start)
+    return text
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,278 @@
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+if __package__:
+    from Backend.FuzzyIndex import FuzzyIndex
+else:
+    from FuzzyIndex import FuzzyIndex  # running this file directly from Backend/
+
+# ============ CONFIG ============
+CONTACTS_FILE = os.path.join("Data", "Contacts.json")
+OUTBOX_FILE = os.path.join("Data", "WhatsAppOutbox.json")
+PROFILE_DIR = os.path.join("Data", "WhatsAppProfile")   # keeps the WhatsApp Web login
+DEFAULT_COUNTRY_CODE = "+92"   # change default country code if needed
+DEFAULT_CONTACTS = {
+    # Example
+    "ChatGPT": "+1 (800) 242-8478"
+}
+
+MAX_ATTEMPTS = 4
+RETRY_DELAYS = (5, 30, 120)    # seconds before the 2nd, 3rd, 4th attempt
+LOAD_TIMEOUT = 60              # WhatsApp Web chat to become ready (first run: QR login)
+SESSION_IDLE = 600             # close the browser after this long with nothing to send
+CONTACT_MIN_SCORE = 0.6
+
+_phone_like = re.compile(r"\+?[\d\s\-()]{6,}")
+
+def normalize_phone(number: str) -> str:
+    digits = re.sub(r"[^\d+]", "", number)
+    if digits.startswith("+"):
+        return digits
+    return DEFAULT_COUNTRY_CODE + digits.lstrip("0")
+
+# ============ CONTACT BOOK ============
+class ContactBook:
+    """Name -> number mapping in Data/Contacts.json, with fuzzy name lookup."""
+
+    def __init__(self, path: str = CONTACTS_FILE, seed: Optional[Dict[str, str]] = None):
+        self.path = path
+        self.contacts: Dict[str, str] = {}
+        self.index = FuzzyIndex()
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.contacts = json.load(f)
+        except FileNotFoundError:
+            self.contacts = dict(DEFAULT_CONTACTS if seed is None else seed)
+            self._save()
+        for name, number in self.contacts.items():
+            self.index.add(name, name)
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.contacts, f, indent=4, ensure_ascii=False)
+
+    def add(self, name: str, number: str):
+        with self._lock:
+            self.contacts[name] = number
+            self.index.add(name, name)
+            self._save()
+
+    def resolve(self, target: str) -> Optional[Tuple[str, str]]:
+        """(contact name, phone) for a name or a raw number; None if unknown."""
+        target = target.strip()
+        if _phone_like.fullmatch(target):
+            return target, normalize_phone(target)
+        with self._lock:
+            name = self.index.best(target, min_score=CONTACT_MIN_SCORE)
+            return (name, normalize_phone(self.contacts[name])) if name else None
+
+# ============ SENDER ============
+class SentUncertain(Exception):
+    """Send failed after Enter was pressed, so the message may already be delivered."""
+
+class WhatsAppWebSession:
+    """One long-lived WhatsApp Web browser, reused for every message."""
+
+    def __init__(self, profile_dir: str = PROFILE_DIR):
+        self.profile_dir = os.path.abspath(profile_dir)
+        self.driver = None
+
+    def _start(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        options = Options()
+        options.add_argument(f"--user-data-dir={self.profile_dir}")
+        options.add_argument("--disable-gpu")
+        service = Service(ChromeDriverManager().install())
+        self.driver = webdriver.Chrome(service=service, options=options)
+
+    def send(self, phone: str, text: str):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        if self.driver is None:
+            self._start()
+        self.driver.get(f"https://web.whatsapp.com/send?phone={phone.lstrip('+')}&text={quote(text)}")
+        box = WebDriverWait(self.driver, LOAD_TIMEOUT).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, 'footer div[contenteditable="true"]'))
+        )
+        box.send_keys(Keys.ENTER)
+        # Wait until the compose box is empty again, i.e. the message left
+        try:
+            WebDriverWait(self.driver, 15).until(lambda d: not box.text.strip())
+        except Exception as e:
+            raise SentUncertain(str(e).splitlines()[0] if str(e) else type(e).__name__) from e
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+# ============ OUTBOX ============
+@dataclass
+class OutboundMessage:
+    id: str
+    target: str
+    phone: str
+    text: str
+    created: float
+    attempts: int = 0
+    next_try: float = 0.0
+    status: str = "pending"   # pending / failed
+    error: Optional[str] = None
+
+class WhatsAppOutbox:
+    """Persistent outgoing queue drained one message at a time by a single sender.
+
+    Unsent messages live in Data/WhatsAppOutbox.json, so they survive a
+    restart. Failed sends are retried with RETRY_DELAYS backoff and marked
+    failed after MAX_ATTEMPTS. A failure after Enter was pressed is never
+    retried: resending could deliver the message twice.
+    """
+
+    def __init__(self, path: str = OUTBOX_FILE, session: Optional[WhatsAppWebSession] = None,
+                 contacts: Optional[ContactBook] = None):
+        self.path = path
+        self.session = session or WhatsAppWebSession()
+        self.contacts = contacts or ContactBook()
+        self.messages: List[OutboundMessage] = []
+        self.listeners = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._load()
+        if self.pending():
+            self._ensure_thread()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.messages = [OutboundMessage(**m) for m in json.load(f)]
+        except (FileNotFoundError, ValueError):
+            self.messages = []
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([asdict(m) for m in self.messages], f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def _emit(self, msg: OutboundMessage, event: str):
+        for callback in list(self.listeners):
+            try:
+                callback(msg, event)
+            except Exception as e:
+                print(f"WhatsApp listener failed: {e}")
+
+    def pending(self) -> List[OutboundMessage]:
+        with self._cond:
+            return [m for m in self.messages if m.status == "pending"]
+
+    def failed(self) -> List[OutboundMessage]:
+        with self._cond:
+            return [m for m in self.messages if m.status == "failed"]
+
+    def enqueue(self, phone: str, text: str, target: str = "") -> OutboundMessage:
+        msg = OutboundMessage(uuid.uuid4().hex[:12], target or phone, phone, text, time.time())
+        with self._cond:
+            self.messages.append(msg)
+            self._save()
+            self._cond.notify()
+        self._ensure_thread()
+        return msg
+
+    def retry_failed(self):
+        with self._cond:
+            for m in self.messages:
+                if m.status == "failed":
+                    m.status, m.attempts, m.next_try = "pending", 0, 0.0
+            self._save()
+            self._cond.notify()
+        self._ensure_thread()
+
+    def _ensure_thread(self):
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="WhatsAppOutbox", daemon=True)
+                self._thread.start()
+
+    def _next_due(self) -> Tuple[Optional[OutboundMessage], Optional[float]]:
+        """(message due now, or None; seconds until the next one is due)."""
+        now = time.time()
+        pending = [m for m in self.messages if m.status == "pending"]
+        if not pending:
+            return None, None
+        msg = min(pending, key=lambda m: (m.next_try, m.created))
+        return (msg, 0.0) if msg.next_try <= now else (None, msg.next_try - now)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                msg, wait = self._next_due()
+                while msg is None:
+                    idle = SESSION_IDLE if wait is None else min(wait, SESSION_IDLE)
+                    if not self._cond.wait(timeout=idle) and wait is None:
+                        self.session.close()  # idle: free the browser until the next message
+                    msg, wait = self._next_due()
+
+            try:
+                self.session.send(msg.phone, msg.text)
+            except SentUncertain as e:
+                self.session.close()
+                print(f"WhatsApp send to {msg.target} could not be confirmed, not retrying: {e}")
+            except Exception as e:
+                self.session.close()  # start a fresh session for the retry
+                with self._cond:
+                    msg.attempts += 1
+                    msg.error = str(e).splitlines()[0] if str(e) else type(e).__name__
+                    if msg.attempts >= MAX_ATTEMPTS:
+                        msg.status = "failed"
+                    else:
+                        msg.next_try = time.time() + RETRY_DELAYS[min(msg.attempts, len(RETRY_DELAYS)) - 1]
+                    self._save()
+                print(f"WhatsApp send to {msg.target} failed ({msg.attempts}/{MAX_ATTEMPTS}): {msg.error}")
+                self._emit(msg, msg.status)
+                continue
+
+            with self._cond:
+                self.messages.remove(msg)
+                self._save()
+            print(f"WhatsApp message sent to {msg.target} ({msg.phone}): {msg.text}")
+            self._emit(msg, "sent")
+
+_outbox: WhatsAppOutbox | None = None
+_outbox_lock = threading.Lock()
+
+def GetWhatsAppOutbox() -> WhatsAppOutbox:
+    """Process-wide outbox; resumes sending messages left over from the last run."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = WhatsAppOutbox()
+        return _outbox
+
+def ResumeOutbox(path: str = OUTBOX_FILE) -> Optional[WhatsAppOutbox]:
+    """Start the outbox at launch if the last run left messages unsent."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            leftover = any(m.get("status") == "pending" for m in json.load(f))
+    except (FileNotFoundError, ValueError):
+        return None
+    return GetWhatsAppOutbox() if leftover else None
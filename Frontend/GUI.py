@@ -1,11 +1,17 @@
 import tkinter as tk
 from PIL import Image, ImageTk, ImageSequence, ImageDraw, ImageFont
 import os
+import codecs
+import hashlib
+import time
+import json
+import queue
+import threading
+from collections import OrderedDict
 from datetime import datetime
-import psutil
 import socket
 import subprocess
-import cv2
+import sys
 
 def TempDirPath(filename):
     temp_dir = os.path.join(os.getcwd(), "Frontend", "Files")
@@ -64,6 +70,344 @@ def GetAssistantStatus():
         Status = file.read()
     return Status
 
+class AssetCache:
+    """On-disk cache of pre-rendered RGBA images.
+
+    Entries are keyed by the content hash of every source file (GIF, PNG,
+    font), the render parameters and the screen size, and stored as one JSON
+    header line followed by raw RGBA frames so loading is a single read.
+    """
+
+    VERSION = 2
+
+    def __init__(self, cache_dir, screen_size):
+        self.cache_dir = cache_dir
+        self.screen_size = tuple(screen_size)
+        self._hashes = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _file_hash(self, path):
+        st = os.stat(path)
+        stamp = (st.st_size, st.st_mtime_ns)
+        cached = self._hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self._hashes[path] = (stamp, digest)
+        return digest
+
+    def key(self, name, sources, **params):
+        payload = json.dumps({
+            "version": self.VERSION,
+            "name": name,
+            "sources": [self._file_hash(p) for p in sources],
+            "params": params,
+            "screen": self.screen_size,
+        }, sort_keys=True, default=str)
+        return f"{name}-{hashlib.sha1(payload.encode()).hexdigest()[:16]}"
+
+    def load(self, key):
+        path = os.path.join(self.cache_dir, key + ".rgba")
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                data = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        w, h = header["size"]
+        frame_bytes = w * h * 4
+        if len(data) != frame_bytes * header["count"]:
+            return None
+        return [Image.frombytes("RGBA", (w, h), data[i * frame_bytes:(i + 1) * frame_bytes])
+                for i in range(header["count"])]
+
+    def store(self, key, images):
+        path = os.path.join(self.cache_dir, key + ".rgba")
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(json.dumps({"size": images[0].size, "count": len(images)}).encode() + b"\n")
+                for img in images:
+                    f.write(img.convert("RGBA").tobytes())
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Asset cache write failed for {key}: {e}")
+
+    def get(self, name, sources, render, **params):
+        """Return cached frames for (sources, params) or render() and store them."""
+        key = self.key(name, sources, **params)
+        images = self.load(key)
+        if images is None:
+            images = render()
+            if images:
+                self.store(key, images)
+        return images
+
+class GlyphAtlas:
+    """Text renderer that rasterizes each character of a font once.
+
+    Strings are built by compositing the pre-rendered glyphs along their
+    advance widths, so updating a label needs no PIL text layout. Composed
+    strings are kept in a small LRU since labels tend to repeat.
+    """
+
+    def __init__(self, font_path, size, fill=(255,255,255,255), cache_size=256):
+        self.font = ImageFont.truetype(font_path, size)
+        self.fill = fill
+        ascent, descent = self.font.getmetrics()
+        self.height = ascent + descent
+        self.glyphs = {}
+        self.cache_size = cache_size
+        self._strings = OrderedDict()
+
+    def glyph(self, ch):
+        """(image, x offset, advance) for one character, rendered on first use."""
+        g = self.glyphs.get(ch)
+        if g is None:
+            advance = self.font.getlength(ch)
+            left, _, right, _ = self.font.getbbox(ch)
+            left = min(0, left)
+            img = Image.new("RGBA", (max(1, int(right - left) + 1), self.height), (0,0,0,0))
+            ImageDraw.Draw(img).text((-left, 0), ch, font=self.font, fill=self.fill)
+            g = self.glyphs[ch] = (img, left, advance)
+        return g
+
+    def render(self, text):
+        """Return (image, ink bbox) for text; the image is one line high."""
+        entry = self._strings.get(text)
+        if entry is not None:
+            self._strings.move_to_end(text)
+            return entry
+        glyphs = [self.glyph(ch) for ch in text]
+        width = max(1, int(sum(advance for _, _, advance in glyphs)) + 2)
+        img = Image.new("RGBA", (width, self.height), (0,0,0,0))
+        x = 0.0
+        for glyph_img, left, advance in glyphs:
+            img.alpha_composite(glyph_img, (max(0, int(x + left)), 0))
+            x += advance
+        entry = (img, img.getbbox() or (0, 0, 0, 0))
+        self._strings[text] = entry
+        if len(self._strings) > self.cache_size:
+            self._strings.popitem(last=False)
+        return entry
+
+    def draw(self, base, text, y=None):
+        """Composite text onto base (in place), centred horizontally.
+
+        Centred vertically on its ink when y is None, otherwise top at y.
+        """
+        img, (x0, y0, x1, y1) = self.render(text)
+        x = (base.width - (x1 - x0)) // 2 - x0
+        y = (base.height - (y1 - y0)) // 2 - y0 if y is None else y
+        base.alpha_composite(img, (max(0, x), max(0, y)))
+        return base
+
+class FrameScheduler:
+    """Single root.after tick driving every periodic GUI job.
+
+    Jobs are skipped while their visible() check is False, adaptive jobs
+    (animations) slow down when the CPU is busy, and the tick stops entirely
+    while the window is unmapped/iconified. Render time per job is tracked.
+    """
+
+    class Job:
+        __slots__ = ("name", "interval", "callback", "visible", "adaptive", "due", "runs", "total", "worst")
+
+        def __init__(self, name, interval, callback, visible, adaptive):
+            self.name = name
+            self.interval = interval
+            self.callback = callback
+            self.visible = visible
+            self.adaptive = adaptive
+            self.due = 0.0
+            self.runs = 0
+            self.total = 0.0
+            self.worst = 0.0
+
+    def __init__(self, root, sampler=None, min_delay=5):
+        self.root = root
+        self.sampler = sampler
+        self.min_delay = min_delay
+        self.jobs = {}
+        self.paused = False
+        self.on_pause = []
+        self.on_resume = []
+        self._after_id = None
+        root.bind("<Unmap>", self._on_unmap, add="+")
+        root.bind("<Map>", self._on_map, add="+")
+
+    def add(self, name, interval_ms, callback, visible=None, adaptive=False, delay_ms=0):
+        job = self.Job(name, interval_ms / 1000, callback, visible, adaptive)
+        job.due = time.monotonic() + delay_ms / 1000
+        self.jobs[name] = job
+        self._wake()
+        return job
+
+    def remove(self, name):
+        self.jobs.pop(name, None)
+
+    def set_interval(self, name, interval_ms):
+        if name in self.jobs:
+            self.jobs[name].interval = interval_ms / 1000
+
+    def stats(self):
+        """Per-job render time: runs, average and worst in milliseconds."""
+        return {
+            job.name: {"runs": job.runs, "avg_ms": job.total / job.runs * 1000 if job.runs else 0.0,
+                       "worst_ms": job.worst * 1000}
+            for job in self.jobs.values()
+        }
+
+    def load_factor(self):
+        """Stretch animation intervals when the machine is busy."""
+        latest = self.sampler.latest() if self.sampler else {}
+        cpu = latest.get("cpu", 0.0)
+        if cpu > 90:
+            return 3.0
+        if cpu > 75:
+            return 1.5
+        return 1.0
+
+    def _wake(self):
+        if self._after_id is None and not self.paused:
+            self._after_id = self.root.after(self.min_delay, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        if self.paused or self.root.state() in ("iconic", "withdrawn"):
+            return
+        now = time.monotonic()
+        factor = self.load_factor()
+        for job in list(self.jobs.values()):
+            if job.due > now:
+                continue
+            job.due = now + job.interval * (factor if job.adaptive else 1.0)
+            if job.visible is not None and not job.visible():
+                continue
+            start = time.perf_counter()
+            try:
+                job.callback()
+            except Exception as e:
+                print(f"GUI job {job.name} failed: {e}")
+            elapsed = time.perf_counter() - start
+            job.runs += 1
+            job.total += elapsed
+            job.worst = max(job.worst, elapsed)
+        if self.jobs:
+            delay = min(job.due for job in self.jobs.values()) - time.monotonic()
+            self._after_id = self.root.after(max(self.min_delay, int(delay * 1000)), self._tick)
+
+    def _on_unmap(self, event):
+        if event.widget is not self.root or self.paused:
+            return
+        self.paused = True
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        for hook in self.on_pause:
+            hook()
+
+    def _on_map(self, event):
+        if event.widget is not self.root or not self.paused:
+            return
+        self.paused = False
+        for hook in self.on_resume:
+            hook()
+        self._wake()
+
+# Seconds of sampler history drawn in each usage sparkline
+SPARKLINE_SECONDS = 60
+
+# Memory budget for the looping hologram clip's pre-scaled frame cache
+VIDEO_CACHE_BYTES = 256 * 1024 * 1024
+
+class VideoFramePump:
+    """Decode and pre-scale a looping video on a worker thread.
+
+    Frames are handed to the Tk thread through a small bounded buffer. While
+    the first pass is decoded, frames are also kept in a memory-capped cache;
+    if the whole clip fits, decoding stops and the GUI just cycles the cache.
+    """
+
+    def __init__(self, path, size, buffer_frames=8, cache_limit=VIDEO_CACHE_BYTES):
+        self.path = path
+        self.size = size
+        self.cache_limit = cache_limit
+        self.fps = 30.0
+        self.ready = queue.Queue(maxsize=buffer_frames)
+        self.cache = []
+        self.cache_complete = False
+        self.opened = threading.Event()
+        self.failed = False
+        self._running = threading.Event()
+        self._running.set()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._decode, name="VideoDecoder", daemon=True)
+        self._thread.start()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def stop(self):
+        self._stopped.set()
+        self._running.set()
+
+    def _decode(self):
+        import cv2
+
+        cap = cv2.VideoCapture(self.path)
+        if not cap.isOpened():
+            print("Error: Cannot open video file:", self.path)
+            self.failed = True
+            self.opened.set()
+            return
+        self.fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.opened.set()
+
+        caching = True
+        cached_bytes = 0
+        try:
+            while not self._stopped.is_set():
+                self._running.wait()
+                ret, frame = cap.read()
+                if not ret:
+                    if caching and self.cache:
+                        # Whole loop is cached; the GUI takes it from here
+                        self.cache_complete = True
+                        return
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+
+                frame = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), self.size,
+                                   interpolation=cv2.INTER_AREA)
+                image = Image.fromarray(frame)
+
+                if caching:
+                    # Tk keeps 4 bytes per pixel once converted to a PhotoImage
+                    cached_bytes += self.size[0] * self.size[1] * 4
+                    if cached_bytes > self.cache_limit:
+                        caching = False
+                        self.cache = []
+                    else:
+                        self.cache.append(image)
+
+                while not self._stopped.is_set():
+                    try:
+                        self.ready.put(image, timeout=0.2)
+                        break
+                    except queue.Full:
+                        continue
+        finally:
+            cap.release()
+
+# Chat view limits: lines kept in the Text widget, bytes kept to detect rewrites
+MAX_CHAT_LINES = 50000
+CHAT_TAIL_BYTES = 256
+
 class JarvisGUI:
     def __init__(self, root):
         self.root = root
@@ -91,10 +435,24 @@ class JarvisGUI:
         self.font_path = os.path.join(base_path, "Fonts", "mw.ttf")
 
         # Fonts
-        self.gif_font = ImageFont.truetype(self.font_path, 25)
-        self.datetime_font = ImageFont.truetype(self.font_path, 18)
-        self.usage_font = ImageFont.truetype(self.font_path, 16)
-        self.network_font = ImageFont.truetype(self.font_path, 12)
+        self.atlases = {}
+        self.gif_font = self.atlas(25)
+        self.datetime_font = self.atlas(18)
+        self.usage_font = self.atlas(16)
+        self.network_font = self.atlas(12)
+
+        # Pre-rendered images (GIF frames, buttons, numbers) survive restarts
+        self.assets = AssetCache(os.path.join(base_path, "Cache"),
+                                 (self.root.winfo_screenwidth(), self.root.winfo_screenheight()))
+        self._border_images = {}
+
+        # One scheduler drives every periodic update (see FrameScheduler).
+        # The sampler (numpy, psutil) loads off the first-frame path.
+        self.sampler = None
+        self.scheduler = FrameScheduler(self.root)
+        threading.Thread(target=self.load_sampler, name="SamplerLoad", daemon=True).start()
+        self.overlay_open = False
+        self.thumbnails = None
 
         # Minimize Button
         self.create_minimize_button()
@@ -102,6 +460,9 @@ class JarvisGUI:
         # Chat Button
         self.create_chat_button()
 
+        # Gallery Button
+        self.create_gallery_button()
+
         # Date/Time Label
         self.create_datetime_label()
 
@@ -111,7 +472,8 @@ class JarvisGUI:
         self.container.pack(expand=True)
         self.gif_label = tk.Label(self.container, bg="black")
         self.gif_label.pack()
-        self.animate_gif(0)
+        self.gif_index = 0
+        self.scheduler.add("gif", 30, self.animate_gif, visible=self.home_visible, adaptive=True)
 
         # Usage Panel
         self.pre_render_numbers()
@@ -120,20 +482,42 @@ class JarvisGUI:
         # Video Panel
         self.create_video_panel()
 
+    def home_visible(self):
+        """Widgets on the home screen are covered while the chat or gallery is open."""
+        return not self.overlay_open
+
+    def atlas(self, size):
+        """Shared glyph atlas for mw.ttf at the given size."""
+        if size not in self.atlases:
+            self.atlases[size] = GlyphAtlas(self.font_path, size)
+        return self.atlases[size]
+
     # ---------------- Close Window ----------------
     def close_window(self, event=None):
+        if self.thumbnails:
+            self.thumbnails.shutdown()
         self.root.destroy()
 
     # ---------------- Minimize Button ----------------
+    def render_button(self, text, size):
+        """Border.png with centred text, rendered once and cached on disk."""
+        def render():
+            return [self.atlas(20).draw(self.border_image(size).copy(), text)]
+        return self.assets.get("button", [self.border_path, self.font_path], render,
+                               text=text, size=size, font_size=20)[0]
+
+    def border_image(self, size):
+        """Border.png resized to size; shared by every widget using that size."""
+        img = self._border_images.get(size)
+        if img is None:
+            img = self.assets.get("border", [self.border_path],
+                                  lambda: [Image.open(self.border_path).convert("RGBA").resize(size)],
+                                  size=size)[0]
+            self._border_images[size] = img
+        return img
+
     def create_minimize_button(self):
-        img = Image.open(self.border_path).convert("RGBA").resize((self.minimize_w, self.minimize_h))
-        draw = ImageDraw.Draw(img)
-        font = ImageFont.truetype(self.font_path, 20)
-        text = "Minimize"
-        bbox = draw.textbbox((0, 0), text, font=font)
-        draw.text(((img.width - (bbox[2]-bbox[0]))//2, (img.height - (bbox[3]-bbox[1]))//2),
-                  text, font=font, fill=(255,255,255,255))
-        self.minimize_img = ImageTk.PhotoImage(img)
+        self.minimize_img = ImageTk.PhotoImage(self.render_button("Minimize", (self.minimize_w, self.minimize_h)))
         self.minimize_button = tk.Label(self.root, image=self.minimize_img, bg="black", cursor="hand2")
         self.minimize_button.place(x=20, y=15)
         self.minimize_button.bind("<Button-1>", self.minimize_window)
@@ -155,23 +539,58 @@ class JarvisGUI:
 
     # ---------------- Chat Button ----------------
     def create_chat_button(self):
-        img = Image.open(self.border_path).convert("RGBA").resize((self.chat_w, self.chat_h))
-        draw = ImageDraw.Draw(img)
-        font = ImageFont.truetype(self.font_path, 20)
-        text = "CHAT"
-        # Center text
-        bbox = draw.textbbox((0, 0), text, font=font)
-        draw.text(((img.width - (bbox[2]-bbox[0]) )//2, (img.height - (bbox[3]-bbox[1]))//2),
-                text, font=font, fill=(255,255,255,255))
-        self.chat_img = ImageTk.PhotoImage(img)
+        self.chat_img = ImageTk.PhotoImage(self.render_button("CHAT", (self.chat_w, self.chat_h)))
         self.chat_button = tk.Label(self.root, image=self.chat_img, bg="black", cursor="hand2")
         self.chat_button.place(x=(self.root.winfo_screenwidth()-self.chat_w)//2, y=15)
         self.chat_button.lift()
         self.chat_button.bind("<Button-1>", self.open_chat_window)
 
-    # ---------------- Mousewheel ----------------
-    def _on_mousewheel(self, event):
-        self.msg_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+    # ---------------- Gallery ----------------
+    def create_gallery_button(self):
+        self.gallery_img = ImageTk.PhotoImage(self.render_button("GALLERY", (self.chat_w, self.chat_h)))
+        self.gallery_button = tk.Label(self.root, image=self.gallery_img, bg="black", cursor="hand2")
+        self.gallery_button.place(x=(self.root.winfo_screenwidth()-self.chat_w)//2, y=85)
+        self.gallery_button.lift()
+        self.gallery_button.bind("<Button-1>", self.open_gallery_window)
+
+    def open_gallery_window(self, event=None):
+        self.gallery_frame = tk.Frame(self.root, bg="black")
+        self.gallery_frame.place(x=0, y=0, relwidth=1, relheight=1)
+
+        if not hasattr(self, "home_img"):
+            self.home_img = ImageTk.PhotoImage(self.render_button("HOME", (200, 60)))
+        home_button = tk.Label(self.gallery_frame, image=self.home_img, bg="black", cursor="hand2")
+        home_button.place(relx=0.5015, y=15, anchor="n")
+        home_button.bind("<Button-1>", self.close_gallery_window)
+
+        # Thumbnails are made in a process pool; full-size PNGs never hit this thread
+        from Frontend.Gallery import GalleryPanel, ThumbnailCache, ListGeneratedImages
+        if self.thumbnails is None:
+            self.thumbnails = ThumbnailCache(os.path.join(os.path.dirname(__file__), "Cache", "thumbs"))
+        self.gallery = GalleryPanel(self.gallery_frame, ListGeneratedImages(), self.thumbnails,
+                                    self.open_image)
+        self.gallery.place(relx=0.5, rely=0.15, anchor="n")
+
+        self.overlay_open = True
+        self.scheduler.add("gallery", 100, self.gallery.poll)
+
+    def open_image(self, path):
+        """Hand the image to the system viewer; runs on the Tk thread, so never wait on it."""
+        try:
+            if os.name == "nt":
+                os.startfile(path)
+            else:
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen([opener, path], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
+        except Exception as e:
+            print(f"⚠️ Could not open {path}: {e}")
+
+    def close_gallery_window(self, event=None):
+        self.scheduler.remove("gallery")
+        self.overlay_open = False
+        self.gallery.destroy()
+        self.gallery_frame.destroy()
 
     # ---------------- Chat Window ----------------
     def open_chat_window(self, event=None):
@@ -179,125 +598,144 @@ class JarvisGUI:
         self.chat_frame.place(x=0, y=0, relwidth=1, relheight=1)
         
         # ---------------- Home Button ----------------
-        img = Image.open(self.border_path).convert("RGBA").resize((200, 60))
-        draw = ImageDraw.Draw(img)
-        font = ImageFont.truetype(self.font_path, 20)
-        text = "HOME"
-        bbox = draw.textbbox((0,0), text, font=font)
-        draw.text(
-            ((img.width - (bbox[2]-bbox[0])) // 2, (img.height - (bbox[3]-bbox[1])) // 2),
-            text, font=font, fill=(255,255,255,255)
-        )
-        self.home_img = ImageTk.PhotoImage(img)
+        if not hasattr(self, "home_img"):
+            self.home_img = ImageTk.PhotoImage(self.render_button("HOME", (200, 60)))
         self.home_button = tk.Label(self.chat_frame, image=self.home_img, bg="black", cursor="hand2")
         self.home_button.place(relx=0.5015, y=15, anchor="n")
         self.home_button.bind("<Button-1>", self.close_chat_window)
 
-        # ---------------- Scrollable Messages ----------------
-        self.msg_canvas = tk.Canvas(self.chat_frame, bg="black", highlightthickness=0)
-        self.msg_canvas.place(relx=0.5, rely=0.15, anchor="n", width=800, height=500)
-
-        self.msg_frame = tk.Frame(self.msg_canvas, bg="black")
-        self.msg_window = self.msg_canvas.create_window((0,0), window=self.msg_frame, anchor="nw")
-
-        # Mousewheel scroll
-        self.msg_canvas.bind("<Enter>", lambda e: self.msg_canvas.bind_all("<MouseWheel>", self._on_mousewheel))
-        self.msg_canvas.bind("<Leave>", lambda e: self.msg_canvas.unbind_all("<MouseWheel>"))
-        self.msg_frame.bind("<Configure>", lambda e: self.msg_canvas.configure(scrollregion=self.msg_canvas.bbox("all")))
-
-        # ---------------- Messages List ----------------
-        self.messages = []
+        # ---------------- Messages ----------------
+        # One Text widget for the whole log: Tk only lays out the visible lines,
+        # and new turns are appended instead of adding a widget per update.
+        self.chat_text = tk.Text(self.chat_frame, font=("Consolas",12), fg="white", bg="black",
+                                 wrap="word", bd=0, highlightthickness=0, insertwidth=0,
+                                 padx=10, state="disabled")
+        self.chat_text.place(relx=0.5, rely=0.15, anchor="n", width=800, height=500)
+
+        # Byte offset into Database.data already shown, plus the bytes just
+        # before it so a rewritten (not appended) file triggers a full reload.
+        self.chat_offset = 0
+        self.chat_tail = b""
+        self.chat_stamp = None
+        self.chat_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
         # Start loading messages from file periodically
-        self.load_messages()
+        self.overlay_open = True
+        self.scheduler.add("messages", 500, self.load_messages)
     
     def load_messages(self):
-        """Load messages from Database.data and display in chat"""
+        """Append whatever was added to Database.data since the last poll"""
+        path = TempDirPath("Database.data")
         try:
-            with open(TempDirPath("Database.data"), 'r', encoding='utf-8') as f:
-                messages = f.read().strip()
-            if messages and (not hasattr(self, 'messages') or not self.messages or messages != self.messages[-1]):
-                self.add_message(AnswerModifier(messages))
-                if not hasattr(self, 'messages'):
-                    self.messages = []
-                self.messages.append(messages)
+            st = os.stat(path)
+            stamp = (st.st_size, st.st_mtime_ns)
+            if stamp != self.chat_stamp:
+                self.chat_stamp = stamp
+                with open(path, 'rb') as f:
+                    if st.st_size < self.chat_offset or not self._chat_prefix_intact(f):
+                        self.reset_messages()
+                    f.seek(self.chat_offset)
+                    data = f.read()
+                if data:
+                    self.chat_offset += len(data)
+                    self.chat_tail = (self.chat_tail + data)[-CHAT_TAIL_BYTES:]
+                    self.add_message(self.chat_decoder.decode(data))
         except FileNotFoundError:
             pass
-        self.root.after(500, self.load_messages)
+
+    def _chat_prefix_intact(self, f):
+        if not self.chat_offset:
+            return True
+        f.seek(self.chat_offset - len(self.chat_tail))
+        return f.read(len(self.chat_tail)) == self.chat_tail
+
+    def reset_messages(self):
+        self.chat_offset = 0
+        self.chat_tail = b""
+        self.chat_decoder.reset()
+        self.chat_text.configure(state="normal")
+        self.chat_text.delete("1.0", "end")
+        self.chat_text.configure(state="disabled")
 
     # ---------------- Add Message ----------------
     def add_message(self, msg):
-        label = tk.Label(self.msg_frame, text=f"{msg}", font=("Consolas",12),
-                        fg="white", bg="black", wraplength=780, justify="left")
-        label.pack(anchor="w", pady=2)
-        self.msg_canvas.update_idletasks()
-        self.msg_canvas.yview_moveto(1)
+        at_bottom = self.chat_text.yview()[1] >= 0.999
+        self.chat_text.configure(state="normal")
+        self.chat_text.insert("end", msg)
+        lines = int(self.chat_text.index("end-1c").split(".")[0])
+        if lines > MAX_CHAT_LINES:
+            self.chat_text.delete("1.0", f"{lines - MAX_CHAT_LINES + 1}.0")
+        self.chat_text.configure(state="disabled")
+        if at_bottom:
+            self.chat_text.see("end")
 
     # ---------------- Close Chat Window ----------------
     def close_chat_window(self, event=None):
+        self.scheduler.remove("messages")
+        self.overlay_open = False
         self.chat_frame.destroy()
 
     # ---------------- Date/Time ----------------
     def create_datetime_label(self):
-        self.datetime_base_img = Image.open(self.border_path).convert("RGBA").resize((self.minimize_w, self.minimize_h))
+        self.datetime_base_img = self.border_image((self.minimize_w, self.minimize_h))
         self.datetime_img = ImageTk.PhotoImage(self.datetime_base_img)
         self.datetime_label = tk.Label(self.root, image=self.datetime_img, bg="black")
         self.datetime_label.place(x=self.root.winfo_screenwidth() - self.minimize_w - 20, y=15)
-        self.update_datetime()
+        self.scheduler.add("datetime", 1000, self.update_datetime, visible=self.home_visible)
 
     def update_datetime(self):
         img = self.datetime_base_img.copy()
-        draw = ImageDraw.Draw(img)
         now = datetime.now()
-        date_str = now.strftime("%d %b %Y")
-        time_str = now.strftime("%I:%M:%S %p")
-        bbox_date = draw.textbbox((0,0), date_str, font=self.datetime_font)
-        bbox_time = draw.textbbox((0,0), time_str, font=self.datetime_font)
-        draw.text(((img.width - (bbox_date[2]-bbox_date[0]))//2, 15), date_str,
-                  font=self.datetime_font, fill=(255,255,255,255))
-        draw.text(((img.width - (bbox_time[2]-bbox_time[0]))//2, 30), time_str,
-                  font=self.datetime_font, fill=(255,255,255,255))
-        self.datetime_img = ImageTk.PhotoImage(img)
-        self.datetime_label.configure(image=self.datetime_img)
-        self.root.after(1000, self.update_datetime)
+        self.datetime_font.draw(img, now.strftime("%d %b %Y"), y=15)
+        self.datetime_font.draw(img, now.strftime("%I:%M:%S %p"), y=30)
+        # Reuse the Tk image instead of allocating a new one every second
+        self.datetime_img.paste(img)
 
     # ---------------- GIF Animation ----------------
     def load_gif_frames(self):
-        gif = Image.open(self.gif_path)
-        self.gif_frames = []
-        for frame in ImageSequence.Iterator(gif):
-            f = frame.convert("RGBA").resize((self.gif_w, self.gif_h))
-            draw = ImageDraw.Draw(f)
-            bbox = draw.textbbox((0, 0), "J.A.R.V.I.S", font=self.gif_font)
-            draw.text(((self.gif_w - (bbox[2]-bbox[0]))//2, (self.gif_h - (bbox[3]-bbox[1]))//2),
-                      "J.A.R.V.I.S", font=self.gif_font, fill=(255,255,255,255))
-            self.gif_frames.append(ImageTk.PhotoImage(f))
+        def render():
+            gif = Image.open(self.gif_path)
+            frames = []
+            for frame in ImageSequence.Iterator(gif):
+                f = frame.convert("RGBA").resize((self.gif_w, self.gif_h))
+                frames.append(self.gif_font.draw(f, "J.A.R.V.I.S"))
+            return frames
+
+        frames = self.assets.get("gif", [self.gif_path, self.font_path], render,
+                                 size=(self.gif_w, self.gif_h), text="J.A.R.V.I.S", font_size=25)
+        self.gif_frames = [ImageTk.PhotoImage(f) for f in frames]
         self.gif_frame_count = len(self.gif_frames)
 
-    def animate_gif(self, index):
-        self.gif_label.configure(image=self.gif_frames[index])
-        index = (index + 1) % self.gif_frame_count
-        self.root.after(30, self.animate_gif, index)
+    def animate_gif(self):
+        self.gif_label.configure(image=self.gif_frames[self.gif_index])
+        self.gif_index = (self.gif_index + 1) % self.gif_frame_count
 
     # ---------------- Pre-render numbers ----------------
     def pre_render_numbers(self):
-        self.number_images = {}
         self.number_width, self.number_height = 50, 30
-        for i in range(0, 101):
-            img = Image.new("RGBA", (self.number_width, self.number_height), (0,0,0,0))
-            draw = ImageDraw.Draw(img)
-            draw.text((0,0), f"{i:02d}%", font=self.usage_font, fill=(255,255,255,255))
-            self.number_images[i] = ImageTk.PhotoImage(img)
+
+        def render():
+            images = []
+            for i in range(0, 101):
+                img = Image.new("RGBA", (self.number_width, self.number_height), (0,0,0,0))
+                img.alpha_composite(self.usage_font.render(f"{i:02d}%")[0].crop((0, 0, self.number_width, self.number_height)))
+                images.append(img)
+            return images
+
+        images = self.assets.get("numbers", [self.font_path], render,
+                                 size=(self.number_width, self.number_height), font_size=16)
+        self.number_images = {i: ImageTk.PhotoImage(img) for i, img in enumerate(images)}
 
     def pre_render_text(self, text, max_width=180):
         img = Image.new("RGBA", (max_width, 20), (0,0,0,0))
-        draw = ImageDraw.Draw(img)
-        draw.text((0,0), text, font=self.network_font, fill=(255,255,255,255))
+        img.alpha_composite(self.network_font.render(text)[0].crop((0, 0, max_width, 20)))
         return ImageTk.PhotoImage(img)
 
     # ---------------- Usage Panel ----------------
     def create_usage_panel(self, width=380, height=200):
-        base_img = Image.open(self.usage_border_path).convert("RGBA").resize((width, height))
+        base_img = self.assets.get("usage_border", [self.usage_border_path],
+                                   lambda: [Image.open(self.usage_border_path).convert("RGBA").resize((width, height))],
+                                   size=(width, height))[0]
         self.usage_base_img = ImageTk.PhotoImage(base_img)
         self.usage_canvas = tk.Canvas(self.root, width=width, height=height, bg="black", highlightthickness=0)
         screen_height = self.root.winfo_screenheight()
@@ -316,7 +754,13 @@ class JarvisGUI:
         self.ip_img = self.pre_render_text(f"{ip}")
         self.ip_img_id = self.usage_canvas.create_image(310, 155, anchor="center", image=self.ip_img)
 
-        self.update_usage()
+        # Sparklines under each reading, fed from the background sampler's history
+        self.sparklines = {}
+        for name, (x0, x1, bottom) in {"cpu": (80, 160, 95), "disk_io": (235, 315, 95), "ram": (75, 155, 175)}.items():
+            item = self.usage_canvas.create_line(x0, bottom, x1, bottom, fill="#00bfff", width=1)
+            self.sparklines[name] = (item, x0, x1, bottom)
+
+        self.scheduler.add("usage", 1000, self.update_usage, visible=self.home_visible)
 
     def get_ssid(self):
         try:
@@ -334,16 +778,38 @@ class JarvisGUI:
         except:
             return "N/A"
 
-    def update_usage(self):
-        cpu = int(psutil.cpu_percent())
-        ram = int(psutil.virtual_memory().percent)
-        disk = int(psutil.disk_usage('/').percent)
-
-        self.usage_canvas.itemconfigure(self.cpu_img_id, image=self.number_images[cpu])
-        self.usage_canvas.itemconfigure(self.disk_img_id, image=self.number_images[disk])
-        self.usage_canvas.itemconfigure(self.ram_img_id, image=self.number_images[ram])
+    def load_sampler(self):
+        from Backend.SystemMonitor import GetSampler
+        self.sampler = self.scheduler.sampler = GetSampler()
 
-        self.root.after(1000, self.update_usage)
+    def update_usage(self):
+        # No syscalls here: the sampler thread already collected everything
+        if self.sampler is None:
+            return
+        latest = self.sampler.latest()
+        if latest:
+            cpu = min(100, int(latest["cpu"]))
+            ram = min(100, int(latest["ram"]))
+            disk = min(100, int(latest["disk"]))
+
+            self.usage_canvas.itemconfigure(self.cpu_img_id, image=self.number_images[cpu])
+            self.usage_canvas.itemconfigure(self.disk_img_id, image=self.number_images[disk])
+            self.usage_canvas.itemconfigure(self.ram_img_id, image=self.number_images[ram])
+
+            io = self.sampler.history("disk_read", SPARKLINE_SECONDS) + self.sampler.history("disk_write", SPARKLINE_SECONDS)
+            self.draw_sparkline("cpu", self.sampler.history("cpu", SPARKLINE_SECONDS), 100)
+            self.draw_sparkline("ram", self.sampler.history("ram", SPARKLINE_SECONDS), 100)
+            self.draw_sparkline("disk_io", io, max(float(io.max()) if len(io) else 0.0, 1.0))
+
+    def draw_sparkline(self, name, values, scale, height=16):
+        if len(values) < 2:
+            return
+        item, x0, x1, bottom = self.sparklines[name]
+        step = (x1 - x0) / (len(values) - 1)
+        points = []
+        for i, v in enumerate(values):
+            points += [x0 + i * step, bottom - min(float(v), scale) / scale * height]
+        self.usage_canvas.coords(item, *points)
 
     # ---------------- IronMan Hologram ----------------
     def create_video_panel(self, width=600, height=320):
@@ -351,10 +817,10 @@ class JarvisGUI:
         self.video_path = os.path.join(base_path, ".", "Graphics", "IronMan.mp4")
         self.video_path = os.path.abspath(self.video_path)
 
-        self.cap = cv2.VideoCapture(self.video_path)
-        if not self.cap.isOpened():
-            print("Error: Cannot open video file:", self.video_path)
-            return
+        # Decoding, colour conversion and scaling happen on the pump's thread
+        self.video_pump = VideoFramePump(self.video_path, (width, height))
+        self.video_photos = []
+        self.video_index = 0
 
         self.video_canvas = tk.Canvas(self.root, width=width, height=height, bg="black", highlightthickness=0)
         screen_width = self.root.winfo_screenwidth()
@@ -365,27 +831,43 @@ class JarvisGUI:
         self.video_img = ImageTk.PhotoImage(Image.new("RGB", (width, height)))
         self.video_img_id = self.video_canvas.create_image(0, 0, anchor="nw", image=self.video_img)
 
+        # Pause the decoder too while the window is iconified
+        self.scheduler.on_pause.append(self.video_pump.pause)
+        self.scheduler.on_resume.append(self.video_pump.resume)
+
         # Delay update to allow canvas to render properly
-        self.root.after(50, self.update_video_frame)
+        self.video_fps = None
+        self.scheduler.add("video", 30, self.update_video_frame, visible=self.home_visible,
+                           adaptive=True, delay_ms=50)
 
     def update_video_frame(self):
-        ret, frame = self.cap.read()
-        if not ret:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = self.cap.read()
-            if not ret:
-                return  # Could not read video
-
-        # Resize to canvas size
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        canvas_width = self.video_canvas.winfo_width()
-        canvas_height = self.video_canvas.winfo_height()
-        frame = cv2.resize(frame, (canvas_width, canvas_height))
-
-        self.video_img = ImageTk.PhotoImage(Image.fromarray(frame))
-        self.video_canvas.itemconfigure(self.video_img_id, image=self.video_img)
-
-        self.root.after(30, self.update_video_frame)
+        pump = self.video_pump
+        if pump.failed:
+            self.scheduler.remove("video")  # Could not read video
+            return
+        if pump.opened.is_set() and self.video_fps != pump.fps:
+            self.video_fps = pump.fps
+            self.scheduler.set_interval("video", max(15, int(1000 / pump.fps)))
+
+        if pump.cache_complete:
+            # Whole clip is pre-scaled: build each PhotoImage once, then reuse
+            if not self.video_photos:
+                self.video_photos = [None] * len(pump.cache)
+            photo = self.video_photos[self.video_index]
+            if photo is None:
+                photo = self.video_photos[self.video_index] = ImageTk.PhotoImage(pump.cache[self.video_index])
+                pump.cache[self.video_index] = None
+            self.video_index = (self.video_index + 1) % len(self.video_photos)
+            self.video_img = photo
+            self.video_canvas.itemconfigure(self.video_img_id, image=self.video_img)
+        else:
+            try:
+                image = pump.ready.get_nowait()
+            except queue.Empty:
+                image = None
+            if image is not None:
+                self.video_img = ImageTk.PhotoImage(image)
+                self.video_canvas.itemconfigure(self.video_img_id, image=self.video_img)
 
 def GraphicalUserInterface():
     root = tk.Tk()
@@ -0,0 +1,214 @@
+import tkinter as tk
+from PIL import Image, ImageTk
+import os
+import glob
+import hashlib
+import queue
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# ---------------- Config ----------------
+THUMB_SIZE = (160, 160)
+CELL_PAD = 12
+THUMB_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+PHOTO_CACHE = 256   # decoded thumbnails kept around for scrolling back
+
+def _make_thumbnail(src, dest, size):
+    """Runs in a worker process: decode src at reduced size and save a thumbnail."""
+    with Image.open(src) as im:
+        im.draft("RGB", size)  # lets JPEG decode at a fraction of full size
+        im = im.convert("RGBA")
+        im.thumbnail(size)
+        tmp = dest + ".tmp"
+        im.save(tmp, "PNG")
+    os.replace(tmp, dest)
+    return dest
+
+# ---------------- Thumbnail Cache ----------------
+class ThumbnailCache:
+    """On-disk thumbnails generated in a process pool.
+
+    Keyed by source path, mtime, size and thumbnail size. Finished thumbnails
+    are queued for the Tk thread to pick up with drain().
+    """
+
+    def __init__(self, cache_dir, size=THUMB_SIZE, workers=THUMB_WORKERS):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.workers = workers
+        self.pool = None
+        self.pending = set()
+        self.done = queue.Queue()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def thumb_path(self, src):
+        st = os.stat(src)
+        key = f"{os.path.abspath(src)}|{st.st_mtime_ns}|{st.st_size}|{self.size}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".png")
+
+    def get(self, src):
+        """Cached thumbnail path, or None (and a background request) if missing."""
+        try:
+            dest = self.thumb_path(src)
+        except FileNotFoundError:
+            return None
+        if os.path.exists(dest):
+            return dest
+        if src not in self.pending:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            self.pending.add(src)
+            future = self.pool.submit(_make_thumbnail, src, dest, self.size)
+            future.add_done_callback(lambda f, src=src: self.done.put((src, f)))
+        return None
+
+    def drain(self):
+        """(src, thumb path or None) for every thumbnail finished since last call."""
+        out = []
+        while True:
+            try:
+                src, future = self.done.get_nowait()
+            except queue.Empty:
+                return out
+            self.pending.discard(src)
+            try:
+                out.append((src, future.result()))
+            except Exception as e:
+                print(f"Thumbnail failed for {src}: {e}")
+                out.append((src, None))
+
+    def shutdown(self):
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+# ---------------- Gallery Panel ----------------
+class GalleryPanel:
+    """Virtualized grid of generated images.
+
+    Only rows inside the viewport get canvas items and PhotoImages; thumbnails
+    are requested as their cells scroll into view.
+    """
+
+    def __init__(self, parent, images, thumbs, on_open, width=1000, height=560):
+        self.images = images          # list of (label, path), newest first
+        self.thumbs = thumbs
+        self.on_open = on_open
+        self.width = width
+        self.height = height
+        self.cell_w = THUMB_SIZE[0] + CELL_PAD
+        self.cell_h = THUMB_SIZE[1] + CELL_PAD
+        self.columns = max(1, width // self.cell_w)
+        self.rows = (len(images) + self.columns - 1) // self.columns
+        self.items = {}               # index -> canvas item id
+        self.photos = OrderedDict()   # path -> PhotoImage
+
+        self.canvas = tk.Canvas(parent, bg="black", highlightthickness=0, width=width, height=height)
+        self.scrollbar = tk.Scrollbar(parent, orient="vertical", command=self._yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set,
+                              scrollregion=(0, 0, width, max(height, self.rows * self.cell_h)))
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
+        self.canvas.bind("<Leave>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+        self.canvas.bind("<Button-4>", lambda e: self._yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self._yview("scroll", 1, "units"))
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.configure(yscrollincrement=self.cell_h // 2)
+
+        if not images:
+            self.canvas.create_text(width // 2, height // 2, text="No generated images yet",
+                                    fill="white", font=("Consolas", 14))
+
+    def place(self, **kwargs):
+        self.canvas.place(**kwargs)
+        self.canvas.update_idletasks()
+        x = self.canvas.winfo_x() + self.width
+        self.scrollbar.place(x=x, y=self.canvas.winfo_y(), height=self.height)
+        self.refresh()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        self._yview("scroll", int(-1 * (event.delta / 120)), "units")
+
+    def _on_click(self, event):
+        y = self.canvas.canvasy(event.y)
+        col, row = int(event.x // self.cell_w), int(y // self.cell_h)
+        index = row * self.columns + col
+        if col < self.columns and 0 <= index < len(self.images):
+            self.on_open(self.images[index][1])
+
+    def visible_range(self):
+        top = self.canvas.canvasy(0)
+        first = max(0, int(top // self.cell_h) - 1)
+        last = min(self.rows, int((top + self.height) // self.cell_h) + 2)
+        return first * self.columns, min(len(self.images), last * self.columns)
+
+    def refresh(self):
+        """Create items for cells in view, drop the rest."""
+        start, end = self.visible_range()
+        for index in [i for i in self.items if not start <= i < end]:
+            self.canvas.delete(self.items.pop(index))
+        for index in range(start, end):
+            if index not in self.items:
+                row, col = divmod(index, self.columns)
+                x = col * self.cell_w + self.cell_w // 2
+                y = row * self.cell_h + self.cell_h // 2
+                self.items[index] = self.canvas.create_image(x, y, anchor="center")
+                self._show(index)
+
+    def _show(self, index):
+        path = self.images[index][1]
+        photo = self.photos.get(path)
+        if photo is None:
+            thumb = self.thumbs.get(path)
+            if thumb is None:
+                return  # generated in the background; poll() fills it in
+            photo = self._load(path, thumb)
+            if photo is None:
+                return
+        else:
+            self.photos.move_to_end(path)
+        self.canvas.itemconfigure(self.items[index], image=photo)
+
+    def _load(self, path, thumb):
+        try:
+            photo = ImageTk.PhotoImage(Image.open(thumb))
+        except Exception as e:
+            print(f"Could not load thumbnail {thumb}: {e}")
+            return None
+        self.photos[path] = photo
+        while len(self.photos) > PHOTO_CACHE:
+            self.photos.popitem(last=False)
+        return photo
+
+    def poll(self):
+        """Pick up thumbnails finished by the pool (call from the Tk thread)."""
+        finished = {src for src, thumb in self.thumbs.drain() if thumb}
+        if not finished:
+            return
+        for index, item in self.items.items():
+            if self.images[index][1] in finished:
+                self._show(index)
+
+    def destroy(self):
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.destroy()
+        self.scrollbar.destroy()
+
+def ListGeneratedImages(data_dir="Data"):
+    """(label, path) for images in the image store plus legacy Data/*.png files."""
+    images, seen = [], set()
+    try:
+        from Backend.ImageStore import GetImageStore
+        for prompt, path, _ in GetImageStore().all_images():
+            if path not in seen and os.path.exists(path):
+                seen.add(path)
+                images.append((prompt, path))
+    except Exception as e:
+        print(f"Image store unavailable: {e}")
+    legacy = sorted(glob.glob(os.path.join(data_dir, "*.png")), key=os.path.getmtime, reverse=True)
+    images += [(os.path.basename(p), p) for p in legacy if p not in seen]
+    return images
@@ -9,22 +9,32 @@ from Frontend.GUI import (
     GetMicrophoneStatus,
     GetAssistantStatus,
 )
-from Backend.Model import FirstLayerDMM
-from Backend.RealtimeSearchEngine import RealtimeSearchEngine
-from Backend.Automation import Automation
-from Backend.SpeechToText import SpeechRecognition
-from Backend.Chatbot import ChatBot
-from Backend.TextToSpeech import TextToSpeech
+from Backend.Loader import Lazy, Load, Warm, StartupProfile
+from Backend import ChatLog
 from dotenv import dotenv_values
 from asyncio import run
-from time import sleep
-import subprocess
+from time import sleep, perf_counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 import threading
+import queue
 import json
 import os
-import atexit
+import re
+import sys
 from typing import List
 
+# Heavy backends (cohere, groq, selenium, pygame, PyGithub, ...) are imported on
+# first use through the loader registry and warmed in the background at startup.
+FirstLayerDMM = Lazy("model")
+FastPathDMM = Lazy("fastpath")
+RealtimeSearchEngine = Lazy("realtime")
+Automation = Lazy("automation")
+SpeechRecognition = Lazy("stt")
+ChatBot = Lazy("chatbot")
+TextToSpeech = Lazy("tts")
+SystemStatusReport = Lazy("sysmon")
+ResumeWhatsAppOutbox = Lazy("whatsapp")
+
 # -------------------------
 # Env & Defaults
 # -------------------------
@@ -36,14 +46,6 @@ Assistantname = env_vars.get("Assistantname", "Assistant")
 DefaultMessage = f""" {Username}: Hello {Assistantname}, How are you?
 {Assistantname}: Welcome {Username}. I am doing well. How may I help you? """
 
-functions = ["open", "close", "play", "system", "content","google search",
-             "youtube search", "tired", "whatsapp", "github create ",
-             "github create private ", "github delete ", "github list", 
-             "github find ", "github open ", "github clone ", "github commit ",
-             "github push ", "github pull ", "github branch create ",
-             "github branch checkout ", "github search repo ", "github search user "
-]
-
 # -------------------------
 # Helpers: I/O caching & status
 # -------------------------
@@ -74,36 +76,27 @@ def write_if_changed(filepath: str, new_content: str) -> None:
         f.write(new_content)
 
 # -------------------------
-# Subprocess lifecycle
+# Image generation (in-process job queue)
 # -------------------------
 
-subprocess_list: List[subprocess.Popen] = []
-
-def CleanupSubprocesses():
-    # Terminate any still-running child processes on exit
-    for proc in list(subprocess_list):
-        try:
-            if proc.poll() is None:
-                proc.terminate()
-        except Exception:
-            pass
-
-def spawn_process(cmd: List[str]) -> subprocess.Popen:
-    """Spawn a process and keep the list pruned of finished procs."""
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.PIPE)
-    subprocess_list.append(proc)
-    # Prune finished
-    alive = []
-    for p in subprocess_list:
-        try:
-            if p.poll() is None:
-                alive.append(p)
-        except Exception:
-            pass
-    subprocess_list[:] = alive
-    return proc
-
-atexit.register(CleanupSubprocesses)
+GetImageQueue = Lazy("images")
+ShowImage = Lazy("showimage")
+_image_listener_added = False
+
+def OnImageJobEvent(job) -> None:
+    """Surface image job progress in the GUI status line."""
+    if job.status == "running":
+        SafeSetAssistantStatus(f"Generating image {job.completed}/{job.n}...")
+    elif job.status == "failed":
+        print(f"Image generation failed for {job.prompt!r}: {job.error}")
+
+def SubmitImageJob(prompt: str, reuse: bool = False):
+    global _image_listener_added
+    queue = GetImageQueue()
+    if not _image_listener_added:
+        queue.add_listener(OnImageJobEvent)
+        _image_listener_added = True
+    return queue.submit(prompt, reuse=reuse)
 
 # -------------------------
 # Chat log utils (with caching)
@@ -161,14 +154,140 @@ def ShowChatOnGUI() -> None:
 # Speech & TTS utilities
 # -------------------------
 
-def speak_async(text: str) -> None:
-    threading.Thread(target=_safe_tts, args=(text,), daemon=True).start()
+UTTERANCE_BACKLOG = 3      # queued queries while a turn is still running; oldest dropped
+BARGE_IN_MIN_WORDS = 2     # interim words needed to cut off speech (ignores coughs and echo blips)
+# The mic stays open during playback and pygame audio is not echo-cancelled,
+# so the recognizer hears our own answers. Those must not barge in or become queries.
+ECHO_GRACE = 0.8           # seconds after an answer starts in which nothing barges in
+ECHO_MATCH = 0.6           # share of heard words found in the spoken answer that marks it as echo
+ECHO_TAIL = 1.5            # the recognizer lags playback; keep matching this long after an answer ends
+
+_spoken_word = re.compile(r"[a-z0-9']+")
+
+class Speaker:
+    """Plays answers one after another on its own thread; stop() cuts the
+    current answer short and drops anything still queued (barge-in).
+
+    Each stop() starts a new generation: answers queued for an earlier one
+    (the rest of an interrupted turn) are dropped instead of played.
+    """
+
+    def __init__(self):
+        self.queue: "queue.Queue[tuple[int, str]]" = queue.Queue()
+        self.interrupt = threading.Event()
+        self.generation = 0
+        self.busy = False
+        self.speaking = ""          # exact text of the current (or last) playback
+        self.started = self.ended = float("-inf")   # playback start / end, not synthesis
+        threading.Thread(target=self._run, name="Speaker", daemon=True).start()
+
+    def say(self, text: str, generation: int | None = None) -> None:
+        if generation is not None and generation != self.generation:
+            return  # its turn was interrupted
+        self.queue.put((self.generation if generation is None else generation, text))
+
+    def stop(self) -> None:
+        self.generation += 1
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+        self.interrupt.set()
+
+    def is_echo(self, heard: str) -> bool:
+        """Whether heard is probably our own answer picked up by the mic."""
+        now = perf_counter()
+        if not self.busy and now - self.ended > ECHO_TAIL:
+            return False
+        if self.busy and now - self.started < ECHO_GRACE:
+            return True
+        words = _spoken_word.findall(heard.lower())
+        if not words:
+            return True
+        spoken = set(_spoken_word.findall(self.speaking.lower()))
+        return sum(w in spoken for w in words) / len(words) >= ECHO_MATCH
+
+    def _playing(self, spoken: str) -> None:
+        # TextToSpeech may shorten long answers and add a pointer to the chat screen; gate echoes on what plays
+        self.speaking, self.started = spoken, perf_counter()
+
+    def _run(self) -> None:
+        while True:
+            generation, text = self.queue.get()
+            if generation != self.generation:
+                continue
+            self.interrupt.clear()
+            self.busy = True
+            try:
+                TextToSpeech(text, stop_func=lambda r=None: not self.interrupt.is_set(),
+                             on_start=self._playing)
+            except Exception as e:
+                print(f"TextToSpeech failed: {e}")
+            finally:
+                self.ended = perf_counter()
+                self.busy = self.queue.qsize() > 0
+
+_speaker = Speaker()
+_utterances: "queue.Queue[str]" = queue.Queue(maxsize=UTTERANCE_BACKLOG)
+_turn_active = threading.Event()
 
-def _safe_tts(text: str) -> None:
+def speak_async(text: str, generation: int | None = None) -> None:
+    _speaker.say(text, generation)
+
+def EnqueueUtterance(query: str) -> None:
+    """Hand a finished query to the worker; when the backlog is full the oldest waiting query is dropped."""
+    while True:
+        try:
+            _utterances.put_nowait(query)
+            return
+        except queue.Full:
+            try:
+                dropped = _utterances.get_nowait()
+                print(f"Utterance backlog full, dropping: {dropped!r}")
+            except queue.Empty:
+                pass
+
+# -------------------------
+# Streaming partial transcripts
+# -------------------------
+
+# (decision key, decision) classified from the latest partial transcript
+_prepared: tuple[str, List[str]] | None = None
+_prepared_lock = threading.Lock()
+
+def _decision_key(text: str) -> str:
+    # Partials are raw, the final query went through QueryModifier; compare without case or end punctuation
+    return text.strip().lower().rstrip(".!?").strip()
+
+def PrepareFromPartial(text: str) -> None:
+    """Show the interim transcript and classify obvious commands early.
+
+    Runs on the recognizer thread, so it only does local work. A decision
+    prepared here is reused by MainExecution when the final transcript says
+    the same thing, which skips classifying it a second time.
+    """
+    global _prepared
+    # Barge-in: the user talking over an answer stops it
+    if _speaker.busy and len(text.split()) >= BARGE_IN_MIN_WORDS and not _speaker.is_echo(text):
+        _speaker.stop()
+    ShowTextToScreen(f"{Username}: {text}...")
     try:
-        TextToSpeech(text)
-    except Exception as e:
-        print(f"TextToSpeech failed: {e}")
+        # FirstLayerDMM only goes to the LLM when the local fast path has no answer
+        decision = FirstLayerDMM(text) if FastPathDMM(text) else None
+    except Exception:
+        decision = None
+    with _prepared_lock:
+        _prepared = (_decision_key(text), decision) if decision else None
+
+def TakePreparedDecision(query: str) -> List[str] | None:
+    """The decision prepared from the partial transcript, if it matches the final query."""
+    global _prepared
+    with _prepared_lock:
+        prepared, _prepared = _prepared, None
+    if prepared and prepared[0] == _decision_key(query):
+        return prepared[1]
+    return None
 
 # -------------------------
 # Initial setup
@@ -185,108 +304,176 @@ def InitialExecution() -> None:
 # Main execution logic
 # -------------------------
 
-def MainExecution() -> bool:
+def Listen() -> str:
     try:
-        TaskExecution = False
-        ImageExecution = False
-        ImageGenerationQuery = ""
+        return SpeechRecognition(on_partial=PrepareFromPartial) or ""
+    except Exception as e:
+        print(f"SpeechRecognition failed: {e}")
+        return ""
+
+TURN_WORKERS = 6       # intents that may run at once, including long jobs still finishing
+ACK_AFTER = 15         # seconds a turn waits in order; slower intents are acknowledged and answered when done
 
-        SafeSetAssistantStatus("Listening...")
+_turn_pool = ThreadPoolExecutor(max_workers=TURN_WORKERS, thread_name_prefix="intent")
+
+# Chat intents return (prompt, answer); _deliver records the pair in the chat
+# log, so concurrent intents of a turn are logged whole and in decision order.
+def _answer_general(query: str) -> tuple[str, str] | str:
+    prompt = QueryModifier(query)
+    try:
+        return prompt, ChatBot(prompt, record=False)
+    except Exception as e:
+        print(f"ChatBot failed: {e}")
+        return "Error generating response."
+
+def _answer_realtime(query: str) -> tuple[str, str] | str:
+    prompt = QueryModifier(query)
+    try:
+        # RealtimeSearchEngine is a coroutine function; each intent thread runs its own loop
+        return prompt, run(RealtimeSearchEngine(prompt, record=False))
+    except Exception as e:
+        print(f"RealtimeSearchEngine failed: {e}")
+        return "Error fetching realtime response."
+
+def _run_automation(commands: List[str]) -> str | None:
+    Results = run(Automation(commands))
+    Failed = [r.command for r in Results if not r.ok]
+    return f"Could not complete: {', '.join(Failed)}" if Failed else None
+
+def _show_image(query: str) -> str | None:
+    # Previously generated images are re-opened from the local image store
+    return None if ShowImage(query) else "Sorry Sir, I could not find that image."
+
+def _submit_image(prompt: str) -> None:
+    # "generate image <prompt> again" repeats the stored variants; anything else gets new ones
+    repeat = prompt.lower().rstrip(".!?").endswith(" again")
+    if repeat:
+        prompt = prompt.rstrip(".!? ")[:-len(" again")].strip()
+    SubmitImageJob(prompt, reuse=repeat)
+
+def PlanTurn(Decision: List[str]) -> tuple[list, bool]:
+    """Split a decision into independent intents: ([(label, func, arg)], exit requested)."""
+    intents, commands, exit_requested, image_planned = [], [], False, False
+    automation_at = None
+    try:
+        dispatcher = Load("commands")
+    except Exception as e:
+        print(f"Command dispatcher unavailable: {e}")
+        dispatcher = None
+
+    for q in Decision:
+        if q.startswith("system status"):
+            # "How's my system doing" is answered locally from the sampler history
+            intents.append(("system status", lambda _: SystemStatusReport(), None))
+        elif q.startswith("show image"):
+            intents.append((q, _show_image, q.removeprefix("show image").strip()))
+        elif q.startswith("general"):
+            intents.append((q, _answer_general, q.removeprefix("general").strip()))
+        elif q.startswith("realtime"):
+            intents.append((q, _answer_realtime, q.removeprefix("realtime").strip()))
+        elif q.startswith("generate image") and not image_planned:
+            image_planned = True
+            intents.append((q, _submit_image, q.removeprefix("generate image").strip() or q))
+        elif q.startswith("exit"):
+            exit_requested = True
+        elif dispatcher is not None and dispatcher.match(q):
+            if not commands:
+                # All automation runs as one intent, at the position of its first command
+                automation_at = len(intents)
+                intents.append(("automation", _run_automation, commands))
+            commands.append(q)
+    if automation_at is not None:
+        intents[automation_at] = (", ".join(commands), _run_automation, commands)
+    return intents, exit_requested
+
+def _timed(func, arg):
+    start = perf_counter()
+    try:
+        return func(arg), None, perf_counter() - start
+    except Exception as e:
+        return None, e, perf_counter() - start
+
+def _deliver(label: str, result: tuple, generation: int | None) -> bool:
+    """Log an intent's outcome; show and speak its answer. Returns True if there was one."""
+    Answer, error, latency = result
+    status = "failed" if error else "ok"
+    print(f"{status:>6} {latency * 1000:7.0f} ms  {label}" + (f" ({error})" if error else ""))
+    if isinstance(Answer, tuple):
+        prompt, Answer = Answer
         try:
-            Query = SpeechRecognition()
+            ChatLog.append_pair(prompt, Answer)
         except Exception as e:
-            print(f"SpeechRecognition failed: {e}")
-            Query = ""
+            print(f"Chat log write failed: {e}")
+    if not Answer:
+        return False
+    ShowTextToScreen(f"{Assistantname}: {Answer}")
+    SafeSetAssistantStatus("Answering...")
+    speak_async(Answer, generation)
+    return True
+
+def _deliver_late(label: str, result: tuple) -> None:
+    """Answer for an acknowledged intent; silent successes still get a word."""
+    Answer, error, latency = result
+    if not Answer and not error:
+        result = (f"Sir, {label} is done.", error, latency)
+    _deliver(label, result, None)
+
+def MainExecution(Query: str | None = None) -> bool:
+    """One turn: every intent starts at once, answers are shown and spoken in decision order.
+
+    Intents still running ACK_AFTER seconds into the turn (a clone, a long
+    content piece) are acknowledged instead; their answer is delivered when
+    they finish, bounded by their handlers' own timeouts.
+    """
+    try:
+        if Query is None:
+            SafeSetAssistantStatus("Listening...")
+            Query = Listen()
 
+        # Answers of this turn are dropped if the user barges in
+        generation = _speaker.generation
         ShowTextToScreen(f"{Username}: {Query}")
         SafeSetAssistantStatus("Thinking...")
         try:
-            Decision = FirstLayerDMM(Query)
+            Decision = TakePreparedDecision(Query) or FirstLayerDMM(Query)
         except Exception as e:
             print(f"FirstLayerDMM failed: {e}")
             Decision = []
 
         print(f"\nDecision: {Decision}\n")
 
-        G = any(i for i in Decision if i.startswith("general"))
-        R = any(i for i in Decision if i.startswith("realtime"))
-
-        Merged_query = " and ".join(
-            [" ".join(i.split()[1:]) for i in Decision if i.startswith("general") or i.startswith("realtime")]
-        )
-
-        for q in Decision:
-            if "generate" in q:
-                ImageGenerationQuery = str(q)
-                ImageExecution = True
-                break
+        intents, exit_requested = PlanTurn(Decision)
+        if any(label.startswith("realtime") for label, _, _ in intents):
+            SafeSetAssistantStatus("Searching...")
+        futures = [(label, _turn_pool.submit(_timed, func, arg)) for label, func, arg in intents]
 
-        # Execute automations (only once per cycle)
-        for q in Decision:
-            if not TaskExecution and any(q.startswith(func) for func in functions):
-                try:
-                    run(Automation(list(Decision)))
-                    TaskExecution = True
-                except Exception as e:
-                    print(f"Automation failed: {e}")
-
-        # Kick off image generation if needed
-        if ImageExecution:
+        answered = acknowledged = False
+        deadline = perf_counter() + ACK_AFTER
+        for label, future in futures:
             try:
-                os.makedirs(os.path.dirname(r"Frontend\Files\ImageGeneration.data"), exist_ok=True)
-                with open(r"Frontend\Files\ImageGeneration.data", "w", encoding="utf-8") as file:
-                    file.write(f"{ImageGenerationQuery},True")
-                spawn_process(['python', r"Backend\ImageGeneration.py"])
-            except Exception as e:
-                print(f"Error starting ImageGeneration.py: {e}")
-
-        # Handle general + realtime answers
-        if (G and R) or R:
-            SafeSetAssistantStatus("Searching...")
+                result = future.result(timeout=max(0.0, deadline - perf_counter()))
+            except FutureTimeout:
+                # Say once that it's underway; the answer follows when it completes
+                if not acknowledged:
+                    ShowTextToScreen(f"{Assistantname}: Working on it, Sir. I will tell you when it is done.")
+                    speak_async("Working on it, Sir. I will tell you when it is done.", generation)
+                    acknowledged = True
+                future.add_done_callback(lambda f, label=label: _deliver_late(label, f.result()))
+                answered = True
+                continue
+            answered = _deliver(label, result, generation) or answered
+
+        if exit_requested:
+            QueryFinal = "Okay, Bye!"
             try:
-                Answer = RealtimeSearchEngine(QueryModifier(Merged_query))
-            except Exception as e:
-                Answer = "Error fetching realtime response."
-                print(f"RealtimeSearchEngine failed: {e}")
+                Answer = ChatBot(QueryModifier(QueryFinal))
+            except Exception:
+                Answer = QueryFinal
             ShowTextToScreen(f"{Assistantname}: {Answer}")
             SafeSetAssistantStatus("Answering...")
             speak_async(Answer)
-            return True
-        else:
-            for q in Decision:
-                QueryFinal = q.replace("general", "").replace("realtime", "")
-                if "general" in q:
-                    SafeSetAssistantStatus("Thinking...")
-                    try:
-                        Answer = ChatBot(QueryModifier(QueryFinal))
-                    except Exception as e:
-                        Answer = "Error generating response."
-                        print(f"ChatBot failed: {e}")
-                    ShowTextToScreen(f"{Assistantname}: {Answer}")
-                    SafeSetAssistantStatus("Answering...")
-                    speak_async(Answer)
-                    return True
-                elif "realtime" in q:
-                    SafeSetAssistantStatus("Searching...")
-                    try:
-                        Answer = RealtimeSearchEngine(QueryModifier(QueryFinal))
-                    except Exception as e:
-                        Answer = "Error fetching realtime response."
-                        print(f"RealtimeSearchEngine failed: {e}")
-                    ShowTextToScreen(f"{Assistantname}: {Answer}")
-                    SafeSetAssistantStatus("Answering...")
-                    speak_async(Answer)
-                    return True
-                elif "exit" in q:
-                    QueryFinal = "Okay, Bye!"
-                    try:
-                        Answer = ChatBot(QueryModifier(QueryFinal))
-                    except Exception:
-                        Answer = QueryFinal
-                    ShowTextToScreen(f"{Assistantname}: {Answer}")
-                    SafeSetAssistantStatus("Answering...")
-                    speak_async(Answer)
-                    os._exit(1)
+            os._exit(1)
+        return answered or bool(intents)
     except Exception as e:
         print(f"Error in MainExecution: {e}")
     return False
@@ -296,6 +483,7 @@ def MainExecution() -> bool:
 # -------------------------
 
 def FirstThread() -> None:
+    """Listener: keeps recognising while earlier turns are still running or speaking."""
     valid_on = {"true", "on", "1"}
     valid_off = {"false", "off", "0"}
 
@@ -304,12 +492,18 @@ def FirstThread() -> None:
             CurrentStatus = GetMicrophoneStatus().lower().strip()
 
             if CurrentStatus in valid_on:
-                MainExecution()
+                if not _turn_active.is_set():
+                    SafeSetAssistantStatus("Listening...")
+                Query = Listen()
+                if Query and _speaker.is_echo(Query):
+                    print(f"Ignoring echo of our own answer: {Query!r}")
+                elif Query:
+                    EnqueueUtterance(Query)
                 # Active polling should be snappy but not hot
-                sleep(0.2)
+                sleep(0.05)
             elif CurrentStatus in valid_off:
                 AIStatus = GetAssistantStatus()
-                if "Available..." not in AIStatus:
+                if not _turn_active.is_set() and "Available..." not in AIStatus:
                     SafeSetAssistantStatus("Available...")
                 # Relax when idle
                 sleep(1.0)
@@ -322,6 +516,16 @@ def FirstThread() -> None:
             print(f"Error in FirstThread: {e}")
             sleep(1.0)  # prevent rapid CPU spin on errors
 
+def WorkerThread() -> None:
+    """Runs queued turns one by one, independent of the listener."""
+    while True:
+        Query = _utterances.get()
+        _turn_active.set()
+        try:
+            MainExecution(Query)
+        finally:
+            _turn_active.clear()
+
 def SecondThread() -> None:
     try:
         GraphicalUserInterface()
@@ -333,8 +537,18 @@ def SecondThread() -> None:
 # -------------------------
 
 if __name__ == "__main__":
+    if "--startup-profile" in sys.argv:
+        StartupProfile()
+        sys.exit(0)
+
     InitialExecution()
 
+    # Warm backends while the GUI draws its first frame
+    Warm(["stt", "model", "tts", "chatbot", "realtime", "automation"])
+    # Messages left unsent by the last run go out without waiting for a new one
+    threading.Thread(target=ResumeWhatsAppOutbox, name="WhatsAppResume", daemon=True).start()
+
     thread1 = threading.Thread(target=FirstThread, daemon=True)
     thread1.start()
+    threading.Thread(target=WorkerThread, daemon=True).start()
     SecondThread()
@@ -0,0 +1,131 @@
+"""GithubGraphQL against a stand-in GraphQL server (httpx.MockTransport).
+
+Needs httpx, python-dotenv and PyGithub (Backend.GithubAsync imports
+Backend.GithubAuto); all three are in requirements.txt.
+Run from the repository root: python -m unittest discover tests
+"""
+import json
+import unittest
+
+import httpx
+
+from Backend.GithubAsync import GithubGraphQL, GraphQLError
+from Backend.GithubRateLimit import RateLimitScheduler, TTLCache
+
+URL = "https://github.test/graphql"
+
+def repo_node(name: str, private: bool = False) -> dict:
+    return {"name": name, "nameWithOwner": f"octo/{name}", "isPrivate": private, "url": f"https://github.test/octo/{name}"}
+
+class StandIn:
+    """Records every request and answers with the next queued (status, payload, headers)."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append(body)
+        status, payload, headers = self.responses.pop(0)
+        return httpx.Response(status, json=payload, headers=headers)
+
+class GithubGraphQLTest(unittest.IsolatedAsyncioTestCase):
+    def client(self, server: StandIn) -> GithubGraphQL:
+        gql = GithubGraphQL(token="test", url=URL,
+                            client=httpx.AsyncClient(transport=httpx.MockTransport(server)))
+        # Fresh limiter and cache, so tests don't share budget or results
+        gql.limiter = RateLimitScheduler()
+        gql.search_cache = TTLCache(metrics=gql.limiter.metrics)
+        self.addAsyncCleanup(gql.aclose)
+        return gql
+
+    async def test_batch_is_one_request_split_by_alias(self):
+        server = StandIn((200, {"data": {
+            "rs0": {"nodes": [repo_node("jarvis"), {}]},
+            "rs1": {"nodes": []},
+            "us0": {"nodes": [{"login": "octo", "url": "https://github.test/octo"}]},
+            "r0": repo_node("dotfiles", private=True),
+        }}, {}))
+        gql = self.client(server)
+
+        result = await gql.batch(repo_searches=[("jarvis", 5), ("nothing", 3)],
+                                 user_searches=[("octo", 1)], repos=[("octo", "dotfiles")])
+
+        self.assertEqual(len(server.requests), 1)
+        sent = server.requests[0]
+        for alias in ("rs0:", "rs1:", "us0:", "r0:"):
+            self.assertIn(alias, sent["query"])
+        self.assertEqual(sent["variables"], {"rq0": "jarvis", "rn0": 5, "rq1": "nothing", "rn1": 3,
+                                             "uq0": "octo", "un0": 1, "ro0": "octo", "rr0": "dotfiles"})
+        self.assertEqual([r.name for r in result["repo_searches"][0]], ["jarvis"])
+        self.assertEqual(result["repo_searches"][1], [])
+        self.assertEqual(result["user_searches"], [[("octo", "https://github.test/octo")]])
+        self.assertTrue(result["repos"][0].private)
+        self.assertEqual(result["repos"][0].full_name, "octo/dotfiles")
+
+    async def test_empty_batch_sends_nothing(self):
+        server = StandIn()
+        gql = self.client(server)
+        self.assertEqual(await gql.batch(), {"repo_searches": [], "user_searches": [], "repos": []})
+        self.assertEqual(server.requests, [])
+
+    async def test_partial_data_leaves_missing_repos_as_none(self):
+        server = StandIn((200, {
+            "data": {"r0": repo_node("jarvis"), "r1": None},
+            "errors": [{"type": "NOT_FOUND", "path": ["r1"], "message": "Could not resolve to a Repository"}],
+        }, {}))
+        gql = self.client(server)
+
+        found = await gql.find_repos(["jarvis", "missing"], owner="octo")
+
+        self.assertEqual(found["jarvis"].name, "jarvis")
+        self.assertIsNone(found["missing"])
+
+    async def test_errors_without_data_raise(self):
+        server = StandIn((200, {"data": None, "errors": [{"message": "Bad credentials"}]}, {}))
+        gql = self.client(server)
+        with self.assertRaisesRegex(GraphQLError, "Bad credentials"):
+            await gql.search_repos("jarvis")
+
+    async def test_errors_raise_unless_partial(self):
+        server = StandIn((200, {"data": {"viewer": None}, "errors": [{"message": "denied"}]}, {}))
+        gql = self.client(server)
+        with self.assertRaises(GraphQLError):
+            await gql.query("query { viewer { login } }")
+
+    async def test_http_error_raises(self):
+        server = StandIn((502, {"message": "bad gateway"}, {}))
+        gql = self.client(server)
+        with self.assertRaises(httpx.HTTPStatusError):
+            await gql.search_users("octo")
+
+    async def test_rate_limited_request_is_retried(self):
+        server = StandIn(
+            (403, {"message": "secondary rate limit"}, {"retry-after": "0"}),
+            (200, {"data": {"rs0": {"nodes": [repo_node("jarvis")]}}},
+             {"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "4999",
+              "x-ratelimit-reset": "9999999999", "x-ratelimit-resource": "graphql"}),
+        )
+        gql = self.client(server)
+
+        repos = await gql.search_repos("jarvis")
+
+        self.assertEqual([r.name for r in repos], ["jarvis"])
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(gql.limiter.metrics["retries"], 1)
+        self.assertEqual(gql.limiter.budgets["graphql"].remaining, 4999)
+
+    async def test_repeated_search_is_served_from_cache(self):
+        server = StandIn((200, {"data": {"rs0": {"nodes": [repo_node("jarvis")]}}}, {}))
+        gql = self.client(server)
+
+        first = await gql.search_repos("Jarvis")
+        second = await gql.search_repos("  jarvis ")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(gql.limiter.metrics["cache_hits"], 1)
+
+if __name__ == "__main__":
+    unittest.main()